@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Shifa AlHind - Pipeline Benchmark Suite
+Times and memory-profiles every generator stage at 1×, 10× and 100× the
+catalog, writes machine-readable results and flags regressions against a
+stored baseline
+"""
+
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+from catalog import GCC_STRUCTURE
+from json_io import dump, load
+from pipeline import load_script
+
+RESULTS_FILE = "benchmark_results.json"
+BASELINE_FILE = "benchmark_baseline.json"
+DEFAULT_SCALES = [1, 10, 100]
+
+# A stage regresses when it is this much slower / hungrier than the baseline...
+DEFAULT_TOLERANCE = 0.20
+# ...and the slowdown is above timer noise
+MIN_REGRESSION_SECONDS = 0.05
+
+
+def scaled_structure(scale):
+    """GCC_STRUCTURE with every city repeated `scale` times under suffixed slugs"""
+    structure = []
+    for country in GCC_STRUCTURE:
+        cities = list(country["cities"])
+        for copy in range(2, scale + 1):
+            for city in country["cities"]:
+                cities.append({
+                    **city,
+                    "slug": f"{city['slug']}-{copy}",
+                    "name": f"{city['name']} {copy}",
+                    "name_ar": f"{city['name_ar']} {copy}",
+                })
+        structure.append({**country, "cities": cities})
+    return structure
+
+
+class Pipeline:
+    """The generator modules plus a manifest built at one catalog scale"""
+
+    def __init__(self, scale, workdir):
+        self.full = load_script("full-content-generator.py")
+        self.articles = load_script("human-content-generator.py")
+        self.landing = load_script("treatment-city-content-generator.py")
+        self.interlinks = load_script("generate-interlinks.py")
+        self.sitemaps = load_script("generate-sitemaps.py")
+
+        self.full.GCC_STRUCTURE = scaled_structure(scale)
+        self.pages = self.full.generate_full_manifest()
+        self.workdir = workdir
+
+    def of_type(self, page_type):
+        return [p for p in self.pages if p["page_type"] == page_type]
+
+
+def stage_manifest(pipeline):
+    return len(pipeline.full.generate_full_manifest())
+
+
+def stage_keyword_matrix(pipeline):
+    return len(pipeline.full.generate_keyword_matrix())
+
+
+def stage_articles(pipeline):
+    articles = pipeline.of_type("article")
+    variants, _ = pipeline.articles.allocate_article_variants(articles)
+    for page in articles:
+        pipeline.articles.generate_full_article_content(page, variants[page["url"]])
+    return len(articles)
+
+
+def stage_landing_pages(pipeline):
+    treatments = pipeline.of_type("treatment_landing")
+    cities = pipeline.of_type("city_landing")
+    for page in treatments:
+        pipeline.landing.generate_treatment_page_content(page)
+    for page in cities:
+        pipeline.landing.generate_city_page_content(page)
+    return len(treatments) + len(cities)
+
+
+def stage_interlinks(pipeline):
+    return len(pipeline.interlinks.generate_interlinking_structure(pipeline.pages))
+
+
+def stage_sitemap(pipeline):
+    pipeline.sitemaps.generate_sitemap(pipeline.pages, os.path.join(pipeline.workdir, "sitemap"))
+    return len(pipeline.pages)
+
+
+STAGES = [
+    ("generate_full_manifest", stage_manifest),
+    ("generate_keyword_matrix", stage_keyword_matrix),
+    ("generate_full_article_content", stage_articles),
+    ("generate_landing_page_content", stage_landing_pages),
+    ("generate_interlinking_structure", stage_interlinks),
+    ("generate_sitemap", stage_sitemap),
+]
+
+
+def measure(stage, pipeline, repeat=1, memory=True):
+    """Best-of-`repeat` wall/CPU time, then one tracemalloc pass for peak memory"""
+    best_wall = best_cpu = None
+    for _ in range(repeat):
+        wall, cpu = time.perf_counter(), time.process_time()
+        pages = stage(pipeline)
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+        if best_wall is None or wall < best_wall:
+            best_wall, best_cpu = wall, cpu
+
+    peak_kib = None
+    if memory:
+        tracemalloc.start()
+        stage(pipeline)
+        peak_kib = tracemalloc.get_traced_memory()[1] // 1024
+        tracemalloc.stop()
+
+    return {
+        "pages": pages,
+        "wall_seconds": round(best_wall, 4),
+        "cpu_seconds": round(best_cpu, 4),
+        "pages_per_sec": round(pages / best_wall, 1) if best_wall else None,
+        "peak_kib": peak_kib,
+    }
+
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """Annotate each result with its baseline ratios; returns the regressed ones"""
+    previous = {(r["stage"], r["scale"]): r for r in baseline.get("results", [])}
+    regressions = []
+
+    for result in results:
+        base = previous.get((result["stage"], result["scale"]))
+        if not base:
+            continue
+
+        flags = []
+        if base["wall_seconds"]:
+            result["wall_ratio"] = round(result["wall_seconds"] / base["wall_seconds"], 2)
+            if (result["wall_ratio"] > 1 + tolerance
+                    and result["wall_seconds"] - base["wall_seconds"] > MIN_REGRESSION_SECONDS):
+                flags.append("time")
+        if base.get("peak_kib") and result.get("peak_kib") is not None:
+            result["memory_ratio"] = round(result["peak_kib"] / base["peak_kib"], 2)
+            if result["memory_ratio"] > 1 + tolerance:
+                flags.append("memory")
+
+        if flags:
+            result["regression"] = flags
+            regressions.append(result)
+
+    return regressions
+
+
+def get_arg(name, default):
+    """Read `--name VALUE` from the command line"""
+    if name in sys.argv:
+        return sys.argv[sys.argv.index(name) + 1]
+    return default
+
+
+def main():
+    print("=" * 70)
+    print("Shifa AlHind - Pipeline Benchmark Suite")
+    print("=" * 70)
+
+    scales = [int(s) for s in get_arg("--scales", ",".join(map(str, DEFAULT_SCALES))).split(",")]
+    repeat = int(get_arg("--repeat", 1))
+    tolerance = float(get_arg("--tolerance", DEFAULT_TOLERANCE))
+    memory = "--no-memory" not in sys.argv
+    only = get_arg("--stages", None)
+    stages = [(name, fn) for name, fn in STAGES if not only or name in only.split(",")]
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for scale in scales:
+            pipeline = Pipeline(scale, workdir)
+            print(f"\n⏳ Scale {scale}× ({len(pipeline.pages):,} pages)")
+
+            for name, stage in stages:
+                result = {"stage": name, "scale": scale, **measure(stage, pipeline, repeat, memory)}
+                results.append(result)
+                peak = f"{result['peak_kib']:>9,} KiB peak" if result["peak_kib"] is not None else ""
+                print(f"   {name:<34} {result['wall_seconds']:>8.3f}s  "
+                      f"{result['pages_per_sec'] or 0:>10,.0f} pages/s  {peak}")
+
+    regressions = []
+    if os.path.exists(BASELINE_FILE):
+        regressions = compare(results, load(BASELINE_FILE), tolerance)
+
+    report = {
+        "generated_at": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "tolerance": tolerance,
+        "results": results,
+    }
+    dump(report, RESULTS_FILE, pretty=True)
+    print(f"\n✅ Saved: {RESULTS_FILE}")
+
+    if "--save-baseline" in sys.argv:
+        dump(report, BASELINE_FILE, pretty=True)
+        print(f"✅ Saved: {BASELINE_FILE}")
+    elif not os.path.exists(BASELINE_FILE):
+        print(f"   No {BASELINE_FILE} yet; run with --save-baseline to store one")
+
+    if regressions:
+        print(f"\n⚠️  {len(regressions)} regression(s) beyond {tolerance:.0%} of baseline:")
+        for r in regressions:
+            print(f"   {r['stage']} @ {r['scale']}×: {', '.join(r['regression'])} "
+                  f"(time ×{r.get('wall_ratio', '-')}, memory ×{r.get('memory_ratio', '-')})")
+        sys.exit(1)
+    elif os.path.exists(BASELINE_FILE) and "--save-baseline" not in sys.argv:
+        print("\n🎉 No regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
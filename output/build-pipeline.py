@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Shifa AlHind - Build Pipeline
+Runs manifest → keyword matrix → page bodies → interlinks → sitemaps →
+exports → gzip siblings in one process, re-running only the stages whose inputs changed
+"""
+
+import os
+import sys
+
+from build_cache import BuildCache
+from content_db import DEFAULT_DB, export_content_db
+from content_shards import DEFAULT_SHARD_DIR, write_content_shards
+from json_io import NESTED_JSON_LD, PRETTY, dump, load
+from compact_manifest import write_compact_manifest
+from manifest_io import MANIFEST_COMPACT, MANIFEST_CURRENT, MANIFEST_JSON, load_manifest, mark_current
+from pipeline import Pipeline, Stage, load_script, local_sources
+from precompress import MANIFEST_FILE as PRECOMPRESS_MANIFEST, load_previous, precompress, write_manifest
+from reproducible import build_options
+
+# Data read at import time; code sources come from local_sources()
+CATALOG_DATA = ["catalog.json"]
+CONTENT_FILES = [
+    "content_cities_full.json",
+    "content_treatments_full.json",
+    "content_articles_full.json",
+]
+INTERLINKS_FILE = "interlink_structure.json"
+
+# Part of the manifest's key (and so of every stage after it): switching the
+# output format or the build mode (salt, pinned clock) rebuilds all artefacts
+JSON_OPTIONS = {"pretty": PRETTY, "nested_json_ld": NESTED_JSON_LD}
+
+
+def get_arg(name, default):
+    """Read `--name VALUE` from the command line"""
+    if name in sys.argv:
+        return sys.argv[sys.argv.index(name) + 1]
+    return default
+
+
+def build_stages(workers=1, compress=False):
+    full = load_script("full-content-generator.py")
+    articles = load_script("human-content-generator.py")
+    landing = load_script("treatment-city-content-generator.py")
+    interlinks = load_script("generate-interlinks.py")
+    sitemaps = load_script("generate-sitemaps.py")
+
+    def run_manifest(inputs, progress):
+        pages = full.generate_full_manifest()
+        dump(pages, MANIFEST_JSON)
+        # Compact copy for ad-hoc runs of the single-stage scripts, which read the form marked current
+        write_compact_manifest(pages, MANIFEST_COMPACT)
+        mark_current(MANIFEST_COMPACT)
+        progress.advance(len(pages))
+        return pages
+
+    def run_keyword_matrix(inputs, progress):
+        keywords = full.generate_keyword_matrix()
+        full.write_keyword_matrix(keywords)
+        progress.advance(len(keywords))
+
+    def run_bodies(inputs, progress):
+        # Both generators read the manifest lazily; hand them the one in memory
+        articles.manifest = landing.manifest = inputs["manifest"]
+        pages = articles.generate_all_articles(workers) + landing.main()
+        progress.advance(len(pages))
+        return pages
+
+    def load_bodies():
+        return [page for filename in CONTENT_FILES if os.path.exists(filename) for page in load(filename)]
+
+    def run_interlinks(inputs, progress):
+        structure = interlinks.generate_interlinking_structure(inputs["manifest"])
+        dump(structure, INTERLINKS_FILE)
+        progress.advance(len(structure))
+        return structure
+
+    def run_sitemaps(inputs, progress):
+        writers, master = sitemaps.write_sitemaps(inputs["manifest"], compress=compress)
+        shards = [*(shard for writer in writers.values() for shard in writer.shards), *master.shards]
+        progress.advance(master.url_count)
+        progress.add_output(*shards)
+        return [*shards, sitemaps.SITEMAP_INDEX]
+
+    def run_exports(inputs, progress):
+        counts = export_content_db(inputs["manifest"], [inputs["bodies"]], inputs["interlinks"], DEFAULT_DB)
+        print(f"✅ Saved: {DEFAULT_DB} ({counts['pages']} pages, {counts['with_content']} with full content)")
+        cache = BuildCache()
+        count = write_content_shards(inputs["bodies"], DEFAULT_SHARD_DIR, workers, cache)
+        progress.add_cache(cache.hits, cache.misses)
+        print(f"✅ Sharded: {count} pages + pre-rendered HTML → {DEFAULT_SHARD_DIR}/ "
+              f"({cache.hits} fragments reused, {cache.misses} rendered)")
+        progress.advance(counts["pages"])
+
+    def run_precompress(inputs, progress):
+        # Only what this build published; --gzip sitemap shards are already .gz and are skipped
+        paths = [*inputs["sitemaps"], INTERLINKS_FILE, *CONTENT_FILES]
+        manifest, written = precompress(paths, workers, previous=load_previous(), stage=progress)
+        write_manifest(manifest)
+        totals = manifest["totals"]
+        print(f"✅ Compressed: {totals['files']} artefacts ({written} written), "
+              f"{totals['size'] / 1024:.0f} KB → {totals['gzip_size'] / 1024:.0f} KB ({totals['ratio']:.1%})")
+
+    return [
+        Stage("manifest", run_manifest,
+              sources=[*local_sources("full-content-generator.py", "compact_manifest.py"), *CATALOG_DATA],
+              outputs=[MANIFEST_JSON, MANIFEST_COMPACT, MANIFEST_CURRENT],
+              load=lambda: load_manifest(MANIFEST_JSON),
+              options={**JSON_OPTIONS, **build_options()}),
+        Stage("keyword_matrix", run_keyword_matrix, deps=["manifest"],
+              sources=[*local_sources("full-content-generator.py"), *CATALOG_DATA],
+              outputs=["keyword_matrix.csv"]),
+        Stage("bodies", run_bodies, deps=["manifest"],
+              sources=[*local_sources("human-content-generator.py", "treatment-city-content-generator.py"),
+                       *CATALOG_DATA],
+              outputs=CONTENT_FILES,
+              load=load_bodies),
+        Stage("interlinks", run_interlinks, deps=["manifest"],
+              sources=local_sources("generate-interlinks.py"),
+              outputs=[INTERLINKS_FILE],
+              load=lambda: load(INTERLINKS_FILE)),
+        Stage("sitemaps", run_sitemaps, deps=["manifest"],
+              sources=local_sources("generate-sitemaps.py"),
+              outputs=["sitemap_index.xml"],
+              load=lambda: sitemaps.sitemap_files(compress),
+              options={"compress": compress}),
+        Stage("exports", run_exports, deps=["manifest", "bodies", "interlinks"],
+              sources=local_sources("content_db.py", "content_shards.py", "markdown_html.py", "build_cache.py"),
+              outputs=[DEFAULT_DB, DEFAULT_SHARD_DIR]),
+        Stage("precompress", run_precompress, deps=["bodies", "interlinks", "sitemaps"],
+              sources=local_sources("precompress.py"),
+              outputs=[PRECOMPRESS_MANIFEST]),
+    ]
+
+
+def main():
+    print("=" * 70)
+    print("Shifa AlHind - Build Pipeline")
+    print("=" * 70)
+
+    workers = int(get_arg("--workers", 1))
+    if "--reproducible" in sys.argv:
+        os.environ["SHIFA_REPRODUCIBLE"] = "1"
+    pipeline = Pipeline(build_stages(workers, compress="--gzip" in sys.argv))
+
+    if "--dry-run" in sys.argv:
+        print()
+        for step in pipeline.plan(force="--force" in sys.argv):
+            print(f"   {'run ' if step['run'] else 'skip'}  {step['stage']:<16} {step['reason'] or 'inputs unchanged'}")
+        return
+
+    plan = pipeline.run(force="--force" in sys.argv)
+    ran = [step["stage"] for step in plan if step["run"]]
+
+    print(f"\n🎉 Build complete: {len(ran)} of {len(plan)} stages ran"
+          f"{' (' + ', '.join(ran) + ')' if ran else ''}\n")
+    pipeline.report.write()
+
+
+if __name__ == "__main__":
+    main()
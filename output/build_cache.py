@@ -0,0 +1,87 @@
+"""
+Shifa AlHind - Content-Hash Build Cache
+Persistent on-disk cache of rendered pages, keyed by a hash of their inputs
+"""
+
+import hashlib
+import json
+import os
+from typing import Optional
+
+DEFAULT_CACHE_DIR = ".build_cache"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def hash_inputs(*parts) -> str:
+    """Stable SHA-256 of any JSON-serializable inputs"""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class BuildCache:
+    """Size-capped content cache with least-recently-used eviction.
+
+    Entries are plain files under `directory`; a hit refreshes the file's
+    mtime, so eviction simply removes the oldest files first.
+    """
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+    def has(self, key: str) -> bool:
+        """Check for an entry without touching it or the hit/miss counters"""
+        return os.path.exists(self._path(key))
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached text for `key`, or None on a miss"""
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                value = f.read()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+
+        os.utime(path)
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: str) -> None:
+        """Store text under `key` (temp file + rename, safe across worker processes)"""
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(value)
+        os.replace(tmp_path, path)
+
+    def evict(self) -> int:
+        """Drop least-recently-used entries until the cache fits in max_bytes, returns entries removed"""
+        entries = []
+        total = 0
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(root, name)
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+            removed += 1
+        return removed
+
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
@@ -0,0 +1,240 @@
+"""
+Shifa AlHind - Catalog
+Countries, cities, treatments and hospitals shared by every generator, loaded
+from catalog.json once, validated, and cached as a compiled snapshot
+"""
+
+import os
+import pickle
+from typing import Dict, List, Tuple
+
+from json_io import load
+
+CATALOG_DIR = os.path.dirname(os.path.abspath(__file__))
+CATALOG_FILE = os.path.join(CATALOG_DIR, "catalog.json")
+SNAPSHOT_FILE = os.path.join(CATALOG_DIR, ".catalog_snapshot.pickle")
+
+# Bump when compile_catalog() output changes shape, so stale snapshots are rebuilt
+SNAPSHOT_VERSION = 1
+
+REQUIRED_FIELDS = {
+    "countries": ("slug", "name", "name_ar", "short_name_ar"),
+    "cities": ("slug", "name", "name_ar", "country", "population", "core"),
+    "treatments": ("slug", "name", "name_ar", "price_min", "price_max", "core"),
+    "hospitals": ("name", "specialties"),
+}
+CORE_TREATMENT_FIELDS = ("cost_gcc_min", "cost_gcc_max", "cost_india_min", "cost_india_max", "savings_percent")
+CORE_CITY_FIELDS = ("flight_hours",)
+
+
+def is_number(value) -> bool:
+    """A positive number, or a string holding one (flight_hours is stored as "3.5")"""
+    if isinstance(value, bool):
+        return False
+    try:
+        return float(value) > 0
+    except (TypeError, ValueError):
+        return False
+
+
+def validate_catalog(data: Dict) -> None:
+    """Raise ValueError listing every problem in the raw catalog data"""
+    errors = []
+
+    for section, fields in REQUIRED_FIELDS.items():
+        seen = set()
+        for position, record in enumerate(data.get(section, [])):
+            key = record.get("slug", record.get("name"))
+            missing = [field for field in fields if field not in record]
+            if missing:
+                errors.append(f"{section}[{position}] ({key}): missing {', '.join(missing)}")
+            if key in seen:
+                errors.append(f"{section}: duplicate {key!r}")
+            seen.add(key)
+
+    country_slugs = {country["slug"] for country in data.get("countries", [])}
+    for city in data.get("cities", []):
+        if city.get("country") not in country_slugs:
+            errors.append(f"cities ({city.get('slug')}): unknown country {city.get('country')!r}")
+        if city.get("core"):
+            missing = [field for field in CORE_CITY_FIELDS if field not in city]
+            if missing:
+                errors.append(f"cities ({city.get('slug')}): core city missing {', '.join(missing)}")
+            elif not is_number(city["flight_hours"]):
+                errors.append(f"cities ({city.get('slug')}): flight_hours is not a number: {city['flight_hours']!r}")
+
+    for treatment in data.get("treatments", []):
+        slug = treatment.get("slug")
+        if treatment.get("price_min", 0) > treatment.get("price_max", 0):
+            errors.append(f"treatments ({slug}): price_min > price_max")
+        if treatment.get("core"):
+            missing = [field for field in CORE_TREATMENT_FIELDS if field not in treatment]
+            if missing:
+                errors.append(f"treatments ({slug}): core treatment missing {', '.join(missing)}")
+            elif treatment["cost_india_min"] > treatment["cost_india_max"] or treatment["cost_gcc_min"] > treatment["cost_gcc_max"]:
+                errors.append(f"treatments ({slug}): cost min > max")
+
+    if errors:
+        raise ValueError("Invalid catalog:\n  " + "\n  ".join(errors))
+
+
+def compile_catalog(data: Dict) -> Dict:
+    """Denormalize the raw catalog and precompute every lookup index"""
+    locales = data["locales"]
+    countries = {country["slug"]: country for country in data["countries"]}
+
+    cities = []
+    for city in data["cities"]:
+        country = countries[city["country"]]
+        cities.append({
+            **city,
+            "country_name": country["name"],
+            "country_name_ar": country["name_ar"],
+            "country_short_ar": country["short_name_ar"],
+        })
+    treatments = data["treatments"]
+
+    # (slug, locale) → record with `name` (and `country_name` for cities) localized
+    index = {"treatments": {}, "cities": {}}
+    names = {}
+    for treatment in treatments:
+        for locale in locales:
+            name = treatment["name_ar"] if locale == "ar" else treatment["name"]
+            index["treatments"][(treatment["slug"], locale)] = {**treatment, "name": name}
+            names[(name, locale)] = treatment["slug"]
+    for city in cities:
+        for locale in locales:
+            is_ar = locale == "ar"
+            name = city["name_ar"] if is_ar else city["name"]
+            index["cities"][(city["slug"], locale)] = {
+                **city,
+                "name": name,
+                "country_slug": city["country"],
+                "country_name": city["country_name_ar"] if is_ar else city["country_name"],
+            }
+            names[(name, locale)] = city["slug"]
+
+    cities_by_country: Dict[str, List[Dict]] = {slug: [] for slug in countries}
+    for city in cities:
+        cities_by_country[city["country"]].append(city)
+
+    return {
+        "locales": locales,
+        "countries": countries,
+        "cities": cities,
+        "treatments": treatments,
+        "hospitals": data["hospitals"],
+        "cities_by_slug": {city["slug"]: city for city in cities},
+        "treatments_by_slug": {treatment["slug"]: treatment for treatment in treatments},
+        "cities_by_country": cities_by_country,
+        "slug_by_name": names,
+        "index": index,
+    }
+
+
+def _read_snapshot(source_mtime: int):
+    try:
+        with open(SNAPSHOT_FILE, "rb") as f:
+            snapshot = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+    if snapshot.get("version") != SNAPSHOT_VERSION or snapshot.get("source_mtime") != source_mtime:
+        return None
+    return snapshot["catalog"]
+
+
+def _write_snapshot(catalog: Dict, source_mtime: int) -> None:
+    tmp = f"{SNAPSHOT_FILE}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            pickle.dump({"version": SNAPSHOT_VERSION, "source_mtime": source_mtime, "catalog": catalog}, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, SNAPSHOT_FILE)
+    except OSError:
+        # A read-only checkout still works, it just recompiles every run
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+_catalog = None
+
+
+def load_catalog() -> Dict:
+    """Compiled catalog: the pickled snapshot while catalog.json is unchanged, else validate and recompile"""
+    global _catalog
+    if _catalog is None:
+        source_mtime = os.stat(CATALOG_FILE).st_mtime_ns
+        _catalog = _read_snapshot(source_mtime)
+        if _catalog is None:
+            data = load(CATALOG_FILE)
+            validate_catalog(data)
+            _catalog = compile_catalog(data)
+            _write_snapshot(_catalog, source_mtime)
+    return _catalog
+
+
+def build_catalog_index(locales=None) -> Dict[str, Dict[Tuple[str, str], Dict]]:
+    """Index treatments and cities by (slug, locale).
+
+    Each entry is the catalog record with `name` (and `country_name` for
+    cities) already localized, so renderers never need to scan pages.
+    """
+    index = load_catalog()["index"]
+    if locales is None:
+        return index
+    return {kind: {key: record for key, record in entries.items() if key[1] in locales} for kind, entries in index.items()}
+
+
+def city_by_slug(slug: str) -> Dict:
+    return load_catalog()["cities_by_slug"][slug]
+
+
+def treatment_by_slug(slug: str) -> Dict:
+    return load_catalog()["treatments_by_slug"][slug]
+
+
+def slug_for_name(name: str, locale: str = "en"):
+    """City or treatment slug for a localized display name, or None"""
+    return load_catalog()["slug_by_name"].get((name, locale))
+
+
+def _gcc_structure(catalog: Dict) -> List[Dict]:
+    """Core cities grouped by country, the shape the manifest generators iterate"""
+    structure = []
+    for country in catalog["countries"].values():
+        cities = [
+            {"slug": city["slug"], "name": city["name"], "name_ar": city["name_ar"], "flight_time": f"{city['flight_hours']} hours"}
+            for city in catalog["cities_by_country"][country["slug"]]
+            if city["core"]
+        ]
+        if cities:
+            structure.append({
+                "country_slug": country["slug"],
+                "country_name": country["name"],
+                "country_name_ar": country["name_ar"],
+                "cities": cities,
+            })
+    return structure
+
+
+_compiled = load_catalog()
+
+LOCALES = _compiled["locales"]
+GCC_STRUCTURE = _gcc_structure(_compiled)
+
+# Original 10-city × 8-treatment set behind the manifest, plus the expansion set used by scripts/
+TREATMENTS = [t for t in _compiled["treatments"] if t["core"]]
+ALL_TREATMENTS = _compiled["treatments"]
+NEW_TREATMENTS = [t for t in ALL_TREATMENTS if not t["core"]]
+CITIES = _compiled["cities"]
+NEW_CITIES = [c for c in CITIES if not c["core"]]
+
+TREATMENT_COSTS = {
+    t["slug"]: {
+        "gcc": (t["cost_gcc_min"], t["cost_gcc_max"]),
+        "india": (t["cost_india_min"], t["cost_india_max"]),
+        "savings": t["savings_percent"],
+    }
+    for t in TREATMENTS
+}
+FLIGHT_TIMES = {c["slug"]: c["flight_hours"] for c in CITIES if "flight_hours" in c}
+BANGALORE_HOSPITALS = _compiled["hospitals"]
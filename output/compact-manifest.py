@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Shifa AlHind - Compact Manifest Converter
+Re-encodes the content manifest in the dictionary-encoded compact format and
+checks that every page decodes back exactly
+"""
+
+import os
+import sys
+import time
+
+from compact_manifest import CompactManifest, write_compact_manifest
+from manifest_io import MANIFEST_COMPACT, MANIFEST_JSON, MANIFEST_NDJSON, load_manifest, mark_current
+
+
+def main():
+    print("=" * 70)
+    print("Shifa AlHind - Compact Manifest Converter")
+    print("=" * 70)
+
+    source = MANIFEST_NDJSON if os.path.exists(MANIFEST_NDJSON) and not os.path.exists(MANIFEST_JSON) else MANIFEST_JSON
+    if "--in" in sys.argv:
+        source = sys.argv[sys.argv.index("--in") + 1]
+    target = MANIFEST_COMPACT
+    if "--out" in sys.argv:
+        target = sys.argv[sys.argv.index("--out") + 1]
+
+    print(f"\n⏳ Encoding {source}...")
+    started = time.perf_counter()
+    pages = load_manifest(source)
+    load_seconds = time.perf_counter() - started
+
+    counts = write_compact_manifest(pages, target)
+    print(f"✅ Saved: {target} ({counts['pages']} pages, {counts['templates']} templates)")
+
+    # Round-trip check: the compact file must rebuild every page exactly
+    started = time.perf_counter()
+    manifest = CompactManifest.open(target)
+    open_seconds = time.perf_counter() - started
+    decoded = list(manifest)
+    decode_seconds = time.perf_counter() - started
+
+    mismatches = [original["url"] for original, page in zip(pages, decoded) if original != page]
+    if len(decoded) != len(pages) or mismatches:
+        print(f"❌ Round trip failed for {len(mismatches) or abs(len(decoded) - len(pages))} pages")
+        for url in mismatches[:5]:
+            print(f"   {url}")
+        os.remove(target)
+        sys.exit(1)
+    print(f"✅ Round trip: all {len(decoded)} pages decode identically")
+    mark_current(target)
+
+    source_bytes = os.path.getsize(source)
+    print(f"\n📊 Size: {source_bytes:,} → {counts['bytes']:,} bytes ({source_bytes / counts['bytes']:.1f}× smaller)")
+    print(f"   Load: {load_seconds * 1000:.1f} ms ({source}) vs {open_seconds * 1000:.1f} ms compact "
+          f"({decode_seconds * 1000:.1f} ms with every page rebuilt)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""
+Shifa AlHind - Compact Manifest Format
+Dictionary-encoded manifest: locales, places, treatments and article slugs
+become small integer codes, and titles, URLs and JSON-LD become shared
+templates that are rebuilt per page on read
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from catalog import build_catalog_index
+from json_io import NESTED_JSON_LD, dump, dumps, load, loads, nest_json_ld
+from page_index import page_path
+from section_templates import Template
+
+FORMAT = "shifa-compact-manifest"
+FORMAT_VERSION = 1
+
+# Per-page hierarchy the templates are parameterized over, in row order
+PARTS = ("locale", "country", "city", "treatment", "article")
+
+
+def _escape(text: str) -> str:
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def article_title(slug: str) -> str:
+    """Display title the generators derive from an article slug"""
+    return slug.replace("-", " ").title()
+
+
+def _slots(path: Tuple[Optional[str], ...], names: Dict) -> Dict[str, str]:
+    """Values a page's strings are templated over; the decoder rebuilds the same dict"""
+    locale, country, city, treatment, article = path
+    slots = {}
+    for part, slug in (("country", country), ("city", city), ("treatment", treatment), ("article", article)):
+        if slug:
+            slots[part] = slug
+            name = names.get((part, slug, locale))
+            if name:
+                slots[f"{part}_name"] = name
+    if article:
+        slots["article_title"] = article_title(article)
+    return slots
+
+
+def _with_url(slots: Dict[str, str], url: str) -> Dict[str, str]:
+    """Slots plus the page URL and its /{locale} root, for every field but the URL itself"""
+    return {**slots, "url": url, "base": "/".join(url.split("/")[:4])}
+
+
+def _template(text: str, slots: Dict[str, str]) -> str:
+    """Replace slot values in `text` with {slot} fields, longest value first"""
+    template = _escape(text)
+    for slot, value in sorted(slots.items(), key=lambda item: -len(item[1])):
+        template = template.replace(_escape(value), "{" + slot + "}")
+    # Only keep the template when it provably rebuilds the original
+    return template if template.format(**slots) == text else _escape(text)
+
+
+def _catalog_names() -> Dict[Tuple[str, str, str], str]:
+    """(part, slug, locale) → localized display name, from the catalog"""
+    index = build_catalog_index()
+    names = {}
+    for (slug, locale), treatment in index["treatments"].items():
+        names[("treatment", slug, locale)] = treatment["name"]
+    for (slug, locale), city in index["cities"].items():
+        names[("city", slug, locale)] = city["name"]
+        names[("country", city["country_slug"], locale)] = city["country_name"]
+    return names
+
+
+class _Table:
+    """Append-only value → code dictionary"""
+
+    def __init__(self):
+        self.codes = {}
+        self.values = []
+
+    def code(self, value) -> int:
+        key = value if isinstance(value, str) else dumps(value)
+        if key not in self.codes:
+            self.codes[key] = len(self.values)
+            self.values.append(value)
+        return self.codes[key]
+
+
+def encode_manifest(pages: Iterable[Dict]) -> Dict:
+    """Dictionary-encode manifest pages into the compact format.
+
+    Each row is [shape, locale, country, city, treatment, article, *fields]:
+    `shape` picks the page's key list, the next five are codes into the part
+    dictionaries (-1 when absent) and each field is a template code (≥ 0) or
+    a literal code (< 0, for booleans, numbers and null). Objects such as a
+    nested json_ld are templated as JSON text; the shape lists their positions.
+    """
+    names = _catalog_names()
+    parts = {part: _Table() for part in PARTS}
+    shapes, templates, literals = _Table(), _Table(), _Table()
+    rows = []
+
+    for page in pages:
+        path = tuple((list(page_path(page["url"])) + [None] * len(PARTS))[:len(PARTS)])
+        slots = _slots(path, names)
+        page_slots = _with_url(slots, page["url"])
+
+        fields = []
+        json_positions = []
+        for position, (key, value) in enumerate(page.items()):
+            if isinstance(value, (dict, list)):
+                json_positions.append(position)
+                value = dumps(value)
+            if isinstance(value, str):
+                fields.append(templates.code(_template(value, slots if key == "url" else page_slots)))
+            else:
+                fields.append(-1 - literals.code(value))
+
+        row = [shapes.code([list(page), json_positions])]
+        row.extend(parts[part].code(value) if value else -1 for part, value in zip(PARTS, path))
+        row.extend(fields)
+        rows.append(row)
+
+    # Localized names for the slugs that occur, so the file decodes without the catalog
+    locales = parts["locale"].values
+    part_names = {
+        part: [[names.get((part, slug, locale)) for locale in locales] for slug in parts[part].values]
+        for part in ("country", "city", "treatment")
+    }
+
+    return {
+        "format": FORMAT,
+        "version": FORMAT_VERSION,
+        "parts": {part: table.values for part, table in parts.items()},
+        "names": part_names,
+        "shapes": shapes.values,
+        "templates": templates.values,
+        "literals": literals.values,
+        "pages": rows,
+    }
+
+
+class CompactManifest:
+    """Reader over a compact manifest that hands out ordinary page dicts.
+
+    Pages are rebuilt one at a time on iteration or indexing, so existing
+    stages keep using page["url"], page.get(...) and {**page} unchanged.
+    """
+
+    def __init__(self, data: Dict):
+        if data.get("format") != FORMAT or data.get("version") != FORMAT_VERSION:
+            raise ValueError(f"not a {FORMAT} v{FORMAT_VERSION} file")
+        self.parts = [data["parts"][part] for part in PARTS]
+        self.names = data["names"]
+        self.shapes = data["shapes"]
+        self.templates = data["templates"]
+        self._fill = [Template(template).render for template in self.templates]
+        self.literals = data["literals"]
+        self.rows = data["pages"]
+
+    @classmethod
+    def open(cls, filename: str) -> "CompactManifest":
+        return cls(load(filename))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, position: int) -> Dict:
+        return self._decode(self.rows[position])
+
+    def __iter__(self) -> Iterator[Dict]:
+        for row in self.rows:
+            yield self._decode(row)
+
+    def _decode(self, row: List[int]) -> Dict:
+        codes = row[1:1 + len(PARTS)]
+        locale_code = codes[0]
+        slots = {}
+        for part, values, code in zip(PARTS, self.parts, codes):
+            if code < 0 or part == "locale":
+                continue
+            slots[part] = values[code]
+            if part in self.names:
+                name = self.names[part][code][locale_code]
+                if name:
+                    slots[f"{part}_name"] = name
+        if "article" in slots:
+            slots["article_title"] = article_title(slots["article"])
+
+        shape, json_positions = self.shapes[row[0]]
+        fields = row[1 + len(PARTS):]
+        # Other fields may refer to the URL, so it is rebuilt first
+        url = self._fill[fields[shape.index("url")]](slots)
+        page_slots = _with_url(slots, url)
+
+        page = {}
+        for key, code in zip(shape, fields):
+            if code < 0:
+                page[key] = self.literals[-1 - code]
+            elif key == "url":
+                page[key] = url
+            else:
+                page[key] = self._fill[code](page_slots)
+        for position in json_positions:
+            key = shape[position]
+            page[key] = loads(page[key])
+        return page
+
+
+def write_compact_manifest(pages: Iterable[Dict], filename: str) -> Dict[str, int]:
+    """Encode and save pages, returns counts for reporting"""
+    if NESTED_JSON_LD:
+        pages = (nest_json_ld(page) for page in pages)
+    data = encode_manifest(pages)
+    size = dump(data, filename, pretty=False)
+    return {"pages": len(data["pages"]), "templates": len(data["templates"]), "bytes": size}
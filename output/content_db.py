@@ -0,0 +1,137 @@
+"""
+Shifa AlHind - SQLite Content Store
+Pages, JSON-LD and interlinks in one indexed database file
+"""
+
+import os
+import sqlite3
+from typing import Dict, Iterable
+
+from json_io import json_ld_text, load
+from page_index import page_path
+
+DEFAULT_DB = "content.db"
+
+SCHEMA = """
+CREATE TABLE pages (
+    url TEXT PRIMARY KEY,
+    locale TEXT NOT NULL,
+    page_type TEXT NOT NULL,
+    slug TEXT,
+    country TEXT,
+    city TEXT,
+    treatment TEXT,
+    title TEXT,
+    meta_desc TEXT,
+    h1 TEXT,
+    needs_native_review INTEGER,
+    needs_medical_review INTEGER,
+    status TEXT,
+    full_content TEXT,
+    word_count INTEGER,
+    generated_at TEXT
+);
+CREATE TABLE json_ld (
+    url TEXT PRIMARY KEY REFERENCES pages(url),
+    json_ld TEXT NOT NULL
+);
+CREATE TABLE interlinks (
+    source_url TEXT NOT NULL REFERENCES pages(url),
+    position INTEGER NOT NULL,
+    target_url TEXT NOT NULL,
+    anchor_text TEXT,
+    link_type TEXT,
+    PRIMARY KEY (source_url, position)
+);
+"""
+
+# Created after the bulk load, which is much faster than maintaining them per row
+INDEXES = """
+CREATE INDEX idx_pages_locale ON pages(locale);
+CREATE INDEX idx_pages_page_type ON pages(page_type);
+CREATE INDEX idx_pages_hierarchy ON pages(country, city, treatment);
+CREATE INDEX idx_pages_city ON pages(city);
+CREATE INDEX idx_pages_treatment ON pages(treatment);
+CREATE INDEX idx_interlinks_target ON interlinks(target_url);
+"""
+
+
+def page_row(page: Dict) -> tuple:
+    """pages row for a manifest page; hierarchy columns come from the URL"""
+    path = page_path(page["url"])[1:]
+    country, city, treatment = (list(path[:3]) + [None, None, None])[:3]
+    return (
+        page["url"],
+        page["locale"],
+        page["page_type"],
+        page.get("slug"),
+        country,
+        city,
+        treatment,
+        page.get("title"),
+        page.get("meta_desc"),
+        page.get("h1"),
+        page.get("needs_native_review"),
+        page.get("needs_medical_review"),
+        page.get("status"),
+        page.get("full_content"),
+        page.get("word_count"),
+        page.get("generated_at"),
+    )
+
+
+def interlink_rows(entries: Iterable[Dict]):
+    for entry in entries:
+        for position, link in enumerate(entry["internal_links"]):
+            yield (entry["source_url"], position, link["url"], link.get("anchor_text"), link.get("link_type"))
+
+
+def export_content_db(pages: Iterable[Dict], content_files=(), interlinks=(), filename: str = DEFAULT_DB) -> Dict[str, int]:
+    """Build the database from manifest pages, generated content files and interlinks.
+
+    Everything is loaded with executemany inside a single transaction into a
+    temp file, which replaces `filename` only once the load has committed.
+    """
+    tmp = f"{filename}.tmp"
+    if os.path.exists(tmp):
+        os.remove(tmp)
+
+    conn = sqlite3.connect(tmp)
+    conn.execute("PRAGMA journal_mode = OFF")
+    conn.execute("PRAGMA synchronous = OFF")
+    counts = {}
+    try:
+        conn.executescript(SCHEMA)
+        with conn:
+            json_ld_rows = []
+
+            def manifest_rows():
+                for page in pages:
+                    if page.get("json_ld"):
+                        json_ld_rows.append((page["url"], json_ld_text(page)))
+                    yield page_row(page)
+
+            conn.executemany(f"INSERT INTO pages VALUES ({', '.join('?' * 16)})", manifest_rows())
+            conn.executemany("INSERT INTO json_ld VALUES (?, ?)", json_ld_rows)
+
+            # Generated body text is layered onto the manifest rows
+            for content in content_files:
+                # A content file's path, or its records already in memory
+                if isinstance(content, str):
+                    content = load(content)
+                conn.executemany(
+                    "UPDATE pages SET full_content = ?, word_count = ?, generated_at = ? WHERE url = ?",
+                    ((p.get("full_content"), p.get("word_count"), p.get("generated_at"), p["url"]) for p in content),
+                )
+
+            conn.executemany("INSERT INTO interlinks VALUES (?, ?, ?, ?, ?)", interlink_rows(interlinks))
+            conn.executescript(INDEXES)
+
+        for table in ("pages", "json_ld", "interlinks"):
+            counts[table] = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        counts["with_content"] = conn.execute("SELECT COUNT(*) FROM pages WHERE full_content IS NOT NULL").fetchone()[0]
+    finally:
+        conn.close()
+
+    os.replace(tmp, filename)
+    return counts
@@ -0,0 +1,127 @@
+"""
+Shifa AlHind - Per-URL Content Shards
+One small body file per page (plus its pre-rendered HTML) and a slim
+url → shard index for the Next.js reader
+"""
+
+import os
+from typing import Dict, Iterable, Optional
+
+from json_io import NESTED_JSON_LD, dump, dumpb, load, nest_json_ld
+from markdown_html import page_variants
+from page_emitter import EMIT_WORKERS, FSYNC_EVERY, PageEmitter
+
+DEFAULT_SHARD_DIR = "content_shards"
+INDEX_FILENAME = "index.json"
+# Committed shards between index rewrites while streaming
+INDEX_EVERY = 256
+
+
+def shard_path(url: str) -> str:
+    """Relative shard path for a URL, e.g. en/blog/qatar/doha/ivf/some-article.json"""
+    path = url.split("://", 1)[-1].split("/", 1)[1].strip("/")
+    return f"{path}.json"
+
+
+def index_entry(page: Dict) -> Dict:
+    """Slim metadata kept in the index for a page"""
+    return {
+        "path": shard_path(page["url"]),
+        "title": page.get("title"),
+        "locale": page.get("locale"),
+        "page_type": page.get("page_type"),
+        "word_count": page.get("word_count"),
+    }
+
+
+def load_index(root: str = DEFAULT_SHARD_DIR) -> Dict[str, Dict]:
+    """Existing url → entry index, or an empty one"""
+    try:
+        return load(os.path.join(root, INDEX_FILENAME))["pages"]
+    except FileNotFoundError:
+        return {}
+
+
+def write_index(index: Dict[str, Dict], root: str = DEFAULT_SHARD_DIR) -> None:
+    dump({"version": 1, "pages": index}, os.path.join(root, INDEX_FILENAME), pretty=False)
+
+
+class ShardEmitter:
+    """Streams pages into a shard directory while they are being generated.
+
+    Shards (and any pre-rendered variants of a page, keyed by file suffix
+    such as ".html") go through a PageEmitter. The index is merged with the
+    existing one and rewritten as batches commit (every INDEX_EVERY pages);
+    a page enters it only after its shard and all its variants committed,
+    so it never lists a file that is not on disk and the directory is
+    usable mid-build.
+    The article, treatment and city generators can all publish into the
+    same directory.
+    """
+
+    def __init__(self, root: str = DEFAULT_SHARD_DIR, workers: int = EMIT_WORKERS, fsync_every: int = FSYNC_EVERY):
+        self.root = root
+        self.index = load_index(root)
+        self.pages = 0
+        self._entries: Dict[str, Dict] = {}
+        self._uncommitted: Dict[str, int] = {}
+        # Batches commit in completion order; the final index keeps the order pages were added in
+        self._order = list(self.index)
+        self._unindexed = 0
+        self.emitter = PageEmitter(root, workers, fsync_every, on_commit=self._commit)
+
+    def add(self, page: Dict, variants: Optional[Dict[str, bytes]] = None) -> None:
+        url = page["url"]
+        entry = index_entry(page)
+        variants = variants or {}
+        if variants:
+            entry["variants"] = sorted(variants)
+
+        # The page is indexed once its shard and every variant file have committed
+        self._entries[url] = entry
+        self._uncommitted[url] = 1 + len(variants)
+        self._order.append(url)
+        stem = entry["path"][:-len(".json")]
+        for suffix, payload in variants.items():
+            self.emitter.emit(stem + suffix, payload, key=url)
+        self.emitter.emit(entry["path"], dumpb(nest_json_ld(page) if NESTED_JSON_LD else page), key=url)
+        self.pages += 1
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """Files written, files left unchanged and batches committed so far"""
+        return dict(self.emitter.counts)
+
+    def _commit(self, urls) -> None:
+        for url in urls:
+            if url not in self._uncommitted:
+                continue
+            self._uncommitted[url] -= 1
+            if self._uncommitted[url]:
+                continue
+            del self._uncommitted[url]
+            self.index[url] = self._entries.pop(url)
+            self._unindexed += 1
+        if self._unindexed >= INDEX_EVERY:
+            write_index(self.index, self.root)
+            self._unindexed = 0
+
+    def close(self) -> int:
+        """Flush the last batch and the index, returns the number of pages added"""
+        self.emitter.close()
+        self.index = {url: self.index[url] for url in self._order}
+        write_index(self.index, self.root)
+        return self.pages
+
+
+def write_content_shards(pages: Iterable[Dict], root: str = DEFAULT_SHARD_DIR, workers: int = 1, cache=None) -> int:
+    """Write each page, with its body pre-rendered to HTML, to its own shard and merge the pages into the index.
+
+    HTML is rendered in bulk across `workers` processes, reusing fragments
+    from `cache` (a BuildCache) for bodies rendered before.
+    """
+    pages = list(pages)
+    emitter = ShardEmitter(root)
+    for page, variants in zip(pages, page_variants(pages, workers, cache)):
+        emitter.add(page, variants)
+    return emitter.close()
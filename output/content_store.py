@@ -0,0 +1,85 @@
+"""
+Shifa AlHind - Keyed Content Store
+URL-keyed view of a content file with upsert semantics: re-adding a page
+replaces it in place, unchanged pages are not rewritten, and a run that
+changes nothing writes nothing
+"""
+
+import os
+from typing import Dict, Iterator, Optional
+
+from content_shards import write_content_shards
+from json_io import dump, load
+
+# Fields that differ between two generations of the same page without the page changing
+VOLATILE_FIELDS = ("generated_at",)
+
+
+def _stable(record: Dict) -> Dict:
+    return {key: value for key, value in record.items() if key not in VOLATILE_FIELDS}
+
+
+class ContentStore:
+    """Pages of one content file (e.g. src/data/content_articles_full.json) keyed by URL.
+
+    When `shard_dir` already holds published shards, save() rewrites only
+    the shards of pages that were added or changed.
+    """
+
+    def __init__(self, filename: str, shard_dir: Optional[str] = None):
+        self.filename = filename
+        self.shard_dir = shard_dir
+        self.records: Dict[str, Dict] = {}
+        self.changed: Dict[str, Dict] = {}
+        self.counts = {"added": 0, "updated": 0, "unchanged": 0}
+        # Copies of the same URL left by earlier append-style runs; the last one wins
+        self.duplicates = 0
+
+        if os.path.exists(filename):
+            for record in load(filename):
+                if record["url"] in self.records:
+                    self.duplicates += 1
+                self.records[record["url"]] = record
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self.records
+
+    def __iter__(self) -> Iterator[Dict]:
+        return iter(self.records.values())
+
+    def upsert(self, record: Dict) -> str:
+        """Insert or replace the page at record["url"], returns "added", "updated" or "unchanged" """
+        url = record["url"]
+        current = self.records.get(url)
+        if current is None:
+            outcome = "added"
+        elif _stable(current) == _stable(record):
+            outcome = "unchanged"
+        else:
+            outcome = "updated"
+
+        self.counts[outcome] += 1
+        if outcome != "unchanged":
+            self.records[url] = record
+            self.changed[url] = record
+        return outcome
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self.changed or self.duplicates)
+
+    def save(self) -> bool:
+        """Write the file atomically if anything changed, returns whether it was written"""
+        if not self.dirty:
+            return False
+
+        dump(list(self.records.values()), self.filename)
+        if self.shard_dir and os.path.isdir(self.shard_dir) and self.changed:
+            write_content_shards(self.changed.values(), self.shard_dir)
+
+        self.changed = {}
+        self.duplicates = 0
+        return True
@@ -0,0 +1,142 @@
+"""
+Shifa AlHind - Coverage Planner
+Builds the desired city × treatment × article template × locale matrix,
+diffs it against the URLs that already exist with set operations, and turns
+the gap into a minimal work list for the expansion generators
+"""
+
+import os
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Sequence
+
+from json_io import load
+
+BASE_URL = "https://shifaalhind.com"
+
+# Which generator fills a missing cell: the new (non-core) treatments belong to
+# generate-missing-content, city pages and everything else to expand-city-coverage
+MISSING_CONTENT = "generate-missing-content"
+CITY_COVERAGE = "expand-city-coverage"
+
+# Article templates every city/treatment pair gets (the ARTICLE_TEMPLATES of both scripts)
+ARTICLE_SLUGS = ("complete-guide", "cost-comparison", "top-hospitals", "success-stories", "travel-guide")
+
+
+def city_url(city: Dict, locale: str) -> str:
+    return f"{BASE_URL}/{locale}/medical-tourism/{city['country']}/{city['slug']}"
+
+
+def treatment_url(treatment: Dict, city: Dict, locale: str) -> str:
+    return f"{city_url(city, locale)}/{treatment['slug']}"
+
+
+def article_url(treatment: Dict, city: Dict, template_slug: str, locale: str) -> str:
+    return f"{BASE_URL}/{locale}/blog/{city['country']}/{city['slug']}/{treatment['slug']}/{template_slug}"
+
+
+def desired_matrix(cities: Sequence[Dict], treatments: Sequence[Dict],
+                   template_slugs: Sequence[str], locales: Sequence[str]) -> Dict[str, Dict]:
+    """URL → cell for every page the site should have.
+
+    Per city and locale: the city page, then per treatment its landing page
+    and one article per template. Insertion order is generation order.
+    """
+    desired = {}
+    for city in cities:
+        for locale in locales:
+            cell = {"locale": locale, "country": city["country"], "city": city["slug"]}
+            desired[city_url(city, locale)] = {"kind": "city", **cell, "treatment": None, "template": None}
+            for treatment in treatments:
+                core = bool(treatment.get("core"))
+                desired[treatment_url(treatment, city, locale)] = {
+                    "kind": "treatment", **cell, "treatment": treatment["slug"], "template": None, "core": core,
+                }
+                for template_slug in template_slugs:
+                    desired[article_url(treatment, city, template_slug, locale)] = {
+                        "kind": "article", **cell, "treatment": treatment["slug"], "template": template_slug, "core": core,
+                    }
+    return desired
+
+
+def content_urls(filenames: Iterable[str]) -> set:
+    """URLs of every page in the given content files (missing files count as empty)"""
+    urls = set()
+    for filename in filenames:
+        if os.path.exists(filename):
+            urls.update(page["url"] for page in load(filename))
+    return urls
+
+
+def generator_for(cell: Dict) -> str:
+    if cell["kind"] != "city" and not cell["core"]:
+        return MISSING_CONTENT
+    return CITY_COVERAGE
+
+
+def _coverage(desired: Counter, missing: Counter) -> Dict[str, Dict]:
+    return {
+        key: {
+            "desired": total,
+            "existing": total - missing[key],
+            "missing": missing[key],
+            "coverage": round((total - missing[key]) / total, 4),
+        }
+        for key, total in sorted(desired.items())
+    }
+
+
+def plan_coverage(desired: Dict[str, Dict], existing: set) -> Dict:
+    """Diff the desired matrix against existing URLs.
+
+    Returns the work list (missing cells grouped by the generator that
+    fills them, in generation order), coverage per country, city, treatment
+    and page kind, and the existing URLs outside the matrix ("stale").
+    """
+    desired_urls = desired.keys()
+    missing_urls = desired_urls - existing
+    stale = sorted(existing - desired_urls)
+
+    work: Dict[str, List[Dict]] = {MISSING_CONTENT: [], CITY_COVERAGE: []}
+    for url, cell in desired.items():
+        if url in missing_urls:
+            work[generator_for(cell)].append({"url": url, **cell})
+
+    coverage = {}
+    for dimension in ("country", "city", "treatment", "kind"):
+        wanted = Counter(cell[dimension] for cell in desired.values() if cell[dimension])
+        gaps = Counter(desired[url][dimension] for url in missing_urls if desired[url][dimension])
+        coverage[dimension] = _coverage(wanted, gaps)
+
+    return {
+        "summary": {
+            "desired": len(desired),
+            "existing": len(desired) - len(missing_urls),
+            "missing": len(missing_urls),
+            "stale": len(stale),
+            "coverage": round(1 - len(missing_urls) / len(desired), 4) if desired else 1.0,
+            "work": {generator: len(cells) for generator, cells in work.items()},
+        },
+        "coverage": coverage,
+        "work": work,
+        "stale": stale,
+    }
+
+
+def generate_from_plan(plan_file: str, work_key: str, generators: Dict[str, Callable[[Dict], Dict]],
+                       stores: Dict, report) -> None:
+    """Generate one script's cells of a plan-coverage.py work list.
+
+    `generators` maps a cell kind to the function building that cell's page;
+    each page is upserted into the store for its kind.
+    """
+    cells = load(plan_file)["work"][work_key]
+    print(f"\n🔄 Generating {len(cells)} missing pages from {plan_file}")
+
+    with report.stage("generate_pages", total=len(cells)) as stage:
+        for cell in cells:
+            page = generators[cell["kind"]](cell)
+            if page["url"] != cell["url"]:
+                raise ValueError(f"Plan cell {cell['url']} generated {page['url']}, re-run plan-coverage.py")
+            stores[cell["kind"]].upsert(page)
+            stage.advance()
+        print(f"  ✓ Generated {stage.pages} pages ({stage.progress()})")
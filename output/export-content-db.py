@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Shifa AlHind - SQLite Content Exporter
+Loads every generated page, its JSON-LD and its interlinks into content.db
+"""
+
+import os
+import sys
+
+from content_db import DEFAULT_DB, export_content_db
+from json_io import load
+from manifest_io import iter_manifest
+
+CONTENT_FILES = [
+    "content_cities_full.json",
+    "content_treatments_full.json",
+    "content_articles_full.json",
+]
+INTERLINKS_FILE = "interlink_structure.json"
+
+
+def main():
+    print("=" * 70)
+    print("Shifa AlHind - SQLite Content Exporter")
+    print("=" * 70)
+
+    filename = DEFAULT_DB
+    if "--out" in sys.argv:
+        filename = sys.argv[sys.argv.index("--out") + 1]
+
+    content_files = [f for f in CONTENT_FILES if os.path.exists(f)]
+    interlinks = []
+    if os.path.exists(INTERLINKS_FILE):
+        interlinks = load(INTERLINKS_FILE)
+
+    print(f"\n⏳ Exporting manifest, {len(content_files)} content files and interlinks...")
+    counts = export_content_db(iter_manifest(), content_files, interlinks, filename)
+
+    print(f"✅ Saved: {filename}")
+    print(f"   Pages: {counts['pages']} ({counts['with_content']} with full content)")
+    print(f"   JSON-LD: {counts['json_ld']}")
+    print(f"   Interlinks: {counts['interlinks']}")
+
+    print(f"\n📝 Example query:")
+    print(f"   sqlite3 {filename} \"SELECT url FROM pages WHERE city = 'dubai' AND page_type = 'article'\"")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Shifa AlHind - Near-Duplicate Finder
+Clusters generated pages whose bodies are near-identical (MinHash + LSH)
+and writes the clusters with their similarity scores
+"""
+
+import os
+import sys
+
+from json_io import dump, load
+from near_duplicates import BANDS, THRESHOLD, find_near_duplicates, page_similarity
+from run_report import RunReport
+
+DEFAULT_SOURCES = [
+    "content_articles_full.json",
+    "content_treatments_full.json",
+    "content_cities_full.json",
+]
+REPORT_FILE = "near_duplicates_report.json"
+
+
+def main():
+    print("=" * 70)
+    print("Shifa AlHind - Near-Duplicate Finder")
+    print("=" * 70)
+
+    args = sys.argv[1:]
+    options = {"--threshold": str(THRESHOLD), "--bands": str(BANDS), "--workers": "1", "--out": REPORT_FILE}
+    for flag in options:
+        if flag in args:
+            position = args.index(flag)
+            options[flag] = args[position + 1]
+            del args[position:position + 2]
+    threshold = float(options["--threshold"])
+    bands = int(options["--bands"])
+    workers = int(options["--workers"])
+
+    sources = args or [f for f in DEFAULT_SOURCES if os.path.exists(f)]
+    pages = []
+    for filename in sources:
+        pages.extend(load(filename))
+    print(f"\n⏳ Signing {len(pages)} pages from {len(sources)} files "
+          f"(threshold {threshold:.0%}, {bands} bands)...")
+
+    report = RunReport("near_duplicates")
+    with report.stage("find_near_duplicates", total=len(pages)) as stage:
+        result = find_near_duplicates(pages, threshold, bands, workers=workers, stage=stage)
+        dump(result, options["--out"], pretty=True)
+        stage.add_output(options["--out"])
+
+    clusters = result["clusters"]
+    print(f"✅ {result['candidate_pairs']:,} candidate pairs scored, {result['joining_pairs']:,} joined a cluster")
+    print(f"✅ {len(clusters)} clusters covering {result['pages_in_clusters']} of {len(pages)} pages")
+
+    if clusters:
+        bodies = {page["url"]: page.get("full_content") or "" for page in pages}
+        print(f"\n📊 Largest clusters:")
+        for cluster in clusters[:10]:
+            first, second = cluster["urls"][:2]
+            exact = page_similarity(bodies[first], bodies[second])
+            exact = f"{exact:.0%}" if exact is not None else "n/a"
+            print(f"   {cluster['size']:>4} pages, {cluster['min_similarity']:.0%}–{cluster['max_similarity']:.0%} "
+                  f"similar (exact {exact} for first pair): {first}")
+
+    print(f"\n💾 Saved: {options['--out']}")
+    report.write()
+
+
+if __name__ == "__main__":
+    main()
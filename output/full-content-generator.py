@@ -4,235 +4,24 @@ Shifa AlHind - Full SEO Content Generator
 Stage 2: Generate complete content, metadata, and deliverables
 """
 
-import json
 import csv
 import xml.etree.ElementTree as ET
-from datetime import datetime
 from typing import List, Dict
 import os
 
+from catalog import GCC_STRUCTURE, TREATMENTS
+from json_io import dump
+from json_ld import article_json_ld, city_json_ld, treatment_json_ld
+from compact_manifest import write_compact_manifest
+from manifest_io import MANIFEST_COMPACT, MANIFEST_JSON, MANIFEST_NDJSON, mark_current, write_ndjson
+from run_report import RunReport
+
 # Import config from previous script
 BRAND = {
     "name": "Shifa AlHind",
     "domain": "https://shifaalhind.com",
 }
 
-GCC_STRUCTURE = [
-    {
-        "country_slug": "saudi-arabia",
-        "country_name": "Saudi Arabia",
-        "country_name_ar": "المملكة العربية السعودية",
-        "cities": [
-            {"slug": "riyadh", "name": "Riyadh", "name_ar": "الرياض", "flight_time": "4.5 hours"},
-            {"slug": "jeddah", "name": "Jeddah", "name_ar": "جدة", "flight_time": "5 hours"},
-            {"slug": "dammam", "name": "Dammam", "name_ar": "الدمام", "flight_time": "4 hours"},
-        ],
-    },
-    {
-        "country_slug": "united-arab-emirates",
-        "country_name": "United Arab Emirates",
-        "country_name_ar": "الإمارات العربية المتحدة",
-        "cities": [
-            {"slug": "dubai", "name": "Dubai", "name_ar": "دبي", "flight_time": "3.5 hours"},
-            {"slug": "abu-dhabi", "name": "Abu Dhabi", "name_ar": "أبو ظبي", "flight_time": "3.5 hours"},
-            {"slug": "sharjah", "name": "Sharjah", "name_ar": "الشارقة", "flight_time": "3.5 hours"},
-        ],
-    },
-    {
-        "country_slug": "qatar",
-        "country_name": "Qatar",
-        "country_name_ar": "قطر",
-        "cities": [{"slug": "doha", "name": "Doha", "name_ar": "الدوحة", "flight_time": "3.5 hours"}],
-    },
-    {
-        "country_slug": "oman",
-        "country_name": "Oman",
-        "country_name_ar": "عُمان",
-        "cities": [{"slug": "muscat", "name": "Muscat", "name_ar": "مسقط", "flight_time": "3 hours"}],
-    },
-    {
-        "country_slug": "kuwait",
-        "country_name": "Kuwait",
-        "country_name_ar": "الكويت",
-        "cities": [{"slug": "kuwait-city", "name": "Kuwait City", "name_ar": "مدينة الكويت", "flight_time": "4 hours"}],
-    },
-    {
-        "country_slug": "bahrain",
-        "country_name": "Bahrain",
-        "country_name_ar": "البحرين",
-        "cities": [{"slug": "manama", "name": "Manama", "name_ar": "المنامة", "flight_time": "4 hours"}],
-    },
-]
-
-TREATMENTS = [
-    {
-        "slug": "heart-surgery",
-        "name": "Heart Surgery",
-        "name_ar": "جراحة القلب",
-        "cost_gcc_min": 25000,
-        "cost_gcc_max": 50000,
-        "cost_india_min": 5000,
-        "cost_india_max": 12000,
-        "savings_percent": "70-80%",
-    },
-    {
-        "slug": "knee-replacement",
-        "name": "Knee Replacement",
-        "name_ar": "استبدال الركبة",
-        "cost_gcc_min": 15000,
-        "cost_gcc_max": 30000,
-        "cost_india_min": 4000,
-        "cost_india_max": 8000,
-        "savings_percent": "65-75%",
-    },
-    {
-        "slug": "ivf",
-        "name": "IVF & Fertility Treatment",
-        "name_ar": "التلقيح الصناعي وعلاج الخصوبة",
-        "cost_gcc_min": 8000,
-        "cost_gcc_max": 15000,
-        "cost_india_min": 2500,
-        "cost_india_max": 5000,
-        "savings_percent": "60-70%",
-    },
-    {
-        "slug": "dental-implants",
-        "name": "Dental Implants",
-        "name_ar": "زراعة الأسنان",
-        "cost_gcc_min": 2000,
-        "cost_gcc_max": 5000,
-        "cost_india_min": 500,
-        "cost_india_max": 1500,
-        "savings_percent": "65-75%",
-    },
-    {
-        "slug": "hair-transplant",
-        "name": "Hair Transplant",
-        "name_ar": "زراعة الشعر",
-        "cost_gcc_min": 5000,
-        "cost_gcc_max": 15000,
-        "cost_india_min": 1500,
-        "cost_india_max": 4000,
-        "savings_percent": "65-75%",
-    },
-    {
-        "slug": "cosmetic-surgery",
-        "name": "Cosmetic Surgery",
-        "name_ar": "الجراحة التجميلية",
-        "cost_gcc_min": 8000,
-        "cost_gcc_max": 20000,
-        "cost_india_min": 2000,
-        "cost_india_max": 6000,
-        "savings_percent": "65-75%",
-    },
-    {
-        "slug": "oncology-treatment",
-        "name": "Cancer Treatment",
-        "name_ar": "علاج السرطان",
-        "cost_gcc_min": 30000,
-        "cost_gcc_max": 100000,
-        "cost_india_min": 8000,
-        "cost_india_max": 25000,
-        "savings_percent": "70-80%",
-    },
-    {
-        "slug": "bariatric-surgery",
-        "name": "Bariatric Surgery",
-        "name_ar": "جراحة السمنة",
-        "cost_gcc_min": 15000,
-        "cost_gcc_max": 30000,
-        "cost_india_min": 4000,
-        "cost_india_max": 8000,
-        "savings_percent": "65-75%",
-    },
-]
-
-
-def generate_json_ld_city(country, city, locale="en"):
-    """Generate JSON-LD for city landing page"""
-    is_ar = locale == "ar"
-    city_name = city["name_ar"] if is_ar else city["name"]
-
-    return {
-        "@context": "https://schema.org",
-        "@graph": [
-            {
-                "@type": "Organization",
-                "name": BRAND["name"],
-                "url": BRAND["domain"],
-                "logo": f"{BRAND['domain']}/logo.png",
-                "contactPoint": {
-                    "@type": "ContactPoint",
-                    "telephone": "+91-80-12345678",
-                    "contactType": "Customer Service",
-                    "areaServed": ["SA", "AE", "QA", "OM", "KW", "BH"],
-                    "availableLanguage": ["en", "ar"],
-                },
-            },
-            {
-                "@type": "BreadcrumbList",
-                "itemListElement": [
-                    {"@type": "ListItem", "position": 1, "name": "Home", "item": f"{BRAND['domain']}/{locale}"},
-                    {
-                        "@type": "ListItem",
-                        "position": 2,
-                        "name": "Medical Tourism",
-                        "item": f"{BRAND['domain']}/{locale}/medical-tourism",
-                    },
-                    {
-                        "@type": "ListItem",
-                        "position": 3,
-                        "name": city_name,
-                        "item": f"{BRAND['domain']}/{locale}/medical-tourism/{country['country_slug']}/{city['slug']}",
-                    },
-                ],
-            },
-        ],
-    }
-
-
-def generate_json_ld_treatment(country, city, treatment, locale="en"):
-    """Generate JSON-LD for treatment page"""
-    is_ar = locale == "ar"
-    city_name = city["name_ar"] if is_ar else city["name"]
-    treatment_name = treatment["name_ar"] if is_ar else treatment["name"]
-
-    return {
-        "@context": "https://schema.org",
-        "@graph": [
-            {
-                "@type": "MedicalProcedure",
-                "name": treatment_name,
-                "description": f"Affordable {treatment_name} in India for patients from {city_name}",
-                "procedureType": "Medical Procedure",
-            },
-            {
-                "@type": "BreadcrumbList",
-                "itemListElement": [
-                    {"@type": "ListItem", "position": 1, "name": "Home", "item": f"{BRAND['domain']}/{locale}"},
-                    {
-                        "@type": "ListItem",
-                        "position": 2,
-                        "name": "Medical Tourism",
-                        "item": f"{BRAND['domain']}/{locale}/medical-tourism",
-                    },
-                    {
-                        "@type": "ListItem",
-                        "position": 3,
-                        "name": city_name,
-                        "item": f"{BRAND['domain']}/{locale}/medical-tourism/{country['country_slug']}/{city['slug']}",
-                    },
-                    {
-                        "@type": "ListItem",
-                        "position": 4,
-                        "name": treatment_name,
-                        "item": f"{BRAND['domain']}/{locale}/medical-tourism/{country['country_slug']}/{city['slug']}/{treatment['slug']}",
-                    },
-                ],
-            },
-        ],
-    }
-
 
 def generate_keyword_matrix():
     """Generate comprehensive keyword matrix"""
@@ -350,38 +139,8 @@ def generate_article_slugs(treatment_slug):
     ])
 
 
-def generate_json_ld_article(country, city, treatment, article_slug, locale="en"):
-    """Generate JSON-LD for article page"""
-    is_ar = locale == "ar"
-    city_name = city["name_ar"] if is_ar else city["name"]
-    treatment_name = treatment["name_ar"] if is_ar else treatment["name"]
-    article_title = article_slug.replace('-', ' ').title()
-
-    return {
-        "@context": "https://schema.org",
-        "@type": "Article",
-        "headline": article_title,
-        "description": f"{treatment_name} guide for {city_name} patients",
-        "author": {
-            "@type": "Organization",
-            "name": BRAND["name"],
-        },
-        "publisher": {
-            "@type": "Organization",
-            "name": BRAND["name"],
-            "logo": {
-                "@type": "ImageObject",
-                "url": f"{BRAND['domain']}/logo.png",
-            },
-        },
-        "datePublished": "2025-01-01",
-        "dateModified": "2025-01-01",
-    }
-
-
-def generate_full_manifest():
-    """Generate complete content manifest for all 980 pages"""
-    manifest = []
+def iter_full_manifest():
+    """Yield every page of the full content manifest one at a time"""
     ARTICLES_PER_TREATMENT = 5
 
     for country in GCC_STRUCTURE:
@@ -399,11 +158,11 @@ def generate_full_manifest():
                     "title": f"{city_name} to India Medical Tourism — Affordable Healthcare | {BRAND['name']}" if not is_ar else f"السياحة العلاجية من {city_name} إلى الهند — رعاية صحية ميسورة | {BRAND['name']}",
                     "meta_desc": f"Trusted medical tourism from {city_name} to India. Save 60-70%, JCI hospitals, Arabic support." if not is_ar else f"السياحة العلاجية الموثوقة من {city_name} إلى الهند. وفر 60-70٪.",
                     "h1": f"Medical Tourism from {city_name} to India" if not is_ar else f"السياحة العلاجية من {city_name} إلى الهند",
-                    "json_ld": json.dumps(generate_json_ld_city(country, city, locale)),
+                    "json_ld": city_json_ld(country, city, locale),
                     "needs_native_review": is_ar,
                     "status": "draft",
                 }
-                manifest.append(page)
+                yield page
 
             # Treatment landing pages (EN + AR)
             for treatment in TREATMENTS:
@@ -420,12 +179,12 @@ def generate_full_manifest():
                         "title": f"{city_name} {treatment_name} in India — Trusted & Affordable | {BRAND['name']}" if not is_ar else f"{treatment_name} في الهند من {city_name} — موثوق وبأسعار معقولة | {BRAND['name']}",
                         "meta_desc": f"Get {treatment_name} in India from {city_name}. 60-70% savings, top hospitals." if not is_ar else f"احصل على {treatment_name} في الهند من {city_name}. توفير 60-70٪.",
                         "h1": f"{treatment_name} in India for {city_name} Patients" if not is_ar else f"{treatment_name} في الهند لمرضى {city_name}",
-                        "json_ld": json.dumps(generate_json_ld_treatment(country, city, treatment, locale)),
+                        "json_ld": treatment_json_ld(country, city, treatment, locale),
                         "needs_native_review": is_ar,
                         "needs_medical_review": True,
                         "status": "draft",
                     }
-                    manifest.append(page)
+                    yield page
 
                 # Article pages (5 per treatment, EN + AR)
                 article_slugs = generate_article_slugs(treatment["slug"])
@@ -444,14 +203,26 @@ def generate_full_manifest():
                             "title": f"{article_title} - {city_name} to India | {BRAND['name']}" if not is_ar else f"{article_title} - من {city_name} إلى الهند | {BRAND['name']}",
                             "meta_desc": f"{treatment_name} guide for {city_name} patients. Costs, hospitals, process." if not is_ar else f"دليل {treatment_name} لمرضى {city_name}.",
                             "h1": article_title,
-                            "json_ld": json.dumps(generate_json_ld_article(country, city, treatment, article_slug, locale)),
+                            "json_ld": article_json_ld(country, city, treatment, article_slug, locale),
                             "needs_native_review": is_ar,
                             "needs_medical_review": True,
                             "status": "draft",
                         }
-                        manifest.append(page)
+                        yield page
+
+
+def generate_full_manifest():
+    """Generate complete content manifest for all 980 pages"""
+    return list(iter_full_manifest())
+
 
-    return manifest
+def write_keyword_matrix(keywords, filename="keyword_matrix.csv"):
+    """Save the keyword matrix as CSV"""
+    with open(filename, "w", newline="", encoding="utf-8") as f:
+        if keywords:
+            writer = csv.DictWriter(f, fieldnames=keywords[0].keys())
+            writer.writeheader()
+            writer.writerows(keywords)
 
 
 def generate_sample_html(page_type="treatment"):
@@ -555,50 +326,57 @@ def main():
     print("Shifa AlHind - Full SEO Content Generator (Stage 2)")
     print("=" * 70)
 
+    report = RunReport("seo_content")
+
     # Generate keyword matrix
     print("\n⏳ Generating keyword matrix...")
-    keywords = generate_keyword_matrix()
-    with open("keyword_matrix.csv", "w", newline="", encoding="utf-8") as f:
-        if keywords:
-            writer = csv.DictWriter(f, fieldnames=keywords[0].keys())
-            writer.writeheader()
-            writer.writerows(keywords)
+    with report.stage("keyword_matrix") as stage:
+        keywords = generate_keyword_matrix()
+        write_keyword_matrix(keywords)
+        stage.advance(len(keywords))
+        stage.add_output("keyword_matrix.csv")
     print(f"✅ Saved: keyword_matrix.csv ({len(keywords)} keywords)")
 
     # Generate sample HTML
     print("\n⏳ Generating sample HTML previews...")
     os.makedirs("sample_previews", exist_ok=True)
 
-    with open("sample_previews/treatment_sample_en.html", "w", encoding="utf-8") as f:
-        f.write(generate_sample_html("treatment"))
+    with report.stage("sample_html") as stage:
+        with open("sample_previews/treatment_sample_en.html", "w", encoding="utf-8") as f:
+            f.write(generate_sample_html("treatment"))
+        stage.advance()
+        stage.add_output("sample_previews/treatment_sample_en.html")
     print("✅ Saved: sample_previews/treatment_sample_en.html")
 
     # Generate full content manifest (sample - first city only)
     print("\n⏳ Generating content manifest (sample)...")
-    manifest = []
-
-    country = GCC_STRUCTURE[1]  # UAE
-    city = country["cities"][0]  # Dubai
-
-    for treatment in TREATMENTS:
-        for locale in ["en", "ar"]:
-            page = {
-                "url": f"{BRAND['domain']}/{locale}/medical-tourism/{country['country_slug']}/{city['slug']}/{treatment['slug']}",
-                "locale": locale,
-                "slug": treatment["slug"],
-                "page_type": "treatment_landing",
-                "title": f"{city['name']} {treatment['name']} in India — Trusted & Affordable | {BRAND['name']}" if locale == "en" else f"{treatment['name_ar']} في الهند من {city['name_ar']} — موثوق وبأسعار معقولة | {BRAND['name']}",
-                "meta_desc": f"Get {treatment['name']} in India from {city['name']}. 60-70% savings, top hospitals, Arabic coordinators, visa support." if locale == "en" else f"احصل على {treatment['name_ar']} في الهند من {city['name_ar']}. توفير 60-70٪.",
-                "h1": f"{treatment['name']} in India for {city['name']} Patients" if locale == "en" else f"{treatment['name_ar']} في الهند لمرضى {city['name_ar']}",
-                "json_ld": json.dumps(generate_json_ld_treatment(country, city, treatment, locale)),
-                "needs_native_review": locale == "ar",
-                "needs_medical_review": True,
-                "status": "draft",
-            }
-            manifest.append(page)
-
-    with open("content_manifest_sample.json", "w", encoding="utf-8") as f:
-        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    with report.stage("sample_manifest") as stage:
+        manifest = []
+
+        country = GCC_STRUCTURE[1]  # UAE
+        city = country["cities"][0]  # Dubai
+
+        for treatment in TREATMENTS:
+            for locale in ["en", "ar"]:
+                page = {
+                    "url": f"{BRAND['domain']}/{locale}/medical-tourism/{country['country_slug']}/{city['slug']}/{treatment['slug']}",
+                    "locale": locale,
+                    "slug": treatment["slug"],
+                    "page_type": "treatment_landing",
+                    "title": f"{city['name']} {treatment['name']} in India — Trusted & Affordable | {BRAND['name']}" if locale == "en" else f"{treatment['name_ar']} في الهند من {city['name_ar']} — موثوق وبأسعار معقولة | {BRAND['name']}",
+                    "meta_desc": f"Get {treatment['name']} in India from {city['name']}. 60-70% savings, top hospitals, Arabic coordinators, visa support." if locale == "en" else f"احصل على {treatment['name_ar']} في الهند من {city['name_ar']}. توفير 60-70٪.",
+                    "h1": f"{treatment['name']} in India for {city['name']} Patients" if locale == "en" else f"{treatment['name_ar']} في الهند لمرضى {city['name_ar']}",
+                    "json_ld": treatment_json_ld(country, city, treatment, locale),
+                    "needs_native_review": locale == "ar",
+                    "needs_medical_review": True,
+                    "status": "draft",
+                }
+                manifest.append(page)
+
+        # Review copy, so always indented
+        dump(manifest, "content_manifest_sample.json", pretty=True)
+        stage.advance(len(manifest))
+        stage.add_output("content_manifest_sample.json")
     print(f"✅ Saved: content_manifest_sample.json ({len(manifest)} pages)")
 
     print("\n🎉 Stage 2 Complete!")
@@ -609,7 +387,11 @@ def main():
 
     print(f"\n📝 To Generate Full Content (980 pages):")
     print(f"   Run with --full flag: python3 full-content-generator.py --full")
-    print(f"   Warning: This will take 10-15 minutes")
+    print(f"   Or stream to NDJSON: python3 full-content-generator.py --full --ndjson")
+    print(f"   Or write the compact format: python3 full-content-generator.py --full --compact")
+    print(f"   Warning: This will take 10-15 minutes\n")
+
+    report.write()
 
 
 if __name__ == "__main__":
@@ -619,19 +401,58 @@ if __name__ == "__main__":
         print("Shifa AlHind - FULL Content Generator")
         print("=" * 70)
 
-        print("\n⏳ Generating FULL content manifest (980 pages)...")
-        print("   This may take 10-15 minutes...\n")
+        report = RunReport("manifest")
+
+        if "--ndjson" in sys.argv:
+            print("\n⏳ Streaming FULL content manifest to NDJSON...")
+
+            with report.stage("manifest_ndjson") as stage:
+                count = write_ndjson(iter_full_manifest(), MANIFEST_NDJSON)
+                mark_current(MANIFEST_NDJSON)
+                stage.advance(count)
+                stage.add_output(MANIFEST_NDJSON)
+
+            print(f"✅ Saved: {MANIFEST_NDJSON} ({count} pages)")
+
+            print("\n🎉 FULL Generation Complete!")
+            print(f"\n📦 Deliverable:")
+            print(f"   ✅ {MANIFEST_NDJSON} - ALL {count} pages, one JSON page per line")
+
+        elif "--compact" in sys.argv:
+            print("\n⏳ Writing FULL content manifest in the compact format...")
+
+            with report.stage("manifest_compact") as stage:
+                counts = write_compact_manifest(iter_full_manifest(), MANIFEST_COMPACT)
+                mark_current(MANIFEST_COMPACT)
+                stage.advance(counts["pages"])
+                stage.add_output(MANIFEST_COMPACT)
+
+            print(f"✅ Saved: {MANIFEST_COMPACT} ({counts['pages']} pages, {counts['bytes']:,} bytes)")
+
+            print("\n🎉 FULL Generation Complete!")
+            print(f"\n📦 Deliverable:")
+            print(f"   ✅ {MANIFEST_COMPACT} - ALL {counts['pages']} pages, dictionary-encoded")
+
+        else:
+            print("\n⏳ Generating FULL content manifest (980 pages)...")
+            print("   This may take 10-15 minutes...\n")
+
+            with report.stage("manifest") as stage:
+                manifest = generate_full_manifest()
 
-        manifest = generate_full_manifest()
+                dump(manifest, MANIFEST_JSON)
+                mark_current(MANIFEST_JSON)
+                stage.advance(len(manifest))
+                stage.add_output(MANIFEST_JSON)
 
-        with open("content_manifest_full.json", "w", encoding="utf-8") as f:
-            json.dump(manifest, f, indent=2, ensure_ascii=False)
+            print(f"✅ Saved: content_manifest_full.json ({len(manifest)} pages)")
 
-        print(f"✅ Saved: content_manifest_full.json ({len(manifest)} pages)")
+            print("\n🎉 FULL Generation Complete!")
+            print(f"\n📦 Deliverable:")
+            print(f"   ✅ content_manifest_full.json - ALL 980 pages with SEO metadata & JSON-LD")
 
-        print("\n🎉 FULL Generation Complete!")
-        print(f"\n📦 Deliverable:")
-        print(f"   ✅ content_manifest_full.json - ALL 980 pages with SEO metadata & JSON-LD")
+        print()
+        report.write()
 
     else:
         main()
@@ -4,158 +4,121 @@ Shifa AlHind - Interlinking Structure Generator
 Creates internal linking strategy for SEO
 """
 
-import json
 from typing import List, Dict
 
+from json_io import dump
+from manifest_io import load_manifest
+from page_index import PageIndex
+
 BRAND = {
     "name": "Shifa AlHind",
     "domain": "https://shifaalhind.com",
 }
 
 
-def generate_interlinking_structure():
+def treatment_anchor(page, locale):
+    """Treatment name from a treatment landing page's H1"""
+    return page["h1"].split(" in India")[0] if locale == "en" else page["h1"].split(" في الهند")[0]
+
+
+def city_anchor(page, locale):
+    """City name from a city landing page's H1"""
+    if locale == "en":
+        return page["h1"].split(" to India")[0].replace("Medical Tourism from ", "")
+    return page["h1"].split(" إلى الهند")[0].replace("السياحة العلاجية من ", "")
+
+
+def generate_interlinking_structure(all_pages=None):
     """Generate comprehensive interlinking structure"""
     interlinks = []
 
-    # Load the full content manifest
-    with open("content_manifest_full.json", "r", encoding="utf-8") as f:
-        all_pages = json.load(f)
+    # Load the full content manifest (NDJSON or JSON)
+    if all_pages is None:
+        all_pages = load_manifest()
 
-    # Create page index by type and locale
-    pages_by_type = {}
-    for page in all_pages:
-        key = f"{page['page_type']}_{page['locale']}"
-        if key not in pages_by_type:
-            pages_by_type[key] = []
-        pages_by_type[key].append(page)
+    # country → city → treatment → article tree, built once
+    index = PageIndex(all_pages)
 
     # Generate interlinks for each page type
     for page in all_pages:
+        locale = page["locale"]
         page_interlinks = {
             "source_url": page["url"],
             "page_type": page["page_type"],
-            "locale": page["locale"],
+            "locale": locale,
             "internal_links": [],
         }
+        links = page_interlinks["internal_links"]
 
         if page["page_type"] == "city_landing":
             # City pages link to:
             # 1. Homepage
             # 2. All treatment pages for this city
-            # 3. Related city pages (same country)
 
-            page_interlinks["internal_links"].append({
-                "url": f"{BRAND['domain']}/{page['locale']}",
-                "anchor_text": "Home" if page["locale"] == "en" else "الرئيسية",
+            links.append({
+                "url": f"{BRAND['domain']}/{locale}",
+                "anchor_text": "Home" if locale == "en" else "الرئيسية",
                 "link_type": "navigation",
             })
 
-            # Link to treatment pages for this city
-            for other_page in all_pages:
-                if (
-                    other_page["page_type"] == "treatment_landing"
-                    and other_page["locale"] == page["locale"]
-                    and page["slug"] in other_page["url"]
-                ):
-                    treatment_name = other_page["h1"].split(" in India")[0] if page["locale"] == "en" else other_page["h1"].split(" في الهند")[0]
-                    page_interlinks["internal_links"].append({
-                        "url": other_page["url"],
-                        "anchor_text": treatment_name,
-                        "link_type": "related_treatment",
-                    })
+            for treatment_page in index.children(page["url"], "treatment_landing"):
+                links.append({
+                    "url": treatment_page["url"],
+                    "anchor_text": treatment_anchor(treatment_page, locale),
+                    "link_type": "related_treatment",
+                })
 
         elif page["page_type"] == "treatment_landing":
             # Treatment pages link to:
             # 1. City landing page
-            # 2. Homepage
-            # 3. All article pages for this treatment
-            # 4. Related treatment pages (same city)
-
-            # Extract city slug from URL
-            url_parts = page["url"].split("/")
-            city_slug = url_parts[-2]
-            country_slug = url_parts[-3]
-
-            # Link to city page
-            city_page_url = f"{BRAND['domain']}/{page['locale']}/medical-tourism/{country_slug}/{city_slug}"
-            for other_page in all_pages:
-                if other_page["url"] == city_page_url:
-                    city_name = other_page["h1"].split(" to India")[0].replace("Medical Tourism from ", "") if page["locale"] == "en" else other_page["h1"].split(" إلى الهند")[0].replace("السياحة العلاجية من ", "")
-                    page_interlinks["internal_links"].append({
-                        "url": other_page["url"],
-                        "anchor_text": f"{city_name} Medical Tourism" if page["locale"] == "en" else f"السياحة العلاجية {city_name}",
-                        "link_type": "parent_page",
-                    })
-
-            # Link to article pages for this treatment
-            article_count = 0
-            for other_page in all_pages:
-                if (
-                    other_page["page_type"] == "article"
-                    and other_page["locale"] == page["locale"]
-                    and city_slug in other_page["url"]
-                    and page["slug"] in other_page["url"]
-                    and article_count < 5
-                ):
-                    page_interlinks["internal_links"].append({
-                        "url": other_page["url"],
-                        "anchor_text": other_page["h1"],
-                        "link_type": "related_article",
-                    })
-                    article_count += 1
+            # 2. Article pages for this treatment (max 5)
+
+            city_page = index.parent(page["url"])
+            if city_page and city_page["page_type"] == "city_landing":
+                city_name = city_anchor(city_page, locale)
+                links.append({
+                    "url": city_page["url"],
+                    "anchor_text": f"{city_name} Medical Tourism" if locale == "en" else f"السياحة العلاجية {city_name}",
+                    "link_type": "parent_page",
+                })
+
+            for article in index.children(page["url"], "article")[:5]:
+                links.append({
+                    "url": article["url"],
+                    "anchor_text": article["h1"],
+                    "link_type": "related_article",
+                })
 
         elif page["page_type"] == "article":
             # Article pages link to:
             # 1. Treatment landing page
             # 2. City landing page
-            # 3. Other articles for same treatment
-            # 4. Homepage
-
-            # Extract slugs from URL
-            url_parts = page["url"].split("/")
-            treatment_slug = url_parts[-2]
-            city_slug = url_parts[-3]
-            country_slug = url_parts[-4]
-
-            # Link to treatment page
-            treatment_page_url = f"{BRAND['domain']}/{page['locale']}/medical-tourism/{country_slug}/{city_slug}/{treatment_slug}"
-            for other_page in all_pages:
-                if other_page["url"] == treatment_page_url:
-                    treatment_name = other_page["h1"].split(" in India")[0] if page["locale"] == "en" else other_page["h1"].split(" في الهند")[0]
-                    page_interlinks["internal_links"].append({
-                        "url": other_page["url"],
-                        "anchor_text": treatment_name,
-                        "link_type": "parent_page",
-                    })
-
-            # Link to city page
-            city_page_url = f"{BRAND['domain']}/{page['locale']}/medical-tourism/{country_slug}/{city_slug}"
-            for other_page in all_pages:
-                if other_page["url"] == city_page_url:
-                    city_name = other_page["h1"].split(" to India")[0].replace("Medical Tourism from ", "") if page["locale"] == "en" else other_page["h1"].split(" إلى الهند")[0].replace("السياحة العلاجية من ", "")
-                    page_interlinks["internal_links"].append({
-                        "url": other_page["url"],
-                        "anchor_text": city_name,
-                        "link_type": "breadcrumb",
-                    })
-
-            # Link to other articles (max 3)
-            article_count = 0
-            for other_page in all_pages:
-                if (
-                    other_page["page_type"] == "article"
-                    and other_page["locale"] == page["locale"]
-                    and city_slug in other_page["url"]
-                    and treatment_slug in other_page["url"]
-                    and other_page["url"] != page["url"]
-                    and article_count < 3
-                ):
-                    page_interlinks["internal_links"].append({
-                        "url": other_page["url"],
-                        "anchor_text": other_page["h1"],
-                        "link_type": "related_article",
-                    })
-                    article_count += 1
+            # 3. Other articles for same treatment (max 3)
+
+            treatment_page = index.parent(page["url"])
+            if treatment_page and treatment_page["page_type"] == "treatment_landing":
+                links.append({
+                    "url": treatment_page["url"],
+                    "anchor_text": treatment_anchor(treatment_page, locale),
+                    "link_type": "parent_page",
+                })
+                city_page = index.parent(treatment_page["url"])
+            else:
+                city_page = treatment_page
+
+            if city_page and city_page["page_type"] == "city_landing":
+                links.append({
+                    "url": city_page["url"],
+                    "anchor_text": city_anchor(city_page, locale),
+                    "link_type": "breadcrumb",
+                })
+
+            for article in index.siblings(page["url"], "article")[:3]:
+                links.append({
+                    "url": article["url"],
+                    "anchor_text": article["h1"],
+                    "link_type": "related_article",
+                })
 
         interlinks.append(page_interlinks)
 
@@ -171,8 +134,7 @@ def main():
 
     interlinks = generate_interlinking_structure()
 
-    with open("interlink_structure.json", "w", encoding="utf-8") as f:
-        json.dump(interlinks, f, indent=2, ensure_ascii=False)
+    dump(interlinks, "interlink_structure.json")
 
     print(f"✅ Saved: interlink_structure.json ({len(interlinks)} pages)")
 
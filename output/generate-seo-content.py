@@ -9,6 +9,8 @@ import csv
 from datetime import datetime
 from typing import List, Dict
 
+from catalog import GCC_STRUCTURE, TREATMENTS
+
 # Configuration from YAML
 BRAND = {
     "name": "Shifa AlHind",
@@ -17,64 +19,6 @@ BRAND = {
     "alt_locale": "ar",
 }
 
-GCC_STRUCTURE = [
-    {
-        "country_slug": "saudi-arabia",
-        "country_name": "Saudi Arabia",
-        "country_name_ar": "المملكة العربية السعودية",
-        "cities": [
-            {"slug": "riyadh", "name": "Riyadh", "name_ar": "الرياض"},
-            {"slug": "jeddah", "name": "Jeddah", "name_ar": "جدة"},
-            {"slug": "dammam", "name": "Dammam", "name_ar": "الدمام"},
-        ],
-    },
-    {
-        "country_slug": "united-arab-emirates",
-        "country_name": "United Arab Emirates",
-        "country_name_ar": "الإمارات العربية المتحدة",
-        "cities": [
-            {"slug": "dubai", "name": "Dubai", "name_ar": "دبي"},
-            {"slug": "abu-dhabi", "name": "Abu Dhabi", "name_ar": "أبو ظبي"},
-            {"slug": "sharjah", "name": "Sharjah", "name_ar": "الشارقة"},
-        ],
-    },
-    {
-        "country_slug": "qatar",
-        "country_name": "Qatar",
-        "country_name_ar": "قطر",
-        "cities": [{"slug": "doha", "name": "Doha", "name_ar": "الدوحة"}],
-    },
-    {
-        "country_slug": "oman",
-        "country_name": "Oman",
-        "country_name_ar": "عُمان",
-        "cities": [{"slug": "muscat", "name": "Muscat", "name_ar": "مسقط"}],
-    },
-    {
-        "country_slug": "kuwait",
-        "country_name": "Kuwait",
-        "country_name_ar": "الكويت",
-        "cities": [{"slug": "kuwait-city", "name": "Kuwait City", "name_ar": "مدينة الكويت"}],
-    },
-    {
-        "country_slug": "bahrain",
-        "country_name": "Bahrain",
-        "country_name_ar": "البحرين",
-        "cities": [{"slug": "manama", "name": "Manama", "name_ar": "المنامة"}],
-    },
-]
-
-TREATMENTS = [
-    {"slug": "heart-surgery", "name": "Heart Surgery", "name_ar": "جراحة القلب"},
-    {"slug": "knee-replacement", "name": "Knee Replacement", "name_ar": "استبدال الركبة"},
-    {"slug": "ivf", "name": "IVF & Fertility Treatment", "name_ar": "التلقيح الصناعي وعلاج الخصوبة"},
-    {"slug": "dental-implants", "name": "Dental Implants", "name_ar": "زراعة الأسنان"},
-    {"slug": "hair-transplant", "name": "Hair Transplant", "name_ar": "زراعة الشعر"},
-    {"slug": "cosmetic-surgery", "name": "Cosmetic Surgery", "name_ar": "الجراحة التجميلية"},
-    {"slug": "oncology-treatment", "name": "Cancer Treatment", "name_ar": "علاج السرطان"},
-    {"slug": "bariatric-surgery", "name": "Bariatric Surgery", "name_ar": "جراحة السمنة"},
-]
-
 ARTICLES_PER_TREATMENT = 5
 
 
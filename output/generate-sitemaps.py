@@ -4,95 +4,113 @@ Shifa AlHind - XML Sitemap Generator
 Generates XML sitemaps for SEO
 """
 
-import json
-from datetime import datetime
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
+import os
+import sys
+
+from manifest_io import iter_manifest
+from reproducible import build_time
+from sitemap_writer import MAX_BYTES, MAX_URLS, ShardedSitemapWriter, existing_shards, write_sitemap_index
 
 BRAND = {
     "domain": "https://shifaalhind.com",
 }
 
+# Shard basenames written by write_sitemaps()
+SITEMAP_BASENAMES = ["sitemap_en", "sitemap_ar", "sitemap"]
+SITEMAP_INDEX = "sitemap_index.xml"
 
-def prettify_xml(elem):
-    """Return a pretty-printed XML string for the Element."""
-    rough_string = ET.tostring(elem, encoding='utf-8')
-    reparsed = minidom.parseString(rough_string)
-    return reparsed.toprettyxml(indent="  ", encoding="utf-8").decode("utf-8")
+# Determine priority based on page type
+PRIORITY_MAP = {
+    "city_landing": "0.8",
+    "treatment_landing": "0.7",
+    "article": "0.6",
+}
 
 
-def generate_sitemap(pages, filename, locale=None):
-    """Generate XML sitemap for given pages"""
-    urlset = ET.Element("urlset")
-    urlset.set("xmlns", "http://www.sitemaps.org/schemas/sitemap/0.9")
-    urlset.set("xmlns:xhtml", "http://www.w3.org/1999/xhtml")
+def add_page(writer, page, lastmod):
+    """Write one manifest page (with hreflang alternates) to a sitemap writer"""
+    # Find alternate language version
+    alternate_locale = "ar" if page["locale"] == "en" else "en"
+    alternate_url = page["url"].replace(f"/{page['locale']}/", f"/{alternate_locale}/")
 
-    for page in pages:
-        if locale and page["locale"] != locale:
-            continue
+    writer.add(
+        page["url"],
+        PRIORITY_MAP.get(page["page_type"], "0.5"),
+        "weekly" if page["page_type"] != "article" else "monthly",
+        lastmod,
+        [
+            # Self reference
+            (page["locale"], page["url"]),
+            # Alternate language
+            (alternate_locale, alternate_url),
+        ],
+    )
 
-        url = ET.SubElement(urlset, "url")
 
-        loc = ET.SubElement(url, "loc")
-        loc.text = page["url"]
+def generate_sitemap(pages, basename, locale=None, max_urls=MAX_URLS, max_bytes=MAX_BYTES, compress=False):
+    """Stream XML sitemap shards for given pages, returns the shard filenames"""
+    lastmod = build_time().strftime("%Y-%m-%d")
 
-        # Determine priority based on page type
-        priority_map = {
-            "city_landing": "0.8",
-            "treatment_landing": "0.7",
-            "article": "0.6",
-        }
+    with ShardedSitemapWriter(basename, max_urls, max_bytes, compress) as writer:
+        for page in pages:
+            if locale and page["locale"] != locale:
+                continue
+            add_page(writer, page, lastmod)
 
-        priority = ET.SubElement(url, "priority")
-        priority.text = priority_map.get(page["page_type"], "0.5")
+    return writer.shards
 
-        changefreq = ET.SubElement(url, "changefreq")
-        changefreq.text = "weekly" if page["page_type"] != "article" else "monthly"
 
-        lastmod = ET.SubElement(url, "lastmod")
-        lastmod.text = datetime.now().strftime("%Y-%m-%d")
+def generate_sitemap_index(sitemap_files):
+    """Generate sitemap index file"""
+    write_sitemap_index(
+        SITEMAP_INDEX,
+        [f"{BRAND['domain']}/{os.path.basename(sitemap_file)}" for sitemap_file in sitemap_files],
+        build_time().strftime("%Y-%m-%d"),
+    )
 
-        # Add alternate language links (hreflang)
-        # Find alternate language version
-        alternate_locale = "ar" if page["locale"] == "en" else "en"
-        alternate_url = page["url"].replace(f"/{page['locale']}/", f"/{alternate_locale}/")
 
-        # Self reference
-        xhtml_link_self = ET.SubElement(url, "xhtml:link")
-        xhtml_link_self.set("rel", "alternate")
-        xhtml_link_self.set("hreflang", page["locale"])
-        xhtml_link_self.set("href", page["url"])
+def write_sitemaps(pages, max_urls=MAX_URLS, max_bytes=MAX_BYTES, compress=False):
+    """Stream pages into EN, AR and master sitemaps plus the index, returns (locale writers, master writer)"""
+    lastmod = build_time().strftime("%Y-%m-%d")
 
-        # Alternate language
-        xhtml_link_alt = ET.SubElement(url, "xhtml:link")
-        xhtml_link_alt.set("rel", "alternate")
-        xhtml_link_alt.set("hreflang", alternate_locale)
-        xhtml_link_alt.set("href", alternate_url)
+    en, ar, everything = SITEMAP_BASENAMES
+    writers = {
+        "en": ShardedSitemapWriter(en, max_urls, max_bytes, compress),
+        "ar": ShardedSitemapWriter(ar, max_urls, max_bytes, compress),
+    }
+    master = ShardedSitemapWriter(everything, max_urls, max_bytes, compress)
 
-    # Write to file
-    xml_string = prettify_xml(urlset)
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(xml_string)
+    for page in pages:
+        if page["locale"] in writers:
+            add_page(writers[page["locale"]], page, lastmod)
+        add_page(master, page, lastmod)
 
+    index_files = []
+    for locale, writer in writers.items():
+        shards = writer.close()
+        index_files.extend(shards)
+        print(f"✅ Saved: {', '.join(shards)} ({writer.url_count} URLs)")
 
-def generate_sitemap_index(sitemap_files):
-    """Generate sitemap index file"""
-    sitemapindex = ET.Element("sitemapindex")
-    sitemapindex.set("xmlns", "http://www.sitemaps.org/schemas/sitemap/0.9")
+    master_shards = master.close()
+    print(f"✅ Saved: {', '.join(master_shards)} ({master.url_count} URLs)")
+
+    # Sitemap index lists every EN & AR shard
+    generate_sitemap_index(index_files)
+    print(f"✅ Saved: sitemap_index.xml ({len(index_files)} sitemaps)")
 
-    for sitemap_file in sitemap_files:
-        sitemap = ET.SubElement(sitemapindex, "sitemap")
+    return writers, master
 
-        loc = ET.SubElement(sitemap, "loc")
-        loc.text = f"{BRAND['domain']}/{sitemap_file}"
 
-        lastmod = ET.SubElement(sitemap, "lastmod")
-        lastmod.text = datetime.now().strftime("%Y-%m-%d")
+def sitemap_files(compress=False):
+    """Every file the last write_sitemaps() run wrote: shards, then the index"""
+    return [shard for basename in SITEMAP_BASENAMES for shard in existing_shards(basename, compress)] + [SITEMAP_INDEX]
 
-    # Write to file
-    xml_string = prettify_xml(sitemapindex)
-    with open("sitemap_index.xml", "w", encoding="utf-8") as f:
-        f.write(xml_string)
+
+def get_arg(name, default):
+    """Read `--name VALUE` from the command line"""
+    if name in sys.argv:
+        return int(sys.argv[sys.argv.index(name) + 1])
+    return default
 
 
 def main():
@@ -100,37 +118,20 @@ def main():
     print("Shifa AlHind - XML Sitemap Generator")
     print("=" * 70)
 
-    # Load full content manifest
-    with open("content_manifest_full.json", "r", encoding="utf-8") as f:
-        all_pages = json.load(f)
+    max_urls = get_arg("--max-urls", MAX_URLS)
+    max_bytes = get_arg("--max-bytes", MAX_BYTES)
+    compress = "--gzip" in sys.argv
 
-    # Generate separate sitemaps
+    # Generate separate sitemaps in a single streaming pass over the manifest
     print("\n⏳ Generating XML sitemaps...")
-
-    # English sitemap
-    en_pages = [p for p in all_pages if p["locale"] == "en"]
-    generate_sitemap(en_pages, "sitemap_en.xml", "en")
-    print(f"✅ Saved: sitemap_en.xml ({len(en_pages)} URLs)")
-
-    # Arabic sitemap
-    ar_pages = [p for p in all_pages if p["locale"] == "ar"]
-    generate_sitemap(ar_pages, "sitemap_ar.xml", "ar")
-    print(f"✅ Saved: sitemap_ar.xml ({len(ar_pages)} URLs)")
-
-    # Master sitemap (all pages)
-    generate_sitemap(all_pages, "sitemap.xml")
-    print(f"✅ Saved: sitemap.xml ({len(all_pages)} URLs)")
-
-    # Sitemap index
-    print("\n⏳ Generating sitemap index...")
-    generate_sitemap_index(["sitemap_en.xml", "sitemap_ar.xml"])
-    print("✅ Saved: sitemap_index.xml")
+    writers, master = write_sitemaps(iter_manifest(), max_urls, max_bytes, compress)
+    master_shards = master.shards
 
     print("\n🎉 XML Sitemaps Complete!")
     print(f"\n📦 Deliverables:")
-    print(f"   ✅ sitemap.xml - Master sitemap (980 URLs)")
-    print(f"   ✅ sitemap_en.xml - English sitemap (490 URLs)")
-    print(f"   ✅ sitemap_ar.xml - Arabic sitemap (490 URLs)")
+    print(f"   ✅ {master_shards[0]} - Master sitemap ({master.url_count} URLs)")
+    print(f"   ✅ {writers['en'].shards[0]} - English sitemap ({writers['en'].url_count} URLs)")
+    print(f"   ✅ {writers['ar'].shards[0]} - Arabic sitemap ({writers['ar'].url_count} URLs)")
     print(f"   ✅ sitemap_index.xml - Sitemap index")
 
     print(f"\n📝 Next Steps:")
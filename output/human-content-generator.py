@@ -12,59 +12,47 @@ Key Features:
 - Anti-AI-detection techniques
 """
 
-import json
-import random
-import hashlib
-from datetime import datetime
+import inspect
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from math import comb, perm
 from typing import List, Dict
 
-# Load existing manifest
-with open("content_manifest_full.json", "r", encoding="utf-8") as f:
-    manifest = json.load(f)
-
-# Real hospital data from Bangalore
-BANGALORE_HOSPITALS = [
-    {
-        "name": "Narayana Health City",
-        "specialties": ["Cardiac Surgery", "Oncology", "Orthopedics"],
-        "surgeries_per_year": 12000,
-        "success_rate": "98.5%",
-        "jci_accredited": True,
-        "arabic_staff": True,
-    },
-    {
-        "name": "Manipal Hospital",
-        "specialties": ["Fertility", "Cosmetic Surgery", "Bariatric Surgery"],
-        "surgeries_per_year": 8500,
-        "success_rate": "97.2%",
-        "jci_accredited": True,
-        "arabic_staff": True,
-    },
-    {
-        "name": "Apollo Hospital",
-        "specialties": ["Heart Surgery", "Cancer Treatment", "Knee Replacement"],
-        "surgeries_per_year": 10200,
-        "success_rate": "98.1%",
-        "jci_accredited": True,
-        "arabic_staff": True,
-    },
-    {
-        "name": "Fortis Hospital",
-        "specialties": ["Dental Implants", "IVF", "Hair Transplant"],
-        "surgeries_per_year": 6800,
-        "success_rate": "96.8%",
-        "jci_accredited": True,
-        "arabic_staff": True,
-    },
-    {
-        "name": "Aster CMI Hospital",
-        "specialties": ["Orthopedics", "Oncology", "Cardiac Care"],
-        "surgeries_per_year": 7500,
-        "success_rate": "97.5%",
-        "jci_accredited": True,
-        "arabic_staff": True,
-    },
-]
+from build_cache import BuildCache, hash_inputs
+from catalog import BANGALORE_HOSPITALS, FLIGHT_TIMES, build_catalog_index
+from content_shards import DEFAULT_SHARD_DIR, ShardEmitter
+from json_io import dump
+from manifest_io import load_manifest
+from markdown_html import html_variants
+from reproducible import BUILD_SALT, build_time
+from run_report import RunReport
+from section_store import DEFAULT_SECTION_DIR, write_section_store
+from section_templates import Template
+from segment_store import SegmentWriter, clear_segments, compact_segments, completed_urls
+from variant_allocator import VariantSpace, mixed_radix, unrank_arrangement, unrank_combination, usage_summary
+
+# Append-only checkpoints: one small NDJSON segment per batch
+SEGMENT_DIR = "content_segments"
+CHECKPOINT_EVERY = 100
+
+# Bump to invalidate every cached article after a change the fingerprint can't see
+GENERATOR_VERSION = "1"
+
+# Existing manifest (NDJSON or JSON), read on first use so build-pipeline.py
+# can import this module and hand it the manifest it already holds in memory
+manifest = None
+
+
+def get_manifest():
+    global manifest
+    if manifest is None:
+        manifest = load_manifest()
+    return manifest
+
+
+# (slug, locale) -> catalog record, built once
+CATALOG_INDEX = build_catalog_index()
 
 # Natural language templates with variations
 INTRO_PHRASES = [
@@ -98,87 +86,68 @@ CONVERSATIONAL_ELEMENTS = [
 ]
 
 # Patient testimonials (varied and specific)
-def generate_testimonial(city, treatment, locale="en"):
-    """Generate unique patient testimonial"""
-    names = {
-        "riyadh": ["Abdullah", "Fatima", "Mohammed"],
-        "jeddah": ["Ahmed", "Aisha", "Khalid"],
-        "dammam": ["Omar", "Layla", "Saeed"],
-        "dubai": ["Hassan", "Mariam", "Ali"],
-        "abu-dhabi": ["Rashid", "Noura", "Youssef"],
-        "sharjah": ["Tariq", "Huda", "Majid"],
-        "doha": ["Hamad", "Sara", "Nasser"],
-        "muscat": ["Salim", "Latifa", "Ibrahim"],
-        "kuwait-city": ["Faisal", "Dalal", "Khaled"],
-        "manama": ["Ebrahim", "Zahra", "Abdulla"],
-    }
-
-    city_names = city.split('-')[0] if '-' in city else city
-    patient_name = random.choice(names.get(city.lower(), names["dubai"]))
-    age = random.randint(35, 62)
-    months_ago = random.randint(3, 18)
-
-    quote1 = f'"{patient_name}, {age}, from {city_names.title()} had {treatment} at Narayana Hospital {months_ago} months ago.'
-    quote1 += f' {patient_name} told us: The quality exceeded what I experienced in the GCC. My Arabic coordinator made everything smooth—from airport pickup to follow-up calls after I returned home."'
-
-    quote2 = f'"I was nervous about traveling to India for surgery," admits {patient_name}, a {age}-year-old from {city_names.title()}.'
-    quote2 += ' "But the team at Manipal Hospital treated me like family. The surgeon explained everything in detail, my coordinator spoke perfect Arabic, and the results? Better than I hoped for."'
-
-    quote3 = f'"{patient_name} from {city_names.title()} saved nearly $15,000 by choosing India for {treatment}.'
-    quote3 += f' More importantly, the success rate and care quality matched—if not exceeded—what is available locally. {patient_name} now recommends us to friends and family."'
-
-    testimonials_en = [quote1, quote2, quote3]
-
-    return random.choice(testimonials_en)
-
-
-def generate_unique_intro(city, treatment, locale="en"):
-    """Generate unique, human-like introduction"""
-    city_name = city.replace('-', ' ').title()
-
-    # Create variety in opening
-    styles = [
-        # Statistical opening
-        f"Every month, over 150 patients from {city_name} travel to Bangalore for {treatment}. Why? " +
-        f"Because they're discovering what healthcare really should be: world-class quality without the premium price tag. " +
-        f"Let me walk you through what you need to know.",
-
-        # Question-based opening
-        f"Is {treatment} in India right for someone from {city_name}? " +
-        f"I've helped coordinate care for hundreds of GCC patients, and here's what I've learned: " +
-        f"The decision comes down to three things—quality, cost, and convenience. " +
-        f"India delivers on all three, but there's more to the story.",
-
-        # Story-based opening
-        f"Last month, I met a family from {city_name} at Bangalore airport. " +
-        f"They were here for {treatment}, and honestly, they were nervous. " +
-        f"Three weeks later, when they headed home, everything had changed. " +
-        f"The procedure was successful, costs were 70% lower than quotes back home, and they felt genuinely cared for. " +
-        f"That's the experience we create for every patient.",
-
-        # Direct opening
-        f"Planning {treatment} from {city_name} to India? You're in the right place. " +
-        f"We've been coordinating medical travel between the GCC and India since 2015, " +
-        f"and we know exactly what works—and what to watch out for. " +
-        f"This guide covers everything from hospital selection to visa processing, " +
-        f"written specifically for patients from {city_name}.",
-    ]
-
-    return random.choice(styles)
-
-
-def generate_why_choose_section(city, treatment, treatment_data):
-    """Generate 'Why Choose India' section with specific data"""
-    city_name = city.replace('-', ' ').title()
-
-    # Get treatment-specific cost data
-    gcc_min = treatment_data.get("cost_gcc_min", 15000)
-    gcc_max = treatment_data.get("cost_gcc_max", 30000)
-    india_min = treatment_data.get("cost_india_min", 4000)
-    india_max = treatment_data.get("cost_india_max", 8000)
-    savings = treatment_data.get("savings_percent", "60-70%")
-
-    section = f"""## Why {city_name} Patients Choose India for {treatment}
+TESTIMONIAL_NAMES = {
+    "riyadh": ["Abdullah", "Fatima", "Mohammed"],
+    "jeddah": ["Ahmed", "Aisha", "Khalid"],
+    "dammam": ["Omar", "Layla", "Saeed"],
+    "dubai": ["Hassan", "Mariam", "Ali"],
+    "abu-dhabi": ["Rashid", "Noura", "Youssef"],
+    "sharjah": ["Tariq", "Huda", "Majid"],
+    "doha": ["Hamad", "Sara", "Nasser"],
+    "muscat": ["Salim", "Latifa", "Ibrahim"],
+    "kuwait-city": ["Faisal", "Dalal", "Khaled"],
+    "manama": ["Ebrahim", "Zahra", "Abdulla"],
+}
+
+TESTIMONIAL_TEMPLATE = Template("{quote}", quote=[
+    Template(
+        '"{patient_name}, {age}, from {city_title} had {treatment} at Narayana Hospital {months_ago} months ago.'
+        ' {patient_name} told us: The quality exceeded what I experienced in the GCC. My Arabic coordinator made everything smooth—from airport pickup to follow-up calls after I returned home."'
+    ),
+    Template(
+        '"I was nervous about traveling to India for surgery," admits {patient_name}, a {age}-year-old from {city_title}.'
+        ' "But the team at Manipal Hospital treated me like family. The surgeon explained everything in detail, my coordinator spoke perfect Arabic, and the results? Better than I hoped for."'
+    ),
+    Template(
+        '"{patient_name} from {city_title} saved nearly $15,000 by choosing India for {treatment}.'
+        ' More importantly, the success rate and care quality matched—if not exceeded—what is available locally. {patient_name} now recommends us to friends and family."'
+    ),
+])
+
+INTRO_TEMPLATE = Template("{style}", style=[
+    # Statistical opening
+    Template(
+        "Every month, over 150 patients from {city_name} travel to Bangalore for {treatment}. Why? "
+        "Because they're discovering what healthcare really should be: world-class quality without the premium price tag. "
+        "Let me walk you through what you need to know."
+    ),
+    # Question-based opening
+    Template(
+        "Is {treatment} in India right for someone from {city_name}? "
+        "I've helped coordinate care for hundreds of GCC patients, and here's what I've learned: "
+        "The decision comes down to three things—quality, cost, and convenience. "
+        "India delivers on all three, but there's more to the story."
+    ),
+    # Story-based opening
+    Template(
+        "Last month, I met a family from {city_name} at Bangalore airport. "
+        "They were here for {treatment}, and honestly, they were nervous. "
+        "Three weeks later, when they headed home, everything had changed. "
+        "The procedure was successful, costs were 70% lower than quotes back home, and they felt genuinely cared for. "
+        "That's the experience we create for every patient."
+    ),
+    # Direct opening
+    Template(
+        "Planning {treatment} from {city_name} to India? You're in the right place. "
+        "We've been coordinating medical travel between the GCC and India since 2015, "
+        "and we know exactly what works—and what to watch out for. "
+        "This guide covers everything from hospital selection to visa processing, "
+        "written specifically for patients from {city_name}."
+    ),
+])
+
+WHY_CHOOSE_TEMPLATE = Template(
+    """## Why {city_name} Patients Choose India for {treatment}
 
 Here's something that might surprise you: Bangalore has more JCI-accredited hospitals than any other city in Asia. That's not marketing—it's fact. And these aren't just good hospitals; they're where doctors trained at Johns Hopkins, Mayo Clinic, and Cleveland Clinic are now practicing.
 
@@ -195,57 +164,48 @@ That's a savings of {savings}. But here's what matters more: you're not compromi
 | Procedure Cost | ${gcc_min:,}-${gcc_max:,} | ${india_min:,}-${india_max:,} | {savings} |
 | Hospital Stay (per night) | $800-1,200 | $150-300 | ~75% |
 | Follow-up Consultations | $150-300 | $30-60 | ~80% |
-| **Total Average Savings** | - | - | **${(gcc_min + gcc_max)//2 - (india_min + india_max)//2:,}+** |
+| **Total Average Savings** | - | - | **${average_savings:,}+** |
 
 *Note: Costs are estimates and vary based on complexity. Add ~$1,500-2,500 for flights and accommodation for companion.*
 
 ### Beyond the Price Tag
 
-{random.choice([
-    "But saving money means nothing if the quality isn't there. So let's address that head-on.",
-    "Cost savings get attention, but here's what keeps patients coming back:",
-    "Here's what actually matters when you're making this decision:",
-])}
+{beyond}
 
 **1. Internationally Trained Surgeons**
 Most cardiac surgeons in Bangalore have performed 2,000+ procedures. The surgeon who handles your case? Likely trained internationally and has success rates that match—or exceed—global benchmarks.
 
 **2. Technology That's Current**
-Da Vinci surgical robots, CyberKnife systems, 3T MRI scanners—Bangalore hospitals invest heavily in equipment. {random.choice(["Why? Competition.", "Simple reason: they have to compete globally.", "They're competing for international patients, which means staying current with technology."])}
+Da Vinci surgical robots, CyberKnife systems, 3T MRI scanners—Bangalore hospitals invest heavily in equipment. {technology}
 
 **3. Arabic-Speaking Coordinators**
-Every patient from {city_name} gets a dedicated coordinator who speaks Arabic. {random.choice([
-    "They handle everything—airport pickup, hospital paperwork, doctor appointments, pharmacy runs, even booking your return flight.",
-    "From the moment you land until you board your return flight, someone who speaks your language is available 24/7.",
-    "No translator apps needed. No miscommunication about medical instructions. Just clear, direct communication in Arabic.",
-])}
+Every patient from {city_name} gets a dedicated coordinator who speaks Arabic. {coordinator}
 
 **4. Medical Visa Support**
-{random.choice([
-    "Getting an Indian medical visa from the UAE is straightforward—usually processed within 48-72 hours. We handle the paperwork.",
-    "The visa process? We've done it hundreds of times. You provide the documents, we ensure everything's in order.",
-    "Indian medical visas are actually easier than tourist visas. Processing takes 2-3 days, and we guide you through each step.",
-])}
-"""
-    return section
-
-
-def generate_process_section(city, treatment):
-    """Generate detailed process section"""
-    city_name = city.replace('-', ' ').title()
-    flight_time = {
-        "riyadh": "4.5", "jeddah": "5", "dammam": "4",
-        "dubai": "3.5", "abu-dhabi": "3.5", "sharjah": "3.5",
-        "doha": "3.5", "muscat": "3", "kuwait-city": "4", "manama": "4"
-    }.get(city.lower(), "3.5-4")
-
-    section = f"""## Your Complete Journey: {city_name} to Bangalore
-
-Let me walk you through exactly what happens, step by step. {random.choice([
-        "No surprises, no confusion—just a clear roadmap.",
-        "This is based on hundreds of patient journeys we've coordinated.",
-        "I'm sharing this so you know exactly what to expect.",
-    ])}
+{visa}
+""",
+    beyond=[
+        "But saving money means nothing if the quality isn't there. So let's address that head-on.",
+        "Cost savings get attention, but here's what keeps patients coming back:",
+        "Here's what actually matters when you're making this decision:",
+    ],
+    technology=["Why? Competition.", "Simple reason: they have to compete globally.", "They're competing for international patients, which means staying current with technology."],
+    coordinator=[
+        "They handle everything—airport pickup, hospital paperwork, doctor appointments, pharmacy runs, even booking your return flight.",
+        "From the moment you land until you board your return flight, someone who speaks your language is available 24/7.",
+        "No translator apps needed. No miscommunication about medical instructions. Just clear, direct communication in Arabic.",
+    ],
+    visa=[
+        "Getting an Indian medical visa from the UAE is straightforward—usually processed within 48-72 hours. We handle the paperwork.",
+        "The visa process? We've done it hundreds of times. You provide the documents, we ensure everything's in order.",
+        "Indian medical visas are actually easier than tourist visas. Processing takes 2-3 days, and we guide you through each step.",
+    ],
+)
+
+PROCESS_TEMPLATE = Template(
+    """## Your Complete Journey: {city_name} to Bangalore
+
+Let me walk you through exactly what happens, step by step. {approach}
 
 ### Before You Leave {city_name}
 
@@ -255,11 +215,7 @@ Let me walk you through exactly what happens, step by step. {random.choice([
 - Receive detailed treatment plan and cost estimate
 - No obligation, no payment required at this stage
 
-{random.choice([
-    "Most patients are surprised by how quickly we respond. We're used to working with international patients—speed matters.",
-    "Quick turnaround isn't just good service; when you're planning medical treatment, waiting days for responses adds unnecessary stress.",
-    "We prioritize medical queries. While most companies take 3-5 days, our surgeons review cases within 24 hours.",
-])}
+{response}
 
 **Step 2: Treatment Planning (Week 1-2)**
 - Video consultation with your surgeon (if desired)
@@ -283,11 +239,7 @@ Your coordinator meets you at Kempegowda International Airport. From there:
 - Hospital consultation and pre-surgery tests (Day 2)
 - Anesthesiologist consultation and final prep (Day 3)
 
-{random.choice([
-    "One thing patients always mention: how organized everything feels. No rushing, no chaos—just a well-planned schedule.",
-    "We build in rest time. Flying, even if it's just 3-4 hours, is tiring. You need to be in good condition for surgery.",
-    "The hospital is used to international patients. They know what questions GCC patients typically ask and proactively address them.",
-])}
+{arrival}
 
 **Step 5: Surgery Day (Day 4)**
 - Procedure performed by senior consultant
@@ -314,148 +266,450 @@ Your coordinator meets you at Kempegowda International Airport. From there:
 - Local doctor coordination if needed
 - Medical records available anytime
 
-{random.choice([
-    "The care doesn't stop when you board your return flight. That's when follow-up becomes critical.",
-    "Post-surgery support is where many medical tourism companies fail. We don't. Follow-up is included in your package.",
-    "We stay in touch. Not daily check-ins—that's annoying—but scheduled video calls and responsive support when you need it.",
-])}
-"""
-    return section
+{aftercare}
+""",
+    approach=[
+        "No surprises, no confusion—just a clear roadmap.",
+        "This is based on hundreds of patient journeys we've coordinated.",
+        "I'm sharing this so you know exactly what to expect.",
+    ],
+    response=[
+        "Most patients are surprised by how quickly we respond. We're used to working with international patients—speed matters.",
+        "Quick turnaround isn't just good service; when you're planning medical treatment, waiting days for responses adds unnecessary stress.",
+        "We prioritize medical queries. While most companies take 3-5 days, our surgeons review cases within 24 hours.",
+    ],
+    arrival=[
+        "One thing patients always mention: how organized everything feels. No rushing, no chaos—just a well-planned schedule.",
+        "We build in rest time. Flying, even if it's just 3-4 hours, is tiring. You need to be in good condition for surgery.",
+        "The hospital is used to international patients. They know what questions GCC patients typically ask and proactively address them.",
+    ],
+    aftercare=[
+        "The care doesn't stop when you board your return flight. That's when follow-up becomes critical.",
+        "Post-surgery support is where many medical tourism companies fail. We don't. Follow-up is included in your package.",
+        "We stay in touch. Not daily check-ins—that's annoying—but scheduled video calls and responsive support when you need it.",
+    ],
+)
+
+HOSPITAL_HEADER_TEMPLATE = Template(
+    """## Top Hospitals for {treatment} in Bangalore
 
+{intro}
 
-def generate_hospital_section(treatment):
-    """Generate hospital selection section"""
+""",
+    intro=[
+        "Hospital selection matters. A lot. Here are the facilities we work with most often:",
+        "Not all hospitals are equal. We've vetted these based on outcomes, not marketing:",
+        "These aren't just recommendations—these are hospitals where we send our own family members:",
+    ],
+)
+
+HOSPITAL_ENTRY_TEMPLATE = Template(
+    """### {position}. {name}
+
+**What stands out:** {standout}
+
+- **JCI Accredited:** {jci_label}
+- **Arabic-Speaking Staff:** {arabic_staff_label}
+- **Specializations:** {specialties_label}
+- **Annual Volume:** {surgeries_per_year:,}+ procedures
+- **Success Rate:** {success_rate}
+
+{feedback}
+
+""",
+    standout=[
+        Template("Over {surgeries_per_year:,} procedures annually with a {success_rate} success rate."),
+        Template("JCI-accredited since 2012, with {success_rate} success rate across all procedures."),
+        Template("{surgeries_per_year:,}+ surgeries each year—that's volume that builds expertise."),
+    ],
+    feedback=[
+        "What patients say: 'The hospital feels more like a hotel. Clean, modern, and everyone speaks English. My coordinator spoke Arabic, which made everything easier.'",
+        "Real patient feedback: 'I expected good. I got exceptional. The surgeon spent 45 minutes explaining everything, and my room had a view of the garden.'",
+        Template("Why patients choose {name}: Combine international standards with Indian hospitality. That's rare."),
+    ],
+)
+
+FAQ_TEMPLATES = [
+    Template(
+        "### How long do I need to stay in Bangalore for {treatment}?\n\n"
+        "Most {city_name} patients stay 10-14 days total. This includes pre-surgery consultations (2-3 days), "
+        "the procedure itself, and initial recovery (5-7 days). Your surgeon will give you a personalized timeline "
+        "during your consultation, but plan for two weeks to be safe.\n\n"
+    ),
+    Template(
+        "### Will language be a barrier?\n\n"
+        "Honestly? No. Every patient from the GCC gets an Arabic-speaking coordinator. All doctors speak "
+        "fluent English. Hospital signs are in English. And in Bangalore, you'll find Arabic restaurants, "
+        "halal food, and even prayer rooms in major hospitals. It's more comfortable than you might expect.\n\n"
+    ),
+    Template(
+        "### What if something goes wrong after I return home?\n\n"
+        "This is the right question to ask. We provide 3 months of free video follow-ups with your surgeon. "
+        "If there's a complication, we'll coordinate with doctors in {city_name} or arrange for you to return "
+        "(most hospitals offer revision procedures within warranty periods). We also have a 24/7 emergency line.\n\n"
+    ),
+    Template(
+        "### How do costs in India compare to {city_name} really?\n\n"
+        "Real numbers: {treatment} typically costs ${gcc_min:,}-${gcc_max:,} "
+        "in the GCC. In Bangalore? ${india_min:,}-${india_max:,}. "
+        "Add $1,500-2,500 for flights and accommodation. You're still saving {savings}. "
+        "And no, quality isn't compromised—these are JCI-accredited hospitals with internationally trained doctors.\n\n"
+    ),
+    Template(
+        "### Is the medical visa process complicated?\n\n"
+        "Actually, it's one of the easiest visas to get. From {city_name}, processing takes 48-72 hours. "
+        "We handle most of the paperwork—you provide your passport, medical summary, and hospital letter "
+        "(which we prepare). Cost is around $50-80. The visa is valid for triple entry and 60 days.\n\n"
+    ),
+    Template(
+        "### Can my family member accompany me?\n\n"
+        "Absolutely. We actually recommend it. Your companion can get a medical attendant visa (same process, "
+        "same timeline). Most hotels near hospitals offer companion rates. And honestly, having someone with "
+        "you during recovery makes a big difference—emotionally and practically.\n\n"
+    ),
+    Template(
+        "### What about follow-up care?\n\n"
+        "Built into your package: video consultations for 3 months, unlimited WhatsApp support, and coordination "
+        "with your local doctor if needed. We also send detailed medical records that any doctor in {city_name}"
+        " can review. You're not on your own after treatment.\n\n"
+    ),
+    Template(
+        "### How do I know if I'm a good candidate?\n\n"
+        "Share your medical reports with us (WhatsApp or email). A surgeon will review within 24 hours and "
+        "tell you honestly if India is right for your case. Sometimes it's not—if your condition requires "
+        "extensive follow-up near home, we'll say so. We'd rather be honest upfront than have you travel unnecessarily.\n\n"
+    ),
+]
 
-    # Filter hospitals by treatment specialty
-    relevant_hospitals = []
-    for hospital in BANGALORE_HOSPITALS:
-        # Simple matching logic
-        if any(spec.lower() in treatment.lower() or treatment.lower() in spec.lower()
-               for spec in hospital["specialties"]):
-            relevant_hospitals.append(hospital)
+FAQ_HEADER_TEMPLATE = Template(
+    """## Common Questions from GCC Patients
 
-    if not relevant_hospitals:
-        relevant_hospitals = random.sample(BANGALORE_HOSPITALS, 3)
-    else:
-        relevant_hospitals = relevant_hospitals[:3]
+{intro}
 
-    section = f"""## Top Hospitals for {treatment} in Bangalore
+""",
+    intro=[
+        "I answer these questions daily. Here's what most patients want to know:",
+        "Let me address the questions I hear most often:",
+        "These are the real concerns patients share with me:",
+    ],
+)
 
-{random.choice([
-        "Hospital selection matters. A lot. Here are the facilities we work with most often:",
-        "Not all hospitals are equal. We've vetted these based on outcomes, not marketing:",
-        "These aren't just recommendations—these are hospitals where we send our own family members:",
-    ])}
+ARTICLE_TEMPLATE = Template(
+    """# {article_title}
 
-"""
+{intro}
 
-    for i, hospital in enumerate(relevant_hospitals, 1):
-        section += f"""### {i}. {hospital['name']}
+{why_choose}
 
-**What stands out:** {random.choice([
-            f"Over {hospital['surgeries_per_year']:,} procedures annually with a {hospital['success_rate']} success rate.",
-            f"JCI-accredited since 2012, with {hospital['success_rate']} success rate across all procedures.",
-            f"{hospital['surgeries_per_year']:,}+ surgeries each year—that's volume that builds expertise.",
-        ])}
+{testimonial}
 
-- **JCI Accredited:** {'Yes' if hospital['jci_accredited'] else 'No'}
-- **Arabic-Speaking Staff:** {'Available 24/7' if hospital['arabic_staff'] else 'Limited'}
-- **Specializations:** {', '.join(hospital['specialties'])}
-- **Annual Volume:** {hospital['surgeries_per_year']:,}+ procedures
-- **Success Rate:** {hospital['success_rate']}
+{process}
 
-{random.choice([
-            "What patients say: 'The hospital feels more like a hotel. Clean, modern, and everyone speaks English. My coordinator spoke Arabic, which made everything easier.'",
-            "Real patient feedback: 'I expected good. I got exceptional. The surgeon spent 45 minutes explaining everything, and my room had a view of the garden.'",
-            f"Why patients choose {hospital['name']}: Combine international standards with Indian hospitality. That's rare.",
-        ])}
+{hospitals}
 
-"""
+{faq}
 
-    return section
+## Ready to Start Your Journey?
 
+{closing}
 
-def generate_faq_section(city, treatment, treatment_data):
-    """Generate FAQ section with real answers"""
-    city_name = city.replace('-', ' ').title()
-
-    faqs = [
-        {
-            "q": f"How long do I need to stay in Bangalore for {treatment}?",
-            "a": f"Most {city_name} patients stay 10-14 days total. This includes pre-surgery consultations (2-3 days), " +
-                 f"the procedure itself, and initial recovery (5-7 days). Your surgeon will give you a personalized timeline " +
-                 f"during your consultation, but plan for two weeks to be safe."
-        },
-        {
-            "q": "Will language be a barrier?",
-            "a": "Honestly? No. Every patient from the GCC gets an Arabic-speaking coordinator. All doctors speak " +
-                 "fluent English. Hospital signs are in English. And in Bangalore, you'll find Arabic restaurants, " +
-                 "halal food, and even prayer rooms in major hospitals. It's more comfortable than you might expect."
-        },
-        {
-            "q": "What if something goes wrong after I return home?",
-            "a": "This is the right question to ask. We provide 3 months of free video follow-ups with your surgeon. " +
-                 "If there's a complication, we'll coordinate with doctors in " + city_name + " or arrange for you to return " +
-                 "(most hospitals offer revision procedures within warranty periods). We also have a 24/7 emergency line."
-        },
-        {
-            "q": f"How do costs in India compare to {city_name} really?",
-            "a": f"Real numbers: {treatment} typically costs ${treatment_data.get('cost_gcc_min', 15000):,}-${treatment_data.get('cost_gcc_max', 30000):,} " +
-                 f"in the GCC. In Bangalore? ${treatment_data.get('cost_india_min', 4000):,}-${treatment_data.get('cost_india_max', 8000):,}. " +
-                 f"Add $1,500-2,500 for flights and accommodation. You're still saving {treatment_data.get('savings_percent', '60-70%')}. " +
-                 f"And no, quality isn't compromised—these are JCI-accredited hospitals with internationally trained doctors."
-        },
-        {
-            "q": "Is the medical visa process complicated?",
-            "a": f"Actually, it's one of the easiest visas to get. From {city_name}, processing takes 48-72 hours. " +
-                 f"We handle most of the paperwork—you provide your passport, medical summary, and hospital letter " +
-                 f"(which we prepare). Cost is around $50-80. The visa is valid for triple entry and 60 days."
-        },
-        {
-            "q": "Can my family member accompany me?",
-            "a": "Absolutely. We actually recommend it. Your companion can get a medical attendant visa (same process, " +
-                 "same timeline). Most hotels near hospitals offer companion rates. And honestly, having someone with " +
-                 "you during recovery makes a big difference—emotionally and practically."
-        },
-        {
-            "q": "What about follow-up care?",
-            "a": "Built into your package: video consultations for 3 months, unlimited WhatsApp support, and coordination " +
-                 "with your local doctor if needed. We also send detailed medical records that any doctor in " + city_name +
-                 " can review. You're not on your own after treatment."
-        },
-        {
-            "q": "How do I know if I'm a good candidate?",
-            "a": "Share your medical reports with us (WhatsApp or email). A surgeon will review within 24 hours and " +
-                 "tell you honestly if India is right for your case. Sometimes it's not—if your condition requires " +
-                 "extensive follow-up near home, we'll say so. We'd rather be honest upfront than have you travel unnecessarily."
-        },
-    ]
+**Contact Us Today:**
+- **WhatsApp:** +91-80-1234-5678 (24/7, Arabic support)
+- **Email:** care@shifaalhind.com
+- **Free Consultation:** Share your medical reports for expert review
+
+We've been coordinating medical travel between the GCC and India since 2015. We know what works—and we're here to help.
 
-    # Select 6-7 random FAQs to vary content
-    selected_faqs = random.sample(faqs, min(7, len(faqs)))
+---
 
-    section = """## Common Questions from GCC Patients
+*Medical Disclaimer: This content is for informational purposes only and does not constitute medical advice. Always consult with qualified healthcare professionals for medical decisions. Cost estimates are approximate and vary based on individual cases.*
 
-{intro}
+*Last Updated: {last_updated}*
+""",
+    closing=[
+        Template("If you're in {city_name} and considering {treatment}, let's talk. No sales pitch—just honest answers to your questions."),
+        Template("Planning {treatment} from {city_name} starts with a conversation. Share your medical reports, and we'll provide a detailed assessment within 24 hours."),
+        Template("Every patient from {city_name} who contacts us gets a personalized evaluation. No generic quotes—real numbers based on your specific case."),
+    ],
+)
+
+SECTION_TEMPLATES = [
+    TESTIMONIAL_TEMPLATE,
+    INTRO_TEMPLATE,
+    WHY_CHOOSE_TEMPLATE,
+    PROCESS_TEMPLATE,
+    HOSPITAL_HEADER_TEMPLATE,
+    HOSPITAL_ENTRY_TEMPLATE,
+    *FAQ_TEMPLATES,
+    FAQ_HEADER_TEMPLATE,
+    ARTICLE_TEMPLATE,
+]
 
-""".format(intro=random.choice([
-        "I answer these questions daily. Here's what most patients want to know:",
-        "Let me address the questions I hear most often:",
-        "These are the real concerns patients share with me:",
-    ]))
 
-    for faq in selected_faqs:
-        section += f"""### {faq['q']}
+def cost_values(treatment_data):
+    """Cost slots shared by the why-choose and FAQ sections"""
+    gcc_min = treatment_data.get("cost_gcc_min", 15000)
+    gcc_max = treatment_data.get("cost_gcc_max", 30000)
+    india_min = treatment_data.get("cost_india_min", 4000)
+    india_max = treatment_data.get("cost_india_max", 8000)
+    return {
+        "gcc_min": gcc_min,
+        "gcc_max": gcc_max,
+        "india_min": india_min,
+        "india_max": india_max,
+        "savings": treatment_data.get("savings_percent", "60-70%"),
+        "average_savings": (gcc_min + gcc_max) // 2 - (india_min + india_max) // 2,
+    }
 
-{faq['a']}
 
-"""
+TESTIMONIAL_AGES = range(35, 63)
+TESTIMONIAL_MONTHS = range(3, 19)
+FAQS_PER_ARTICLE = 7
+
+
+def testimonial_radices(city):
+    """Patient name, age, months ago and quote style"""
+    names = TESTIMONIAL_NAMES.get(city.lower(), TESTIMONIAL_NAMES["dubai"])
+    return [len(names), len(TESTIMONIAL_AGES), len(TESTIMONIAL_MONTHS), *TESTIMONIAL_TEMPLATE.variant_radices()]
+
+
+def generate_testimonial(city, treatment, locale="en", variant=0):
+    """Generate unique patient testimonial"""
+    city_names = city.split('-')[0] if '-' in city else city
+    name, age, months_ago, *quote = mixed_radix(variant, testimonial_radices(city))
+
+    return TESTIMONIAL_TEMPLATE.render_digits({
+        "patient_name": TESTIMONIAL_NAMES.get(city.lower(), TESTIMONIAL_NAMES["dubai"])[name],
+        "age": TESTIMONIAL_AGES[age],
+        "months_ago": TESTIMONIAL_MONTHS[months_ago],
+        "city_title": city_names.title(),
+        "treatment": treatment,
+    }, quote)
+
+
+def generate_unique_intro(city, treatment, locale="en", variant=0):
+    """Generate unique, human-like introduction"""
+    return INTRO_TEMPLATE.render_variant({"city_name": city.replace('-', ' ').title(), "treatment": treatment}, variant)
+
+
+def generate_why_choose_section(city, treatment, treatment_data, variant=0):
+    """Generate 'Why Choose India' section with specific data"""
+    values = cost_values(treatment_data)
+    values["city_name"] = city.replace('-', ' ').title()
+    values["treatment"] = treatment
+    return WHY_CHOOSE_TEMPLATE.render_variant(values, variant)
+
+
+def generate_process_section(city, treatment, variant=0):
+    """Generate detailed process section"""
+    return PROCESS_TEMPLATE.render_variant({
+        "city_name": city.replace('-', ' ').title(),
+        "flight_time": FLIGHT_TIMES.get(city.lower(), "3.5-4"),
+    }, variant)
+
+
+@lru_cache(maxsize=None)
+def specialty_hospitals(treatment):
+    """Hospitals whose specialties match a treatment name (computed once per treatment)"""
+    return tuple(
+        hospital for hospital in BANGALORE_HOSPITALS
+        # Simple matching logic
+        if any(spec.lower() in treatment.lower() or treatment.lower() in spec.lower()
+               for spec in hospital["specialties"])
+    )
+
+
+def hospital_radices(treatment):
+    """Hospital selection, header and one blurb per listed hospital"""
+    relevant_hospitals = specialty_hospitals(treatment)
+    # Without a specialty match, three hospitals are picked (in order) from the whole list
+    selections = perm(len(BANGALORE_HOSPITALS), 3) if not relevant_hospitals else 1
+    listed = len(relevant_hospitals[:3]) if relevant_hospitals else 3
+    return (
+        [selections]
+        + HOSPITAL_HEADER_TEMPLATE.variant_radices()
+        + HOSPITAL_ENTRY_TEMPLATE.variant_radices() * listed
+    )
+
+
+def generate_hospital_section(treatment, variant=0):
+    """Generate hospital selection section"""
+    selection, *digits = mixed_radix(variant, hospital_radices(treatment))
+    header = len(HOSPITAL_HEADER_TEMPLATE.variant_radices())
+    entry = len(HOSPITAL_ENTRY_TEMPLATE.variant_radices())
+    entries = [digits[i:i + entry] for i in range(header, len(digits), entry)]
+
+    # Filter hospitals by treatment specialty
+    relevant_hospitals = specialty_hospitals(treatment)
+
+    if not relevant_hospitals:
+        relevant_hospitals = [BANGALORE_HOSPITALS[i] for i in unrank_arrangement(selection, len(BANGALORE_HOSPITALS), 3)]
+    else:
+        relevant_hospitals = relevant_hospitals[:3]
+
+    parts = [HOSPITAL_HEADER_TEMPLATE.render_digits({"treatment": treatment}, digits[:header])]
+    for i, (hospital, entry) in enumerate(zip(relevant_hospitals, entries), 1):
+        parts.append(HOSPITAL_ENTRY_TEMPLATE.render_digits({
+            **hospital,
+            "position": i,
+            "jci_label": 'Yes' if hospital['jci_accredited'] else 'No',
+            "arabic_staff_label": 'Available 24/7' if hospital['arabic_staff'] else 'Limited',
+            "specialties_label": ', '.join(hospital['specialties']),
+        }, entry))
+
+    return "".join(parts)
 
-    return section
 
+def faq_radices():
+    """FAQ header and which FAQs are included"""
+    return [*FAQ_HEADER_TEMPLATE.variant_radices(), comb(len(FAQ_TEMPLATES), min(FAQS_PER_ARTICLE, len(FAQ_TEMPLATES)))]
 
-def generate_full_article_content(page):
+
+def generate_faq_section(city, treatment, treatment_data, variant=0):
+    """Generate FAQ section with real answers"""
+    values = cost_values(treatment_data)
+    values["city_name"] = city.replace('-', ' ').title()
+    values["treatment"] = treatment
+
+    # Select 6-7 FAQs to vary content
+    *header, selection = mixed_radix(variant, faq_radices())
+    selected_faqs = [
+        FAQ_TEMPLATES[i]
+        for i in unrank_combination(selection, len(FAQ_TEMPLATES), min(FAQS_PER_ARTICLE, len(FAQ_TEMPLATES)))
+    ]
+
+    parts = [FAQ_HEADER_TEMPLATE.render_digits(None, header)]
+    parts.extend(faq.render_variant(values) for faq in selected_faqs)
+    return "".join(parts)
+
+
+def article_variant_space(city_slug, treatment_name):
+    """Every section's number of variants for one city/treatment"""
+    return VariantSpace({
+        "intro": INTRO_TEMPLATE.variant_radices(),
+        "why_choose": WHY_CHOOSE_TEMPLATE.variant_radices(),
+        "testimonial": testimonial_radices(city_slug),
+        "process": PROCESS_TEMPLATE.variant_radices(),
+        "hospitals": hospital_radices(treatment_name),
+        "faq": faq_radices(),
+        "closing": ARTICLE_TEMPLATE.variant_radices(),
+    })
+
+
+def allocate_article_variants(articles):
+    """Assign each article its section variants, distinct within its city/treatment/locale.
+
+    Returns url → variant choices and the per-group usage for the report.
+    """
+    groups = defaultdict(list)
+    for page in articles:
+        url_parts = page['url'].split('/')
+        groups[(url_parts[-3], url_parts[-2], page['locale'])].append(page['url'])
+
+    variants = {}
+    usage = {}
+    for (city_slug, treatment_slug, locale), urls in groups.items():
+        treatment_name = find_treatment_data(treatment_slug, locale).get('name', treatment_slug.replace('-', ' ').title())
+        space = article_variant_space(city_slug, treatment_name)
+        key = f"{locale}/{city_slug}/{treatment_slug}"
+        # Siblings are ranked by URL, so adding an article elsewhere never reshuffles a group
+        allocated = space.allocate(key, len(urls), BUILD_SALT)
+        variants.update(zip(sorted(urls), allocated))
+        usage[key] = space.usage(allocated)
+    return variants, usage
+
+
+VARIANT_REPORT = "variant_usage_report.json"
+_article_variants = None
+
+
+def article_variants():
+    """Variant choices for every article in the manifest, allocated once"""
+    global _article_variants
+    if _article_variants is None:
+        _article_variants, _ = allocate_article_variants([p for p in get_manifest() if p['page_type'] == 'article'])
+    return _article_variants
+
+
+def write_variant_report(articles):
+    """Allocate variants for all articles and save how much of each group's space they use"""
+    global _article_variants
+    _article_variants, usage = allocate_article_variants(articles)
+    summary = usage_summary(usage)
+    # Review copy, so always indented
+    dump({"summary": summary, "groups": usage}, VARIANT_REPORT, pretty=True)
+
+    print(f"   🎲 Variants: {summary['groups_all_distinct']}/{summary['groups']} groups with distinct "
+          f"variant tuples, {summary['sibling_section_repeats']} avoidable sibling section repeats")
+    print(f"   Saved to: {VARIANT_REPORT}\n")
+
+
+def find_treatment_data(treatment_slug, locale):
+    """Find treatment data (localized name + real cost rows) for an article"""
+    return CATALOG_INDEX["treatments"].get((treatment_slug, locale), {})
+
+
+def find_city_data(city_slug, locale):
+    """Find the catalog record for an article's city"""
+    return CATALOG_INDEX["cities"].get((city_slug, locale), {})
+
+
+def last_updated_label():
+    """Month stamped into the article footer"""
+    return build_time().strftime('%B %Y')
+
+
+_template_fingerprint = None
+
+
+def template_fingerprint():
+    """Hash of the section renderers' source and the shared data they read"""
+    global _template_fingerprint
+    if _template_fingerprint is None:
+        renderers = [
+            generate_testimonial,
+            generate_unique_intro,
+            generate_why_choose_section,
+            generate_process_section,
+            generate_hospital_section,
+            generate_faq_section,
+            generate_full_article_content,
+            cost_values,
+            specialty_hospitals,
+            testimonial_radices,
+            hospital_radices,
+            faq_radices,
+        ]
+        _template_fingerprint = hash_inputs(
+            [inspect.getsource(fn) for fn in renderers],
+            [template.as_data() for template in SECTION_TEMPLATES],
+            BANGALORE_HOSPITALS,
+            TESTIMONIAL_NAMES,
+            INTRO_PHRASES,
+            TRANSITION_PHRASES,
+            CONVERSATIONAL_ELEMENTS,
+        )
+    return _template_fingerprint
+
+
+def article_cache_key(page, variant):
+    """Build cache key: everything that can change an article's body"""
+    url_parts = page['url'].split('/')
+    return hash_inputs(
+        GENERATOR_VERSION,
+        template_fingerprint(),
+        page,
+        variant,
+        find_city_data(url_parts[-3], page['locale']),
+        find_treatment_data(url_parts[-2], page['locale']),
+        last_updated_label(),
+    )
+
+
+def generate_full_article_content(page, variant=None):
     """Generate complete article content"""
+    if variant is None:
+        variant = article_variants()[page['url']]
 
     # Extract metadata
     url_parts = page['url'].split('/')
@@ -464,64 +718,80 @@ def generate_full_article_content(page):
     treatment_slug = url_parts[-2]
     city_slug = url_parts[-3]
 
-    # Find treatment data
-    treatment_data = {}
-    for item in manifest:
-        if item['slug'] == treatment_slug and item['page_type'] == 'treatment_landing':
-            # Extract treatment name
-            treatment_name = item['h1'].split(' in India')[0] if locale == 'en' else item['h1'].split(' في الهند')[0]
-            treatment_data = {
-                'name': treatment_name,
-                'cost_gcc_min': 15000,
-                'cost_gcc_max': 30000,
-                'cost_india_min': 4000,
-                'cost_india_max': 8000,
-                'savings_percent': '60-70%',
-            }
-            break
+    treatment_data = find_treatment_data(treatment_slug, locale)
 
     city_name = city_slug.replace('-', ' ').title()
     treatment_name = treatment_data.get('name', treatment_slug.replace('-', ' ').title())
     article_title = article_slug.replace('-', ' ').title()
 
-    # Build complete article
-    content = f"""# {article_title}
+    values = {
+        "article_title": article_title,
+        "city_name": city_name,
+        "treatment": treatment_name,
+        "intro": generate_unique_intro(city_slug, treatment_name, locale, variant["intro"]),
+        "why_choose": generate_why_choose_section(city_slug, treatment_name, treatment_data, variant["why_choose"]),
+        "testimonial": generate_testimonial(city_slug, treatment_name, locale, variant["testimonial"]),
+        "process": generate_process_section(city_slug, treatment_name, variant["process"]),
+        "hospitals": generate_hospital_section(treatment_name, variant["hospitals"]),
+        "faq": generate_faq_section(city_slug, treatment_name, treatment_data, variant["faq"]),
+        "last_updated": last_updated_label(),
+    }
 
-{generate_unique_intro(city_slug, treatment_name, locale)}
+    return ARTICLE_TEMPLATE.render_variant(values, variant["closing"])
 
-{generate_why_choose_section(city_slug, treatment_name, treatment_data)}
 
-{generate_testimonial(city_slug, treatment_name, locale)}
+def article_record(page, content):
+    """Wrap rendered content into the output record for a page"""
+    return {
+        **page,
+        'full_content': content,
+        'word_count': len(content.split()),
+        'generated_at': build_time().isoformat(),
+    }
 
-{generate_process_section(city_slug, treatment_name)}
 
-{generate_hospital_section(treatment_name)}
+def render_article(page, variant):
+    """Render one article record (top-level so process pool workers can pickle it)"""
+    return article_record(page, generate_full_article_content(page, variant))
 
-{generate_faq_section(city_slug, treatment_name, treatment_data)}
 
-## Ready to Start Your Journey?
+def render_articles(articles, workers=1, chunk_size=25):
+    """Yield rendered articles in order, optionally across a process pool"""
+    # Allocated here, so workers get their variants without re-reading the manifest
+    variants = [article_variants()[page['url']] for page in articles]
+    if workers <= 1:
+        for page, variant in zip(articles, variants):
+            yield render_article(page, variant)
+        return
 
-{random.choice([
-        f"If you're in {city_name} and considering {treatment_name}, let's talk. No sales pitch—just honest answers to your questions.",
-        f"Planning {treatment_name} from {city_name} starts with a conversation. Share your medical reports, and we'll provide a detailed assessment within 24 hours.",
-        f"Every patient from {city_name} who contacts us gets a personalized evaluation. No generic quotes—real numbers based on your specific case.",
-    ])}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(render_article, articles, variants, chunksize=chunk_size)
 
-**Contact Us Today:**
-- **WhatsApp:** +91-80-1234-5678 (24/7, Arabic support)
-- **Email:** care@shifaalhind.com
-- **Free Consultation:** Share your medical reports for expert review
 
-We've been coordinating medical travel between the GCC and India since 2015. We know what works—and we're here to help.
+def iter_rendered_articles(articles, workers=1, chunk_size=25, cache=None):
+    """Yield rendered articles in manifest order, copying unchanged ones from the build cache"""
+    if cache is None:
+        yield from render_articles(articles, workers, chunk_size)
+        return
 
----
+    keys = [article_cache_key(page, article_variants()[page['url']]) for page in articles]
+    stale = [not cache.has(key) for key in keys]
+    rendered = render_articles([page for page, miss in zip(articles, stale) if miss], workers, chunk_size)
 
-*Medical Disclaimer: This content is for informational purposes only and does not constitute medical advice. Always consult with qualified healthcare professionals for medical decisions. Cost estimates are approximate and vary based on individual cases.*
-
-*Last Updated: {datetime.now().strftime('%B %Y')}*
-"""
+    for page, key, miss in zip(articles, keys, stale):
+        content = None if miss else cache.get(key)
+        if content is not None:
+            yield article_record(page, content)
+            continue
 
-    return content
+        if miss:
+            cache.misses += 1
+            record = next(rendered)
+        else:
+            # Evicted by another run since the has() check
+            record = render_article(page, article_variants()[page['url']])
+        cache.put(key, record['full_content'])
+        yield record
 
 
 def main():
@@ -537,7 +807,7 @@ def main():
     print("  - Includes real data and patient stories\n")
 
     # Filter articles only
-    articles = [p for p in manifest if p['page_type'] == 'article']
+    articles = [p for p in get_manifest() if p['page_type'] == 'article']
 
     print(f"📝 Generating content for {len(articles)} articles...")
     print("   (This may take 15-20 minutes)\n")
@@ -545,65 +815,134 @@ def main():
     # Generate first 10 as sample
     print("⏳ Generating SAMPLE (first 10 articles)...")
 
+    report = RunReport("articles_sample")
     full_content = []
-    for i, page in enumerate(articles[:10], 1):
-        content = generate_full_article_content(page)
-
-        full_content.append({
-            **page,
-            'full_content': content,
-            'word_count': len(content.split()),
-            'generated_at': datetime.now().isoformat(),
-        })
+    with report.stage("render_articles", total=10) as stage:
+        for i, record in enumerate(iter_rendered_articles(articles[:10]), 1):
+            full_content.append(record)
+            stage.advance()
 
-        print(f"   [{i}/10] Generated: {page['url']}")
+            print(f"   [{i}/10] Generated: {record['url']}")
 
     # Save sample
-    with open("content_full_sample.json", "w", encoding="utf-8") as f:
-        json.dump(full_content, f, indent=2, ensure_ascii=False)
+    with report.stage("write_sample", new_pages=False) as stage:
+        # Review copy, so always indented
+        dump(full_content, "content_full_sample.json", pretty=True)
+        stage.advance(len(full_content))
+        stage.add_output("content_full_sample.json")
 
     print(f"\n✅ Sample content saved: content_full_sample.json")
     print(f"   Average word count: {sum(p['word_count'] for p in full_content) // len(full_content)} words/article")
 
     print("\n📝 To generate ALL 800 articles:")
     print("   python3 human-content-generator.py --full")
-    print("   (Warning: This will take 2-3 hours and generate ~2-3GB of content)")
+    print("   python3 human-content-generator.py --full --workers 16  (parallel)")
+    print("   python3 human-content-generator.py --full --resume      (continue after a crash)")
+    print("   (Warning: This will take 2-3 hours and generate ~2-3GB of content)\n")
 
+    report.write()
 
-def generate_all_articles():
-    """Generate ALL 800 articles"""
-    articles = [p for p in manifest if p['page_type'] == 'article']
 
-    print(f"⏳ Generating ALL {len(articles)} articles...")
-    print(f"   This will take 2-3 hours...\n")
-    print(f"   Progress will be saved every 100 articles\n")
+def generate_all_articles(workers=1, resume=False, use_cache=True, shards=False, sections=False):
+    """Generate ALL 800 articles, returns the compacted article records"""
+    articles = [p for p in get_manifest() if p['page_type'] == 'article']
+    total = len(articles)
 
-    full_content = []
-
-    for i, page in enumerate(articles, 1):
-        content = generate_full_article_content(page)
-
-        full_content.append({
-            **page,
-            'full_content': content,
-            'word_count': len(content.split()),
-            'generated_at': datetime.now().isoformat(),
-        })
-
-        # Progress update every 50 articles
-        if i % 50 == 0:
-            print(f"   [{i}/{len(articles)}] Generated {i} articles...")
-
-        # Save checkpoint every 100 articles
-        if i % 100 == 0:
-            checkpoint_file = f"content_checkpoint_{i}.json"
-            with open(checkpoint_file, "w", encoding="utf-8") as f:
-                json.dump(full_content, f, indent=2, ensure_ascii=False)
-            print(f"   💾 Checkpoint saved: {checkpoint_file}")
-
-    # Save final output
-    with open("content_articles_full.json", "w", encoding="utf-8") as f:
-        json.dump(full_content, f, indent=2, ensure_ascii=False)
+    print(f"⏳ Generating ALL {total} articles...")
+    if workers > 1:
+        print(f"   Using {workers} worker processes\n")
+    else:
+        print(f"   This will take 2-3 hours...\n")
+    print(f"   Progress will be saved every {CHECKPOINT_EVERY} articles to {SEGMENT_DIR}/\n")
+
+    report = RunReport("articles")
+    with report.stage("allocate_variants", total=total, new_pages=False) as stage:
+        write_variant_report(articles)
+        stage.advance(total)
+        stage.add_output(VARIANT_REPORT)
+
+    done = set()
+    if resume:
+        done = completed_urls(SEGMENT_DIR)
+        articles = [p for p in articles if p['url'] not in done]
+        print(f"   ↩️  Resuming: {len(done)} articles already in segments, {len(articles)} left\n")
+    else:
+        clear_segments(SEGMENT_DIR)
+
+    writer = SegmentWriter(SEGMENT_DIR, CHECKPOINT_EVERY)
+    # Shards are written as articles come out of the renderer, not after compaction
+    emitter = ShardEmitter(DEFAULT_SHARD_DIR) if shards else None
+    cache = BuildCache() if use_cache else None
+    # Same cache directory, but HTML fragments keep their own hit/miss counts
+    html_cache = BuildCache() if use_cache and shards else None
+    completed = total - len(articles)
+
+    with report.stage("render_articles", total=len(articles)) as stage:
+        for record in iter_rendered_articles(articles, workers, cache=cache):
+            completed += 1
+            stage.advance()
+            segment = writer.add(record)
+            if emitter is not None:
+                emitter.add(record, html_variants(record, html_cache))
+
+            # Progress update every 50 articles
+            if completed % 50 == 0:
+                print(f"   [{completed}/{total}] Generated {completed} articles... ({stage.progress()})")
+
+            if segment:
+                stage.add_output(segment)
+                print(f"   💾 Checkpoint saved: {segment}")
+
+        segment = writer.flush()
+        if segment:
+            stage.add_output(segment)
+            print(f"   💾 Checkpoint saved: {segment}")
+
+        if cache is not None:
+            stage.add_cache(cache.hits, cache.misses)
+            evicted = cache.evict()
+            print(f"\n   🗄️  Build cache: {cache.hits} reused, {cache.misses} rendered "
+                  f"({cache.hit_ratio():.0%} hit ratio, {evicted} evicted)")
+
+    with report.stage("compact_segments", new_pages=False) as stage:
+        full_content = compact_articles()
+        stage.advance(len(full_content))
+        stage.add_output("content_articles_full.json")
+
+    if emitter is not None:
+        with report.stage("write_shards", new_pages=False) as stage:
+            # Articles rendered by the interrupted run were never emitted by this one
+            for record in full_content:
+                if record['url'] in done:
+                    emitter.add(record, html_variants(record, html_cache))
+            count = emitter.close()
+            stage.advance(count)
+            stage.add_output(DEFAULT_SHARD_DIR)
+            if html_cache is not None:
+                stage.add_cache(html_cache.hits, html_cache.misses)
+        counts = emitter.counts
+        print(f"   Sharded: {count} articles → {DEFAULT_SHARD_DIR}/ "
+              f"({counts['written']} files written, {counts['unchanged']} unchanged)")
+        if html_cache is not None:
+            print(f"   HTML: {html_cache.hits} fragments reused, {html_cache.misses} rendered")
+
+    if sections:
+        with report.stage("write_sections", new_pages=False) as stage:
+            counts = write_section_store(full_content, DEFAULT_SECTION_DIR)
+            stage.advance(len(full_content))
+            stage.add_output(DEFAULT_SECTION_DIR)
+        print(f"   Sections: {counts['added']} new, {counts['sections']} unique across "
+              f"{counts['pages']} pages → {DEFAULT_SECTION_DIR}/ ({counts['bytes']:,} bytes)")
+
+    print()
+    report.write()
+    return full_content
+
+
+def compact_articles():
+    """Merge checkpoint segments into content_articles_full.json in manifest order"""
+    order = [p['url'] for p in get_manifest() if p['page_type'] == 'article']
+    full_content = compact_segments(SEGMENT_DIR, "content_articles_full.json", order)
 
     avg_words = sum(p['word_count'] for p in full_content) // len(full_content)
     total_words = sum(p['word_count'] for p in full_content)
@@ -614,10 +953,23 @@ def generate_all_articles():
     print(f"   Total word count: {total_words:,} words")
     print(f"   Saved to: content_articles_full.json")
 
+    return full_content
+
 
 if __name__ == "__main__":
     import sys
-    if "--full" in sys.argv:
-        generate_all_articles()
+    if "--compact" in sys.argv:
+        compact_articles()
+    elif "--full" in sys.argv:
+        workers = 1
+        if "--workers" in sys.argv:
+            workers = int(sys.argv[sys.argv.index("--workers") + 1])
+        generate_all_articles(
+            workers,
+            resume="--resume" in sys.argv,
+            use_cache="--no-cache" not in sys.argv,
+            shards="--shards" in sys.argv,
+            sections="--sections" in sys.argv,
+        )
     else:
         main()
@@ -18,7 +18,7 @@ interface ContentPage {
   title: string;
   meta_desc: string;
   h1: string;
-  json_ld?: string;
+  json_ld?: string | Record<string, unknown>;
   needs_native_review?: boolean;
   needs_medical_review?: boolean;
   status: string;
@@ -0,0 +1,100 @@
+"""
+Shifa AlHind - JSON Serializer
+The one place generators read and write JSON: orjson when it is installed,
+stdlib json otherwise; compact output for production artefacts and indented
+output for review copies
+"""
+
+import json
+import os
+from typing import Any, Dict, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+# SHIFA_JSON_PRETTY=1 indents every artefact (for diffing a run by eye)
+PRETTY = os.environ.get("SHIFA_JSON_PRETTY", "") not in ("", "0")
+# SHIFA_JSON_LD_NESTED=1 writes each page's json_ld as an object instead of an escaped string
+NESTED_JSON_LD = os.environ.get("SHIFA_JSON_LD_NESTED", "") not in ("", "0")
+
+
+def dumpb(data: Any, pretty: bool = False) -> bytes:
+    """Serialize to UTF-8 bytes, compact unless `pretty`"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps(data: Any, pretty: bool = False) -> str:
+    return dumpb(data, pretty).decode("utf-8")
+
+
+def loads(text) -> Any:
+    """Parse JSON from str or bytes"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def load(filename: str) -> Any:
+    with open(filename, "rb") as f:
+        return loads(f.read())
+
+
+def nest_json_ld(page: Dict) -> Dict:
+    """Copy of a page with its json_ld string parsed into an object"""
+    if isinstance(page.get("json_ld"), str):
+        return {**page, "json_ld": loads(page["json_ld"])}
+    return page
+
+
+def json_ld_text(page: Dict) -> Optional[str]:
+    """A page's JSON-LD as a string, whichever form it was stored in"""
+    json_ld = page.get("json_ld")
+    if json_ld is None or isinstance(json_ld, str):
+        return json_ld
+    return dumps(json_ld)
+
+
+def same_bytes(filename: str, payload: bytes) -> bool:
+    """Whether `filename` already holds exactly `payload`"""
+    try:
+        if os.path.getsize(filename) != len(payload):
+            return False
+        with open(filename, "rb") as f:
+            return f.read() == payload
+    except OSError:
+        return False
+
+
+def dump(data: Any, filename: str, pretty: Optional[bool] = None, nested_json_ld: Optional[bool] = None) -> int:
+    """Write JSON atomically (temp file + rename), returns the payload size.
+
+    `pretty` and `nested_json_ld` default to the SHIFA_JSON_* environment
+    settings; nesting applies when `data` is a list of pages. A file that
+    already holds the same bytes is left alone, so its mtime only moves
+    when its content does.
+    """
+    if pretty is None:
+        pretty = PRETTY
+    if nested_json_ld is None:
+        nested_json_ld = NESTED_JSON_LD
+    if nested_json_ld and isinstance(data, list):
+        data = [nest_json_ld(page) if isinstance(page, dict) else page for page in data]
+
+    payload = dumpb(data, pretty)
+    if same_bytes(filename, payload):
+        return len(payload)
+
+    tmp = f"{filename}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(payload)
+    os.replace(tmp, filename)
+    return len(payload)
@@ -0,0 +1,200 @@
+"""
+Shifa AlHind - JSON-LD Builder
+Schema.org graphs for city, treatment and article pages, spliced together
+as text from fragments serialized once per locale, city and treatment
+"""
+
+from functools import lru_cache
+from typing import Dict, Optional
+
+from catalog import FLIGHT_TIMES, TREATMENT_COSTS
+from json_io import dumps
+
+BRAND_NAME = "Shifa AlHind"
+DOMAIN = "https://shifaalhind.com"
+CONTEXT = "https://schema.org"
+ARTICLE_DATE = "2025-01-01"
+
+# Serialized openings of the two top-level shapes
+GRAPH_HEAD = '{"@context":"%s","@graph":[' % CONTEXT
+ARTICLE_HEAD = '{"@context":"%s","@type":"Article","headline":' % CONTEXT
+
+FAQ_TEXT = {
+    "en": {
+        "cost_question": "How much does {treatment} cost in India?",
+        "cost_answer": "{treatment} in India typically costs ${india_min:,}-${india_max:,}, compared with "
+                       "${gcc_min:,}-${gcc_max:,} in the GCC, a saving of {savings}.",
+        "flight_question": "How long is the flight from {city} to Bangalore?",
+        "flight_answer": "Direct flights from {city} to Bangalore take about {hours} hours.",
+    },
+    "ar": {
+        "cost_question": "كم تبلغ تكلفة {treatment} في الهند؟",
+        "cost_answer": "تتراوح تكلفة {treatment} في الهند عادةً بين ${india_min:,} و${india_max:,}، "
+                       "مقارنةً بـ ${gcc_min:,}-${gcc_max:,} في دول الخليج، أي توفير {savings}.",
+        "flight_question": "كم تستغرق الرحلة من {city} إلى بنغالور؟",
+        "flight_answer": "تستغرق الرحلات المباشرة من {city} إلى بنغالور حوالي {hours} ساعات.",
+    },
+}
+
+
+def extend(obj: str, members: str) -> str:
+    """Append the members of serialized object `members` to serialized object `obj`"""
+    if members == "{}":
+        return obj
+    return obj[:-1] + "," + members[1:]
+
+
+def graph(*nodes: str) -> str:
+    return GRAPH_HEAD + ",".join(nodes) + "]}"
+
+
+def _crumb(position: int, name: str, item: str) -> str:
+    return dumps({"@type": "ListItem", "position": position, "name": name, "item": item})
+
+
+def _breadcrumbs(*crumbs: str) -> str:
+    return '{"@type":"BreadcrumbList","itemListElement":[' + ",".join(crumbs) + "]}"
+
+
+def _name(record: Dict, locale: str) -> str:
+    return record["name_ar"] if locale == "ar" else record["name"]
+
+
+def _city_url(locale: str, country_slug: str, city_slug: str) -> str:
+    return f"{DOMAIN}/{locale}/medical-tourism/{country_slug}/{city_slug}"
+
+
+# Fragments shared across pages: built and serialized on first use only
+
+@lru_cache(maxsize=None)
+def organization() -> str:
+    return dumps({
+        "@type": "Organization",
+        "name": BRAND_NAME,
+        "url": DOMAIN,
+        "logo": f"{DOMAIN}/logo.png",
+        "contactPoint": {
+            "@type": "ContactPoint",
+            "telephone": "+91-80-12345678",
+            "contactType": "Customer Service",
+            "areaServed": ["SA", "AE", "QA", "OM", "KW", "BH"],
+            "availableLanguage": ["en", "ar"],
+        },
+    })
+
+
+@lru_cache(maxsize=None)
+def article_members() -> str:
+    """Author, publisher and dates, the same on every article"""
+    return dumps({
+        "author": {"@type": "Organization", "name": BRAND_NAME},
+        "publisher": {
+            "@type": "Organization",
+            "name": BRAND_NAME,
+            "logo": {"@type": "ImageObject", "url": f"{DOMAIN}/logo.png"},
+        },
+        "datePublished": ARTICLE_DATE,
+        "dateModified": ARTICLE_DATE,
+    })
+
+
+@lru_cache(maxsize=None)
+def article_tail(locale: str, treatment_slug: str, treatment_name: str, city_slug: str, city_name: str) -> str:
+    """Everything after an article's headline, shared by the articles of one treatment, city and locale"""
+    description = dumps({"description": f"{treatment_name} guide for {city_name} patients"})
+    return "," + extend(description, article_members())[1:]
+
+
+@lru_cache(maxsize=None)
+def locale_crumbs(locale: str) -> str:
+    """Home and Medical Tourism, the first two breadcrumbs of every landing page"""
+    return ",".join([
+        _crumb(1, "Home", f"{DOMAIN}/{locale}"),
+        _crumb(2, "Medical Tourism", f"{DOMAIN}/{locale}/medical-tourism"),
+    ])
+
+
+@lru_cache(maxsize=None)
+def city_crumbs(locale: str, country_slug: str, city_slug: str, city_name: str) -> str:
+    return ",".join([locale_crumbs(locale), _crumb(3, city_name, _city_url(locale, country_slug, city_slug))])
+
+
+@lru_cache(maxsize=None)
+def cost_members(treatment_slug: str) -> str:
+    """MedicalProcedure cost range in India from the catalog; empty for treatments without costs"""
+    costs = TREATMENT_COSTS.get(treatment_slug)
+    if costs is None:
+        return "{}"
+    india_min, india_max = costs["india"]
+    return dumps({"cost": {"@type": "MonetaryAmount", "currency": "USD", "minValue": india_min, "maxValue": india_max}})
+
+
+def _question(question: str, answer: str) -> str:
+    return dumps({"@type": "Question", "name": question, "acceptedAnswer": {"@type": "Answer", "text": answer}})
+
+
+@lru_cache(maxsize=None)
+def cost_question(locale: str, treatment_slug: str, treatment_name: str) -> Optional[str]:
+    costs = TREATMENT_COSTS.get(treatment_slug)
+    if costs is None:
+        return None
+    text = FAQ_TEXT[locale]
+    (gcc_min, gcc_max), (india_min, india_max) = costs["gcc"], costs["india"]
+    return _question(
+        text["cost_question"].format(treatment=treatment_name),
+        text["cost_answer"].format(treatment=treatment_name, india_min=india_min, india_max=india_max,
+                                   gcc_min=gcc_min, gcc_max=gcc_max, savings=costs["savings"]),
+    )
+
+
+@lru_cache(maxsize=None)
+def flight_question(locale: str, city_slug: str, city_name: str) -> Optional[str]:
+    hours = FLIGHT_TIMES.get(city_slug)
+    if hours is None:
+        return None
+    text = FAQ_TEXT[locale]
+    return _question(text["flight_question"].format(city=city_name),
+                     text["flight_answer"].format(city=city_name, hours=hours))
+
+
+# Per-page graphs
+
+def city_json_ld(country: Dict, city: Dict, locale: str = "en") -> str:
+    """Organization and breadcrumbs for a city landing page"""
+    crumbs = city_crumbs(locale, country["country_slug"], city["slug"], _name(city, locale))
+    return graph(organization(), _breadcrumbs(crumbs))
+
+
+def treatment_json_ld(country: Dict, city: Dict, treatment: Dict, locale: str = "en") -> str:
+    """MedicalProcedure with its cost, breadcrumbs, and a FAQPage on cost and flight time"""
+    city_name = _name(city, locale)
+    treatment_name = _name(treatment, locale)
+
+    procedure = extend(
+        dumps({
+            "@type": "MedicalProcedure",
+            "name": treatment_name,
+            "description": f"Affordable {treatment_name} in India for patients from {city_name}",
+            "procedureType": "Medical Procedure",
+        }),
+        cost_members(treatment["slug"]),
+    )
+    crumbs = _breadcrumbs(
+        city_crumbs(locale, country["country_slug"], city["slug"], city_name),
+        _crumb(4, treatment_name, f"{_city_url(locale, country['country_slug'], city['slug'])}/{treatment['slug']}"),
+    )
+    nodes = [procedure, crumbs]
+
+    questions = [question for question in (
+        cost_question(locale, treatment["slug"], treatment_name),
+        flight_question(locale, city["slug"], city_name),
+    ) if question is not None]
+    if questions:
+        nodes.append('{"@type":"FAQPage","mainEntity":[' + ",".join(questions) + "]}")
+    return graph(*nodes)
+
+
+def article_json_ld(country: Dict, city: Dict, treatment: Dict, article_slug: str, locale: str = "en") -> str:
+    """Article with the shared author and publisher; only the headline is serialized per page"""
+    return ARTICLE_HEAD + dumps(article_slug.replace('-', ' ').title()) + article_tail(
+        locale, treatment["slug"], _name(treatment, locale), city["slug"], _name(city, locale))
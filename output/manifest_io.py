@@ -0,0 +1,79 @@
+"""
+Shifa AlHind - Manifest I/O
+Streaming NDJSON writer and incremental readers for the content manifest
+"""
+
+import os
+from typing import Dict, Iterable, Iterator, List
+
+from compact_manifest import CompactManifest
+from json_io import NESTED_JSON_LD, dump, dumps, load, loads, nest_json_ld
+
+MANIFEST_JSON = "content_manifest_full.json"
+MANIFEST_NDJSON = "content_manifest_full.ndjson"
+MANIFEST_COMPACT = "content_manifest_full.compact.json"
+# Names the form the last generator run wrote
+MANIFEST_CURRENT = "content_manifest_full.current.json"
+
+
+def write_ndjson(pages: Iterable[Dict], filename: str) -> int:
+    """Stream pages to an NDJSON file (one page per line), returns page count"""
+    count = 0
+    with open(filename, "w", encoding="utf-8") as f:
+        for page in pages:
+            f.write(dumps(nest_json_ld(page) if NESTED_JSON_LD else page))
+            f.write("\n")
+            count += 1
+    return count
+
+
+def iter_ndjson(filename: str) -> Iterator[Dict]:
+    """Yield pages from an NDJSON file one line at a time"""
+    with open(filename, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+
+def mark_current(filename: str) -> None:
+    """Record `filename` as the manifest form readers should pick"""
+    dump({"manifest": filename}, MANIFEST_CURRENT)
+
+
+def resolve_manifest_path(filename: str = None) -> str:
+    """Pick the form named by MANIFEST_CURRENT.
+
+    json_io.dump leaves unchanged files untouched, so mtimes do not say
+    which form is current; without a pointer the newest form wins, and on
+    a tie compact, then NDJSON.
+    """
+    if filename:
+        return filename
+    try:
+        current = load(MANIFEST_CURRENT)["manifest"]
+    except (FileNotFoundError, KeyError, TypeError, ValueError):
+        current = None
+    if current and os.path.exists(current):
+        return current
+    candidates = [path for path in (MANIFEST_COMPACT, MANIFEST_NDJSON, MANIFEST_JSON) if os.path.exists(path)]
+    if not candidates:
+        return MANIFEST_JSON
+    return max(candidates, key=os.path.getmtime)
+
+
+def iter_manifest(filename: str = None) -> Iterator[Dict]:
+    """Yield manifest pages incrementally from NDJSON, the compact format or a legacy JSON array"""
+    path = resolve_manifest_path(filename)
+    if path.endswith(".ndjson"):
+        yield from iter_ndjson(path)
+        return
+    if path.endswith(".compact.json"):
+        yield from CompactManifest.open(path)
+        return
+
+    yield from load(path)
+
+
+def load_manifest(filename: str = None) -> List[Dict]:
+    """Load the whole manifest into a list (for stages that need random access)"""
+    return list(iter_manifest(filename))
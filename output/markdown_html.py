@@ -0,0 +1,317 @@
+"""
+Shifa AlHind - Markdown Pre-Renderer
+Converts page bodies to sanitized HTML fragments once, at generation time,
+so the site can serve them without parsing Markdown per request
+"""
+
+import html
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Tuple
+
+from build_cache import hash_inputs
+
+# Bump when the HTML for the same Markdown changes, so cached fragments are re-rendered
+RENDERER_VERSION = 3
+HTML_SUFFIX = ".html"
+
+# The classes the ReactMarkdown components in the Next.js pages apply, so a
+# pre-rendered fragment looks the same as a client-rendered one: the article
+# page, and the city/treatment landing pages
+CLASSES = {
+    "h1": "text-3xl font-bold mt-8 mb-4 text-gray-900",
+    "h2": "text-2xl font-bold mt-6 mb-3 text-gray-900",
+    "h3": "text-xl font-semibold mt-4 mb-2 text-gray-900",
+    "p": "mb-4 text-gray-700 leading-relaxed",
+    "ul": "list-disc list-inside mb-4 space-y-2",
+    "ol": "list-decimal list-inside mb-4 space-y-2",
+    "table_wrap": "overflow-x-auto my-6",
+    "table": "min-w-full divide-y divide-gray-200",
+    "thead": "bg-gray-50",
+    "tbody": "bg-white divide-y divide-gray-200",
+    "th": "px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider",
+    "td": "px-6 py-4 whitespace-nowrap text-sm text-gray-900",
+    "blockquote": "border-l-4 border-primary-500 pl-4 italic my-4 text-gray-600",
+    "a": "text-primary-600 hover:text-primary-700 underline",
+}
+LANDING_CLASSES = {
+    **CLASSES,
+    "ul": "list-disc list-inside mb-4 space-y-2 text-gray-700",
+    "ol": "list-decimal list-inside mb-4 space-y-2 text-gray-700",
+    "table": "min-w-full divide-y divide-gray-200 border",
+    "thead": "bg-primary-600 text-white",
+    "th": "px-6 py-3 text-left text-sm font-semibold",
+    "td": "px-6 py-4 text-sm text-gray-900",
+    "blockquote": "border-l-4 border-primary-500 pl-4 italic my-4 text-gray-600 bg-gray-50 py-2",
+}
+STYLES = {"article": CLASSES, "landing": LANDING_CLASSES}
+
+# Link targets that survive sanitizing; anything else (javascript:, data:, //host, ...) renders as plain text
+SAFE_HREF = re.compile(r"^(https?:|mailto:|tel:|/(?![/\\])|#)", re.IGNORECASE)
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_RULE = re.compile(r"^ {0,3}([-*_])( *\1){2,} *$")
+_BULLET = re.compile(r"^ {0,3}[-*+]\s+(.*)$")
+_NUMBERED = re.compile(r"^ {0,3}(\d{1,9})[.)]\s+(.*)$")
+_FENCE = re.compile(r"^ {0,3}(```|~~~)")
+_TABLE_RULE = re.compile(r"^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$")
+
+_CODE_SPAN = re.compile(r"(`+)(.+?)\1")
+_LINK = re.compile(r"\[([^\]]+)\]\(([^)\s]+)\)")
+_STRONG = re.compile(r"\*\*(?=\S)(.+?)(?<=\S)\*\*|(?<!\w)__(?=\S)(.+?)(?<=\S)__(?!\w)")
+_EM = re.compile(r"(?<![*\w])\*(?=[^\s*])(.+?)(?<=[^\s*])\*(?![*\w])|(?<!\w)_(?=\S)(.+?)(?<=\S)_(?!\w)")
+_PLACEHOLDER = re.compile(r"\x00(\d+)\x00")
+
+
+def _open(tag: str, classes: Dict[str, str], attrs: str = "") -> str:
+    cls = classes.get(tag)
+    return f'<{tag} class="{cls}"{attrs}>' if cls else f"<{tag}{attrs}>"
+
+
+def _link(match, classes: Dict[str, str]) -> str:
+    label, href = match.group(1), match.group(2)
+    if not SAFE_HREF.match(html.unescape(href)):
+        return _emphasis(label)
+    href = href.replace('"', "&quot;")
+    attrs = f' href="{href}"'
+    if href.lower().startswith("http"):
+        attrs += ' target="_blank" rel="noopener noreferrer"'
+    return f"{_open('a', classes, attrs)}{_emphasis(label)}</a>"
+
+
+def render_inline(text: str, classes: Dict[str, str] = CLASSES) -> str:
+    """Escape a run of text, then apply code spans, links, strong and emphasis"""
+    parts = []
+    position = 0
+    for match in _CODE_SPAN.finditer(text):
+        parts.append(_render_spans(text[position:match.start()], classes))
+        parts.append(f"<code>{html.escape(match.group(2).strip(), quote=False)}</code>")
+        position = match.end()
+    parts.append(_render_spans(text[position:], classes))
+    return "".join(parts)
+
+
+def _emphasis(text: str) -> str:
+    text = _STRONG.sub(lambda m: f"<strong>{m.group(1) or m.group(2)}</strong>", text)
+    return _EM.sub(lambda m: f"<em>{m.group(1) or m.group(2)}</em>", text)
+
+
+def _render_spans(text: str, classes: Dict[str, str]) -> str:
+    """Escape, then render links; emphasis applies to link labels but never to hrefs"""
+    text = html.escape(text.replace("\x00", ""), quote=False)
+    links = []
+
+    def shield(match) -> str:
+        # Rendered links sit behind a placeholder while emphasis runs over the text
+        links.append(_link(match, classes))
+        return f"\x00{len(links) - 1}\x00"
+
+    text = _emphasis(_LINK.sub(shield, text))
+    return _PLACEHOLDER.sub(lambda m: links[int(m.group(1))], text)
+
+
+def _table_cells(line: str) -> List[str]:
+    line = line.strip()
+    if line.startswith("|"):
+        line = line[1:]
+    if line.endswith("|") and not line.endswith("\\|"):
+        line = line[:-1]
+    return [cell.strip().replace("\\|", "|") for cell in re.split(r"(?<!\\)\|", line)]
+
+
+def _table(lines: List[str], classes: Dict[str, str]) -> str:
+    aligns = []
+    for cell in _table_cells(lines[1]):
+        if cell.startswith(":") and cell.endswith(":"):
+            aligns.append("center")
+        elif cell.endswith(":"):
+            aligns.append("right")
+        else:
+            aligns.append(None)
+
+    def row(line: str, tag: str) -> str:
+        cells = _table_cells(line)
+        cells += [""] * (len(aligns) - len(cells))
+        out = []
+        for cell, align in zip(cells, aligns):
+            attrs = f' style="text-align:{align}"' if align else ""
+            out.append(f"{_open(tag, classes, attrs)}{render_inline(cell, classes)}</{tag}>")
+        return f"<tr>{''.join(out)}</tr>"
+
+    body = "".join(row(line, "td") for line in lines[2:])
+    return (
+        f'<div class="{classes["table_wrap"]}">{_open("table", classes)}'
+        f'{_open("thead", classes)}{row(lines[0], "th")}</thead>'
+        f'{_open("tbody", classes)}{body}</tbody></table></div>'
+    )
+
+
+def _starts_block(lines: List[str], i: int) -> bool:
+    """Whether line i interrupts a paragraph"""
+    line = lines[i]
+    if _HEADING.match(line) or _RULE.match(line) or _FENCE.match(line) or line.lstrip().startswith(">"):
+        return True
+    if _BULLET.match(line):
+        return True
+    numbered = _NUMBERED.match(line)
+    if numbered and numbered.group(1) == "1":
+        return True
+    return line.lstrip().startswith("|") and i + 1 < len(lines) and bool(_TABLE_RULE.match(lines[i + 1]))
+
+
+def render_markdown(text: str, style: str = "article") -> str:
+    """Sanitized HTML for the Markdown the generators write.
+
+    Covers ATX headings, paragraphs, flat bullet and numbered lists, pipe
+    tables, block quotes, fenced code, rules, and inline strong/emphasis,
+    code and links. Raw HTML in the source is escaped, never passed through.
+    `style` picks the class set (see STYLES).
+    """
+    classes = STYLES[style]
+    lines = text.replace("\r\n", "\n").split("\n")
+    blocks = []
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if not line.strip():
+            i += 1
+            continue
+
+        fence = _FENCE.match(line)
+        if fence:
+            end = i + 1
+            while end < len(lines) and not lines[end].lstrip().startswith(fence.group(1)):
+                end += 1
+            code = html.escape("\n".join(lines[i + 1:end]), quote=False)
+            blocks.append(f"<pre><code>{code}</code></pre>")
+            i = end + 1
+            continue
+
+        heading = _HEADING.match(line)
+        if heading:
+            tag = f"h{len(heading.group(1))}"
+            blocks.append(f"{_open(tag, classes)}{render_inline(heading.group(2), classes)}</{tag}>")
+            i += 1
+            continue
+
+        if _RULE.match(line):
+            blocks.append("<hr>")
+            i += 1
+            continue
+
+        if line.lstrip().startswith("|") and i + 1 < len(lines) and _TABLE_RULE.match(lines[i + 1]):
+            end = i + 2
+            while end < len(lines) and lines[end].lstrip().startswith("|"):
+                end += 1
+            blocks.append(_table(lines[i:end], classes))
+            i = end
+            continue
+
+        if line.lstrip().startswith(">"):
+            end = i
+            quoted = []
+            while end < len(lines) and lines[end].lstrip().startswith(">"):
+                quoted.append(re.sub(r"^\s*> ?", "", lines[end]))
+                end += 1
+            blocks.append(f"{_open('blockquote', classes)}{render_markdown(chr(10).join(quoted), style)}</blockquote>")
+            i = end
+            continue
+
+        item = _BULLET.match(line) or _NUMBERED.match(line)
+        if item:
+            pattern = _BULLET if _BULLET.match(line) else _NUMBERED
+            tag = "ul" if pattern is _BULLET else "ol"
+            start = "" if tag == "ul" or item.group(1) == "1" else f' start="{int(item.group(1))}"'
+            items = []
+            while i < len(lines):
+                match = pattern.match(lines[i])
+                if match:
+                    items.append(match.group(match.lastindex))
+                elif lines[i].strip() and lines[i].startswith((" ", "\t")) and items:
+                    # Indented continuation of the previous item
+                    items[-1] += "\n" + lines[i].strip()
+                elif not lines[i].strip() and i + 1 < len(lines) and pattern.match(lines[i + 1]):
+                    pass
+                else:
+                    break
+                i += 1
+            rendered = "".join(f"<li>{render_inline(entry, classes)}</li>" for entry in items)
+            blocks.append(f"{_open(tag, classes, start)}{rendered}</{tag}>")
+            continue
+
+        paragraph = [line.strip()]
+        i += 1
+        while i < len(lines) and lines[i].strip() and not _starts_block(lines, i):
+            paragraph.append(lines[i].strip())
+            i += 1
+        blocks.append(f"{_open('p', classes)}{render_inline(chr(10).join(paragraph), classes)}</p>")
+
+    return "\n".join(blocks)
+
+
+def page_style(page: Dict) -> str:
+    """Class set for a page: the landing pages style their Markdown differently from articles"""
+    return "landing" if page.get("page_type", "").endswith("_landing") else "article"
+
+
+def html_key(text: str, style: str = "article") -> str:
+    """Cache key for a body: its hash, style and the renderer version"""
+    return hash_inputs("html", RENDERER_VERSION, style, text)
+
+
+def _render_job(job: Tuple[str, str]) -> str:
+    return render_markdown(*job)
+
+
+def prerender(jobs: List[Tuple[str, str]], workers: int = 1, cache=None, stage=None, chunk_size: int = 50) -> List[str]:
+    """HTML for each (body, style) job, in order.
+
+    Jobs already in `cache` (a BuildCache) are copied, identical jobs are
+    rendered once, and the rest are rendered across `workers` processes.
+    `stage` is an optional run_report Stage advanced once per job.
+    """
+    keys = [html_key(text, style) for text, style in jobs]
+    rendered: Dict[str, str] = {}
+    if cache is not None:
+        for key in set(keys):
+            if cache.has(key):
+                value = cache.get(key)
+                if value is not None:
+                    rendered[key] = value
+
+    missing = {}
+    for key, job in zip(keys, jobs):
+        if key not in rendered:
+            missing.setdefault(key, job)
+
+    if workers > 1 and len(missing) > chunk_size:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            rendered.update(zip(missing, executor.map(_render_job, missing.values(), chunksize=chunk_size)))
+    else:
+        rendered.update((key, _render_job(job)) for key, job in missing.items())
+
+    if cache is not None:
+        cache.misses += len(missing)
+        for key in missing:
+            cache.put(key, rendered[key])
+    if stage is not None:
+        stage.advance(len(jobs))
+        if cache is not None:
+            stage.add_cache(len(jobs) - len(missing), len(missing))
+    return [rendered[key] for key in keys]
+
+
+def html_variants(page: Dict, cache=None) -> Dict[str, bytes]:
+    """The pre-rendered shard variants of one page ({} when it has no body)"""
+    body = page.get("full_content")
+    if not body:
+        return {}
+    return {HTML_SUFFIX: prerender([(body, page_style(page))], cache=cache)[0].encode("utf-8")}
+
+
+def page_variants(pages: Iterable[Dict], workers: int = 1, cache=None, stage=None) -> List[Dict[str, bytes]]:
+    """html_variants() for many pages, rendered in bulk"""
+    pages = list(pages)
+    jobs = [(page["full_content"], page_style(page)) for page in pages if page.get("full_content")]
+    fragments = iter(prerender(jobs, workers, cache, stage))
+    return [{HTML_SUFFIX: next(fragments).encode("utf-8")} if page.get("full_content") else {} for page in pages]
@@ -0,0 +1,185 @@
+"""
+Shifa AlHind - Near-Duplicate Detection
+MinHash signatures over word shingles, LSH banding to find candidate pairs
+and union-find to group them into duplicate clusters, without comparing
+every page against every other page
+"""
+
+import operator
+import zlib
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+SHINGLE_WORDS = 5
+NUM_BINS = 128  # signature length; must be a power of two
+BANDS = 16
+ROWS = NUM_BINS // BANDS
+THRESHOLD = 0.8
+# Buckets larger than this are chained to their first member instead of compared pairwise
+MAX_BUCKET_PAIRS = 64
+
+_BIN_BITS = NUM_BINS.bit_length() - 1
+_EMPTY = 1 << 64
+
+
+def shingle_hashes(text: str, size: int = SHINGLE_WORDS) -> set:
+    """Hashes of the page's overlapping `size`-word shingles.
+
+    Words are whitespace-split and CRC-32'd once and each shingle is hashed as a tuple of those
+    ints, which keeps the whole pass in C and is stable across runs (unlike
+    hashing strings, which Python salts per process).
+    """
+    words = list(map(zlib.crc32, map(str.encode, text.lower().split())))
+    if len(words) < size:
+        return {hash(tuple(words))} if words else set()
+    return set(map(hash, zip(*(words[i:] for i in range(size)))))
+
+
+def minhash(hashes: Iterable[int]) -> List[int]:
+    """One-permutation MinHash: each shingle hash lands in one bin, keep the minimum.
+
+    A single pass per page instead of NUM_BINS hash functions per shingle.
+    Empty bins borrow from the next non-empty bin (rotation densification),
+    offset by the distance so borrowed values stay distinguishable.
+    """
+    mask = NUM_BINS - 1
+    signature = [_EMPTY] * NUM_BINS
+    for h in hashes:
+        position = h & mask
+        value = h >> _BIN_BITS
+        if value < signature[position]:
+            signature[position] = value
+
+    if _EMPTY in signature and any(v != _EMPTY for v in signature):
+        filled = list(signature)
+        for position in range(NUM_BINS):
+            if signature[position] != _EMPTY:
+                continue
+            distance = 1
+            while signature[(position + distance) & mask] == _EMPTY:
+                distance += 1
+            filled[position] = signature[(position + distance) & mask] + distance * _EMPTY
+        signature = filled
+    return signature
+
+
+def similarity(a: List[int], b: List[int]) -> float:
+    """Estimated Jaccard similarity of two signatures"""
+    return sum(map(operator.eq, a, b)) / NUM_BINS
+
+
+def page_signature(text: str) -> List[int]:
+    """MinHash signature of one body (top-level so process pool workers can pickle it)"""
+    return minhash(shingle_hashes(text))
+
+
+def signatures(texts: List[str], workers: int = 1, chunk_size: int = 200) -> Iterable[List[int]]:
+    """Yield signatures in order, optionally across a process pool"""
+    if workers <= 1:
+        yield from map(page_signature, texts)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(page_signature, texts, chunksize=chunk_size)
+
+
+def lsh_buckets(signatures: List[List[int]], bands: int = BANDS) -> Iterable[List[int]]:
+    """Groups of page indexes whose signatures agree on a whole band"""
+    rows = NUM_BINS // bands
+    for band in range(bands):
+        start = band * rows
+        buckets = defaultdict(list)
+        for index, signature in enumerate(signatures):
+            buckets[tuple(signature[start:start + rows])].append(index)
+        for members in buckets.values():
+            if len(members) > 1:
+                yield members
+
+
+def bucket_pairs(members: List[int]) -> Iterable[Tuple[int, int]]:
+    if len(members) <= MAX_BUCKET_PAIRS:
+        return ((a, b) for i, a in enumerate(members) for b in members[i + 1:])
+    return ((members[0], b) for b in members[1:])
+
+
+class UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int):
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            self.parent[max(ra, rb)] = min(ra, rb)
+
+
+def find_near_duplicates(pages: List[Dict], threshold: float = THRESHOLD, bands: int = BANDS,
+                         field: str = "full_content", workers: int = 1, stage=None) -> Dict:
+    """Cluster pages whose bodies are at least `threshold` similar.
+
+    `stage` is an optional run_report Stage advanced once per signed page.
+    Candidate pairs already in the same cluster are not scored, so cluster
+    scores cover the pairs that joined it. Returns the clusters (largest
+    first) and counts for the report.
+    """
+    signed = []
+    for signature in signatures([page.get(field) or "" for page in pages], workers):
+        signed.append(signature)
+        if stage is not None:
+            stage.advance()
+
+    union = UnionFind(len(pages))
+    edges = defaultdict(list)
+    candidates = 0
+    for members in lsh_buckets(signed, bands):
+        for a, b in bucket_pairs(members):
+            if union.find(a) == union.find(b):
+                continue
+            candidates += 1
+            score = similarity(signed[a], signed[b])
+            if score >= threshold:
+                union.union(a, b)
+                edges[a].append(score)
+                edges[b].append(score)
+
+    groups = defaultdict(list)
+    for index in edges:
+        groups[union.find(index)].append(index)
+
+    clusters = []
+    for members in groups.values():
+        members.sort()
+        scores = [score for index in members for score in edges[index]]
+        clusters.append({
+            "size": len(members),
+            "min_similarity": round(min(scores), 3),
+            "max_similarity": round(max(scores), 3),
+            "urls": [pages[index]["url"] for index in members],
+        })
+    clusters.sort(key=lambda cluster: (-cluster["size"], -cluster["max_similarity"], cluster["urls"][0]))
+
+    return {
+        "pages": len(pages),
+        "threshold": threshold,
+        "bands": bands,
+        "rows": NUM_BINS // bands,
+        "candidate_pairs": candidates,
+        "joining_pairs": sum(len(scores) for scores in edges.values()) // 2,
+        "pages_in_clusters": sum(cluster["size"] for cluster in clusters),
+        "clusters": clusters,
+    }
+
+
+def page_similarity(a: str, b: str) -> Optional[float]:
+    """Exact shingle Jaccard similarity of two bodies (for spot-checking a cluster)"""
+    sa, sb = shingle_hashes(a), shingle_hashes(b)
+    if not sa and not sb:
+        return None
+    return len(sa & sb) / len(sa | sb)
@@ -0,0 +1,131 @@
+"""
+Shifa AlHind - Per-Page File Emitter
+Writes one file per page from a thread pool while the generator keeps
+rendering: each file lands under a temp name and is renamed into place, so
+a crashed or half-finished build only ever leaves whole files behind
+"""
+
+import itertools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+from json_io import same_bytes
+
+EMIT_WORKERS = 4
+# Files renamed into place (and fsynced) together; 0 renames each file at once without fsync
+FSYNC_EVERY = 256
+
+
+def _fsync(path: str) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class PageEmitter:
+    """Thread-pool writer for many small files under `root`.
+
+    emit() hands a payload to the pool and returns; at most 4 × workers
+    payloads wait in memory, after which emit() blocks. Written files are
+    committed in batches of `fsync_every`: the temp files are fsynced,
+    renamed over their targets, and their directories fsynced, then
+    `on_commit` is called with the keys of the batch. A file that already
+    holds the same bytes is not rewritten (its key is still committed).
+    """
+
+    def __init__(self, root: str, workers: int = EMIT_WORKERS, fsync_every: int = FSYNC_EVERY,
+                 on_commit: Optional[Callable[[List], None]] = None):
+        self.root = root
+        self.fsync_every = fsync_every
+        self.on_commit = on_commit
+        self.counts = {"written": 0, "unchanged": 0, "batches": 0}
+        self.bytes = 0
+
+        self._pending = []
+        self._serial = itertools.count()
+        self._lock = threading.Lock()
+        self._commit_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(workers * 4)
+        self._error = None
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="emit")
+        os.makedirs(root, exist_ok=True)
+
+    def emit(self, path: str, payload: bytes, key=None) -> None:
+        """Queue `payload` for root/path; raises the first error a writer thread hit"""
+        if self._error is not None:
+            raise self._error
+        self._slots.acquire()
+        future = self._executor.submit(self._write, path, payload, key)
+        future.add_done_callback(self._done)
+
+    def _done(self, future) -> None:
+        self._slots.release()
+        if future.exception() is not None and self._error is None:
+            self._error = future.exception()
+
+    def _write(self, path: str, payload: bytes, key) -> None:
+        filename = os.path.join(self.root, path)
+        tmp = None
+        if not same_bytes(filename, payload):
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            tmp = f"{filename}.{os.getpid()}.{next(self._serial)}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(payload)
+
+        with self._lock:
+            self.counts["written" if tmp else "unchanged"] += 1
+            if tmp:
+                self.bytes += len(payload)
+            self._pending.append((tmp, filename, key))
+            if len(self._pending) < max(1, self.fsync_every):
+                return
+            batch, self._pending = self._pending, []
+        self._commit(batch)
+
+    def _commit(self, batch: List) -> None:
+        with self._commit_lock:
+            written = [(tmp, filename) for tmp, filename, _ in batch if tmp]
+            if self.fsync_every:
+                for tmp, _ in written:
+                    _fsync(tmp)
+            for tmp, filename in written:
+                os.replace(tmp, filename)
+            if self.fsync_every:
+                for directory in {os.path.dirname(filename) for _, filename in written}:
+                    _fsync(directory)
+
+            self.counts["batches"] += 1
+            if self.on_commit is not None:
+                self.on_commit([key for _, _, key in batch])
+
+    def close(self) -> int:
+        """Wait for the writers and commit the last batch, returns the number of files emitted.
+
+        Files already written are committed even when a writer failed, so the
+        output stays usable up to the failure; the error is raised afterwards.
+        """
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            batch, self._pending = self._pending, []
+        if batch:
+            self._commit(batch)
+        if self._error is not None:
+            raise self._error
+        return self.counts["written"] + self.counts["unchanged"]
+
+    def __enter__(self) -> "PageEmitter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            # Keep what was written, but let the original error propagate
+            try:
+                self.close()
+            except Exception:
+                pass
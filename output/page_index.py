@@ -0,0 +1,77 @@
+"""
+Shifa AlHind - Hierarchical Page Index
+country → city → treatment → article tree over manifest pages, built once
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# URL sections that hold the hierarchy: /{locale}/{section}/{country}/{city}/{treatment}/{article}
+HIERARCHY_SECTIONS = ("medical-tourism", "blog")
+
+
+def page_path(url: str) -> Tuple[str, ...]:
+    """Tree path for a URL: (locale, country, city[, treatment[, article]])"""
+    parts = url.split("/")[3:]
+    locale, section, rest = parts[0], parts[1], parts[2:]
+    if section not in HIERARCHY_SECTIONS:
+        return (locale,)
+    return (locale, *rest)
+
+
+class PageIndex:
+    """Parent / children / siblings lookups over manifest pages.
+
+    Every node is keyed by its path tuple; country nodes exist even though
+    there is no country page, so cities still share a parent. Children keep
+    manifest order.
+    """
+
+    def __init__(self, pages: Iterable[Dict]):
+        self.by_url: Dict[str, Dict] = {}
+        self.by_path: Dict[Tuple[str, ...], Dict] = {}
+        self.child_paths: Dict[Tuple[str, ...], List[Tuple[str, ...]]] = {}
+        self._linked = set()
+
+        for page in pages:
+            path = page_path(page["url"])
+            self.by_url[page["url"]] = page
+            self.by_path[path] = page
+            self._link(path)
+
+    def _link(self, path: Tuple[str, ...]) -> None:
+        """Register `path` under its parent, creating missing ancestors"""
+        while len(path) > 1 and path not in self._linked:
+            self._linked.add(path)
+            self.child_paths.setdefault(path[:-1], []).append(path)
+            path = path[:-1]
+
+    def get(self, url: str) -> Optional[Dict]:
+        return self.by_url.get(url)
+
+    def parent(self, url: str) -> Optional[Dict]:
+        """Nearest ancestor that has a page (treatment → city, article → treatment)"""
+        path = page_path(url)[:-1]
+        while len(path) > 1:
+            if path in self.by_path:
+                return self.by_path[path]
+            path = path[:-1]
+        return None
+
+    def children(self, url: str, page_type: str = None) -> List[Dict]:
+        """Direct child pages, optionally filtered by page_type"""
+        pages = [self.by_path[p] for p in self.child_paths.get(page_path(url), ()) if p in self.by_path]
+        if page_type:
+            pages = [p for p in pages if p["page_type"] == page_type]
+        return pages
+
+    def siblings(self, url: str, page_type: str = None) -> List[Dict]:
+        """Pages sharing this page's parent node, excluding the page itself"""
+        path = page_path(url)
+        pages = [
+            self.by_path[p]
+            for p in self.child_paths.get(path[:-1], ())
+            if p != path and p in self.by_path
+        ]
+        if page_type:
+            pages = [p for p in pages if p["page_type"] == page_type]
+        return pages
@@ -0,0 +1,188 @@
+"""
+Shifa AlHind - Build Pipeline
+Runs generator stages as a dependency graph in one process, passing results
+in memory and skipping stages whose inputs hash the same as last time
+"""
+
+import ast
+import hashlib
+import importlib.util
+import os
+import sys
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from build_cache import hash_inputs
+from json_io import dump, load
+from run_report import RunReport
+
+STATE_FILE = ".pipeline_state.json"
+
+
+def load_script(filename):
+    """Import a hyphen-named generator script as a module.
+
+    The module is registered in sys.modules so worker processes can
+    unpickle functions defined in it.
+    """
+    name = os.path.splitext(os.path.basename(filename))[0].replace("-", "_")
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, filename)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def local_sources(*filenames: str) -> List[str]:
+    """The given scripts plus every local module they import, directly or not.
+
+    Imports are read from the source (including ones inside functions) and
+    kept when a `<module>.py` sits next to the importing file, so editing a
+    shared module such as json_io.py changes the key of every stage using it.
+    """
+    found = []
+    pending = list(filenames)
+    while pending:
+        filename = pending.pop()
+        if filename in found:
+            continue
+        found.append(filename)
+        with open(filename, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                path = os.path.join(os.path.dirname(filename), name.split(".")[0] + ".py")
+                if os.path.exists(path):
+                    pending.append(path)
+    return sorted(found)
+
+
+def file_digest(path: str) -> Optional[str]:
+    """SHA-256 of a file's bytes, None when it doesn't exist"""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+class Stage:
+    """One node of the build graph.
+
+    `run(inputs, progress)` receives the results of `deps` by name plus a
+    run_report Stage to count pages and bytes on, and returns this stage's
+    result. `load()` rebuilds that result from the stage's `outputs` on disk
+    when the stage is skipped but a dependent still needs it.
+    """
+
+    def __init__(self, name: str, run: Callable, deps: Iterable[str] = (), sources: Iterable[str] = (),
+                 outputs: Iterable[str] = (), load: Callable = None, options: Dict = None):
+        self.name = name
+        self.run = run
+        self.deps = list(deps)
+        self.sources = list(sources)
+        self.outputs = list(outputs)
+        self.load = load
+        self.options = options or {}
+
+
+class Pipeline:
+    """Stages in dependency order, with per-stage input keys persisted between runs"""
+
+    def __init__(self, stages: List[Stage], state_file: str = STATE_FILE, report=None):
+        self.stages = {stage.name: stage for stage in stages}
+        self.order = self._topological_order(stages)
+        self.state_file = state_file
+        self.report = report or RunReport("pipeline")
+        self.state = self._load_state()
+        self.results: Dict[str, Any] = {}
+
+    @staticmethod
+    def _topological_order(stages: List[Stage]) -> List[str]:
+        """Stage names with every stage after its deps, keeping declaration order otherwise"""
+        names = [stage.name for stage in stages]
+        for stage in stages:
+            unknown = set(stage.deps) - set(names)
+            if unknown:
+                raise ValueError(f"stage {stage.name!r} depends on unknown stage(s): {sorted(unknown)}")
+
+        order = []
+        pending = list(stages)
+        while pending:
+            ready = [stage for stage in pending if all(dep in order for dep in stage.deps)]
+            if not ready:
+                raise ValueError(f"dependency cycle between stages: {[stage.name for stage in pending]}")
+            order.append(ready[0].name)
+            pending.remove(ready[0])
+        return order
+
+    def _load_state(self) -> Dict:
+        if not os.path.exists(self.state_file):
+            return {}
+        return load(self.state_file)
+
+    def _save_state(self):
+        dump(self.state, self.state_file, pretty=True)
+
+    def plan(self, force=False) -> List[Dict]:
+        """Each stage's input key and whether it has to run.
+
+        A key covers the stage's source files, its options and its deps' keys,
+        so a change anywhere upstream re-runs everything downstream of it.
+        """
+        keys = {}
+        plan = []
+        for name in self.order:
+            stage = self.stages[name]
+            keys[name] = hash_inputs(
+                name,
+                {path: file_digest(path) for path in stage.sources},
+                [keys[dep] for dep in stage.deps],
+                stage.options,
+            )
+            previous = self.state.get(name, {})
+            if force:
+                reason = "forced"
+            elif previous.get("key") != keys[name]:
+                reason = "inputs changed" if previous else "never built"
+            elif not all(os.path.exists(path) for path in stage.outputs):
+                reason = "outputs missing"
+            else:
+                reason = None
+            plan.append({"stage": name, "key": keys[name], "run": reason is not None, "reason": reason})
+        return plan
+
+    def result(self, name: str) -> Any:
+        """A stage's result from this run, or loaded from its outputs if it was skipped"""
+        if name not in self.results:
+            stage = self.stages[name]
+            self.results[name] = stage.load() if stage.load else None
+        return self.results[name]
+
+    def run(self, force=False) -> List[Dict]:
+        plan = self.plan(force)
+        for step in plan:
+            stage = self.stages[step["stage"]]
+            if not step["run"]:
+                print(f"⏭️  {stage.name}: inputs unchanged, skipped")
+                continue
+
+            print(f"\n⏳ {stage.name} ({step['reason']})")
+            inputs = {dep: self.result(dep) for dep in stage.deps}
+            with self.report.stage(stage.name) as progress:
+                self.results[stage.name] = stage.run(inputs, progress)
+                progress.add_output(*stage.outputs)
+
+            # Record each stage as it finishes, so a failure later keeps earlier work
+            self.state[stage.name] = {"key": step["key"], "finished_at": datetime.now().isoformat()}
+            self._save_state()
+            print(f"✅ {stage.name} done")
+        return plan
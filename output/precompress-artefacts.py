@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Shifa AlHind - Artefact Precompressor
+Writes gzip -9 siblings of the sitemaps, interlinks and content files, with
+the sources' mtimes, plus a manifest of original and compressed sizes
+"""
+
+import os
+import sys
+
+from precompress import MANIFEST_FILE, PRECOMPRESS_WORKERS, load_previous, precompress, published_files, write_manifest
+
+DEFAULT_DATA_DIR = "../src/data"
+
+
+def get_arg(name, default):
+    """Read `--name VALUE` from the command line"""
+    if name in sys.argv:
+        return sys.argv[sys.argv.index(name) + 1]
+    return default
+
+
+def main():
+    print("=" * 70)
+    print("Shifa AlHind - Artefact Precompressor")
+    print("=" * 70)
+
+    workers = int(get_arg("--workers", PRECOMPRESS_WORKERS))
+    data_dir = get_arg("--data", DEFAULT_DATA_DIR)
+    out = get_arg("--out", MANIFEST_FILE)
+
+    paths = published_files(".", data_dir if os.path.isdir(data_dir) else None)
+    print(f"\n⏳ Compressing {len(paths)} artefacts with {workers} workers...")
+    manifest, written = precompress(paths, workers, previous=load_previous(out))
+
+    for path, entry in manifest["files"].items():
+        print(f"   {path:<48} {entry['size'] / 1024:>8.0f} KB → {entry['gzip_size'] / 1024:>6.0f} KB")
+    totals = manifest["totals"]
+    print(f"\n✅ Compressed: {written} written, {totals['files'] - written} already up to date")
+    print(f"📊 {totals['size'] / 1024:.0f} KB → {totals['gzip_size'] / 1024:.0f} KB ({totals['ratio']:.1%})")
+
+    write_manifest(manifest, out)
+    print(f"💾 Saved: {out}")
+
+    print(f"\n📝 Next Steps:")
+    print(f"   Deploy the .gz files next to the originals; nginx needs `gzip_static on;`")
+
+
+if __name__ == "__main__":
+    main()
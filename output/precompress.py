@@ -0,0 +1,154 @@
+"""
+Shifa AlHind - Precompressed Artefacts
+Writes a maximum-level `.gz` sibling next to each published file, so static
+hosting (nginx gzip_static, Netlify, S3 + CloudFront) serves stored bytes
+instead of compressing on every cold request
+"""
+
+import glob
+import gzip
+import hashlib
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from json_io import dump, load
+from reproducible import build_epoch, reproducible, utc_timestamp
+
+PRECOMPRESS_WORKERS = 4
+PRECOMPRESS_LEVEL = 9
+MANIFEST_FILE = "precompress_manifest.json"
+
+SITEMAP_INDEX = "sitemap_index.xml"
+# Besides the sitemaps
+PUBLISHED_FILES = [
+    "interlink_structure.json",
+    "content_cities_full.json",
+    "content_treatments_full.json",
+    "content_articles_full.json",
+]
+
+
+def published_files(root: str = ".", data_dir: Optional[str] = None) -> List[str]:
+    """The sitemaps, interlinks and content files under `root`, plus the content files in `data_dir`.
+
+    When sitemap_index.xml lists .xml.gz shards, generate-sitemaps.py --gzip
+    already wrote them compressed: plain sitemap shards left over from an
+    earlier run are stale and skipped, so their .gz never replaces a live one.
+    """
+    index = os.path.join(root, SITEMAP_INDEX)
+    paths = [index]
+    if not _lists_gzip_shards(index):
+        paths += sorted(glob.glob(os.path.join(root, "sitemap*.xml")))
+    paths += [os.path.join(root, name) for name in PUBLISHED_FILES]
+    if data_dir:
+        paths += sorted(glob.glob(os.path.join(data_dir, "content_*.json")))
+    return sorted({os.path.normpath(path) for path in paths if os.path.isfile(path)})
+
+
+def _lists_gzip_shards(index: str) -> bool:
+    try:
+        with open(index, encoding="utf-8") as f:
+            return ".xml.gz</loc>" in f.read()
+    except FileNotFoundError:
+        return False
+
+
+def gzip_path(path: str) -> str:
+    return path + ".gz"
+
+
+def _sha256(payload: bytes) -> str:
+    return hashlib.sha256(payload).hexdigest()
+
+
+def load_previous(filename: str = MANIFEST_FILE, level: int = PRECOMPRESS_LEVEL) -> Dict[str, Dict]:
+    """Entries of the last manifest written at `level`, {} when there is none"""
+    try:
+        manifest = load(filename)
+    except FileNotFoundError:
+        return {}
+    return manifest["files"] if manifest.get("level") == level else {}
+
+
+def compress_file(path: str, level: int = PRECOMPRESS_LEVEL, previous: Optional[Dict] = None) -> Tuple[bool, Dict]:
+    """Bring path.gz up to date, returns (whether it was written, manifest entry).
+
+    Freshness is by content: the .gz is kept only when the source and the
+    .gz both hash as recorded in `previous` (the last manifest's entry).
+    The written .gz gets the source's mtime; its header records the file
+    name and the build clock (reproducible mode) or the source's mtime.
+    """
+    target = gzip_path(path)
+    with open(path, "rb") as f:
+        payload = f.read()
+    digest = _sha256(payload)
+
+    if previous and previous.get("sha256") == digest and os.path.exists(target):
+        with open(target, "rb") as f:
+            if _sha256(f.read()) == previous.get("gzip_sha256"):
+                return False, previous
+
+    stat = os.stat(path)
+    header_mtime = build_epoch() if reproducible() else int(stat.st_mtime)
+    buffer = io.BytesIO()
+    with gzip.GzipFile(os.path.basename(path), "wb", level, buffer, mtime=header_mtime) as f:
+        f.write(payload)
+    compressed = buffer.getvalue()
+
+    tmp = f"{target}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(compressed)
+    os.utime(tmp, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.replace(tmp, target)
+
+    return True, {
+        "gzip": target,
+        "size": len(payload),
+        "gzip_size": len(compressed),
+        "ratio": round(len(compressed) / len(payload), 4) if payload else 1.0,
+        "sha256": digest,
+        "gzip_sha256": _sha256(compressed),
+    }
+
+
+def precompress(paths: Iterable[str], workers: int = PRECOMPRESS_WORKERS, level: int = PRECOMPRESS_LEVEL,
+                previous: Optional[Dict[str, Dict]] = None, stage=None) -> Tuple[Dict, int]:
+    """Compress exactly the given paths in parallel, returns (manifest, number of .gz files written).
+
+    zlib releases the GIL while it compresses, so a thread pool keeps all
+    workers busy. `previous` holds the last manifest's entries (see
+    load_previous). The manifest only holds content-derived fields, so
+    identical builds write identical manifests.
+    """
+    previous = previous or {}
+    paths = sorted({path for path in paths if os.path.isfile(path) and not path.endswith(".gz")})
+    files = {}
+    written = 0
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="gzip") as executor:
+        results = executor.map(lambda path: compress_file(path, level, previous.get(path)), paths)
+        for path, (changed, entry) in zip(paths, results):
+            written += changed
+            files[path] = entry
+            if stage is not None:
+                stage.advance()
+
+    size = sum(entry["size"] for entry in files.values())
+    gzip_size = sum(entry["gzip_size"] for entry in files.values())
+    manifest = {
+        "generated_at": utc_timestamp(),
+        "level": level,
+        "files": files,
+        "totals": {
+            "files": len(files),
+            "size": size,
+            "gzip_size": gzip_size,
+            "ratio": round(gzip_size / size, 4) if size else 1.0,
+        },
+    }
+    return manifest, written
+
+
+def write_manifest(manifest: Dict, filename: str = MANIFEST_FILE) -> int:
+    return dump(manifest, filename, pretty=True)
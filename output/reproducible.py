@@ -0,0 +1,107 @@
+"""
+Shifa AlHind - Reproducible Builds
+Per-URL random seeds and a pinned build clock, so two runs over the same
+inputs write byte-identical files
+"""
+
+import hashlib
+import os
+import random
+import subprocess
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+# Changing the salt re-rolls every page's variants without touching the URLs
+BUILD_SALT = os.environ.get("SHIFA_BUILD_SALT", "")
+
+# The generators whose output carries the build clock; they, the modules they
+# import and the catalog date the build when SOURCE_DATE_EPOCH is not set
+_HERE = os.path.dirname(os.path.abspath(__file__))
+EPOCH_GENERATORS = [
+    "full-content-generator.py",
+    "human-content-generator.py",
+    "treatment-city-content-generator.py",
+    "generate-interlinks.py",
+    "generate-sitemaps.py",
+]
+EPOCH_DATA = ["catalog.json"]
+# Outside a git checkout the inputs' digest picks a second within the year after this
+FALLBACK_EPOCH = int(datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp())
+FALLBACK_SPAN = 365 * 24 * 3600
+
+_epoch = None
+
+
+def reproducible() -> bool:
+    """SHIFA_REPRODUCIBLE=1 or SOURCE_DATE_EPOCH (the reproducible-builds.org convention) turns it on"""
+    return "SOURCE_DATE_EPOCH" in os.environ or os.environ.get("SHIFA_REPRODUCIBLE", "") not in ("", "0")
+
+
+def epoch_inputs() -> List[str]:
+    """Paths (relative to output/) of everything that decides the build's content"""
+    from pipeline import local_sources
+
+    generators = [os.path.join(_HERE, name) for name in EPOCH_GENERATORS]
+    sources = [os.path.relpath(path, _HERE) for path in local_sources(*generators)]
+    return sorted(set(sources + EPOCH_DATA))
+
+
+def _commit_epoch(paths: List[str]) -> Optional[int]:
+    """Commit time of the last commit touching `paths`, None outside a git checkout"""
+    try:
+        out = subprocess.run(["git", "log", "-1", "--format=%ct", "--", *paths], cwd=_HERE,
+                             capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return int(out) if out else None
+
+
+def _digest_epoch(paths: List[str]) -> int:
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.encode("utf-8") + b"\0")
+        with open(os.path.join(_HERE, path), "rb") as f:
+            digest.update(f.read())
+    return FALLBACK_EPOCH + int(digest.hexdigest()[:12], 16) % FALLBACK_SPAN
+
+
+def build_epoch() -> int:
+    """SOURCE_DATE_EPOCH, else the last commit touching the inputs, else a digest of them.
+
+    Never file mtimes: a fresh clone, a checkout or a touch must not move the
+    dates stamped into every page.
+    """
+    global _epoch
+    if _epoch is None:
+        if "SOURCE_DATE_EPOCH" in os.environ:
+            _epoch = int(os.environ["SOURCE_DATE_EPOCH"])
+        else:
+            paths = epoch_inputs()
+            _epoch = _commit_epoch(paths) or _digest_epoch(paths)
+    return _epoch
+
+
+def build_time() -> datetime:
+    """The time stamped into generated files: pinned (UTC) in reproducible mode, now otherwise"""
+    if reproducible():
+        return datetime.fromtimestamp(build_epoch(), timezone.utc)
+    return datetime.now()
+
+
+def utc_timestamp() -> str:
+    """build_time() in UTC as ISO-8601 with a Z suffix"""
+    if reproducible():
+        moment = datetime.fromtimestamp(build_epoch(), timezone.utc)
+    else:
+        moment = datetime.now(timezone.utc)
+    return moment.replace(tzinfo=None).isoformat() + "Z"
+
+
+def build_options() -> Dict:
+    """What a pipeline stage key needs to know about the build mode"""
+    return {"salt": BUILD_SALT, "epoch": build_epoch() if reproducible() else None}
+
+
+def page_rng(url: str) -> random.Random:
+    """Per-page RNG seeded from the build salt and the URL, so output never depends on run or scheduling"""
+    return random.Random(f"{BUILD_SALT}{url}")
@@ -0,0 +1,149 @@
+"""
+Shifa AlHind - Run Reports
+Per-stage wall/CPU time, throughput, peak RSS, bytes written and cache hit
+ratios for a generator run, written as JSON next to the run's output
+"""
+
+import os
+import platform
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from json_io import dump
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+def peak_rss_kib(who: str = "self") -> Optional[int]:
+    """Peak resident set size of this process (or its reaped children) in KiB"""
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if who == "children" else resource.RUSAGE_SELF)
+    # ru_maxrss is KiB on Linux but bytes on macOS
+    return usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+
+
+def cpu_seconds() -> float:
+    """User + system CPU time of this process and its reaped children"""
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+
+def format_eta(seconds: float) -> str:
+    seconds = int(seconds)
+    return f"{seconds // 3600}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+class Stage:
+    """Counters for one timed stage of a run"""
+
+    def __init__(self, name: str, total: Optional[int] = None):
+        self.name = name
+        self.total = total
+        self.pages = 0
+        self.output_bytes = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.started = time.perf_counter()
+
+    def advance(self, n: int = 1):
+        self.pages += n
+
+    def rate(self) -> float:
+        elapsed = time.perf_counter() - self.started
+        return self.pages / elapsed if elapsed > 0 else 0.0
+
+    def progress(self) -> str:
+        """Throughput and, when the total is known, the estimated time left"""
+        rate = self.rate()
+        text = f"{rate:,.0f} pages/s"
+        if self.total and rate:
+            text += f", ETA {format_eta((self.total - self.pages) / rate)}"
+        return text
+
+    def add_output(self, *paths: str):
+        """Count the bytes of files (or whole directories) this stage wrote"""
+        for path in paths:
+            if os.path.isdir(path):
+                for root, _, files in os.walk(path):
+                    self.output_bytes += sum(os.path.getsize(os.path.join(root, f)) for f in files)
+            elif os.path.isfile(path):
+                self.output_bytes += os.path.getsize(path)
+
+    def add_cache(self, hits: int = 0, misses: int = 0):
+        self.cache_hits += hits
+        self.cache_misses += misses
+
+
+class RunReport:
+    """Collects Stage results for one entry point and saves them as JSON"""
+
+    def __init__(self, name: str, filename: Optional[str] = None):
+        self.name = name
+        self.filename = filename or f"run_report_{name}.json"
+        self.stages: List[Dict] = []
+        self.pages = 0
+        self.started_at = datetime.now().isoformat()
+        self._wall = time.perf_counter()
+        self._cpu = cpu_seconds()
+
+    @contextmanager
+    def stage(self, name: str, total: Optional[int] = None, new_pages: bool = True):
+        """Time a block; the yielded Stage collects pages, bytes and cache counts.
+
+        Pass new_pages=False for stages that re-process pages an earlier stage
+        already produced (compaction, sharding), so the run total counts each once.
+        """
+        stage = Stage(name, total)
+        cpu = cpu_seconds()
+        try:
+            yield stage
+        finally:
+            wall = time.perf_counter() - stage.started
+            lookups = stage.cache_hits + stage.cache_misses
+            if new_pages:
+                self.pages += stage.pages
+            self.stages.append({
+                "stage": name,
+                "pages": stage.pages,
+                "wall_seconds": round(wall, 4),
+                "cpu_seconds": round(cpu_seconds() - cpu, 4),
+                "pages_per_sec": round(stage.pages / wall, 1) if wall > 0 else None,
+                "peak_rss_kib": peak_rss_kib(),
+                "output_bytes": stage.output_bytes,
+                "cache_hits": stage.cache_hits,
+                "cache_misses": stage.cache_misses,
+                "cache_hit_ratio": round(stage.cache_hits / lookups, 4) if lookups else None,
+            })
+
+    def as_dict(self) -> Dict:
+        wall = time.perf_counter() - self._wall
+        pages = self.pages
+        return {
+            "run": self.name,
+            "started_at": self.started_at,
+            "finished_at": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "wall_seconds": round(wall, 4),
+            "cpu_seconds": round(cpu_seconds() - self._cpu, 4),
+            "pages": pages,
+            "pages_per_sec": round(pages / wall, 1) if wall > 0 else None,
+            "peak_rss_kib": peak_rss_kib(),
+            "children_peak_rss_kib": peak_rss_kib("children"),
+            "output_bytes": sum(s["output_bytes"] for s in self.stages),
+            "stages": self.stages,
+        }
+
+    def write(self) -> Dict:
+        report = self.as_dict()
+        dump(report, self.filename, pretty=True)
+        print(f"📊 Run report: {self.filename} "
+              f"({report['wall_seconds']:.1f}s, {report['pages']:,} pages, "
+              f"{report['output_bytes']:,} bytes, peak RSS {report['peak_rss_kib'] or 0:,} KiB)")
+        return report
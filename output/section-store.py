@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Shifa AlHind - Section Store Builder
+Deduplicates page bodies into content-addressed paragraph sections and
+verifies every page reassembles byte-for-byte
+"""
+
+import os
+import sys
+import time
+
+from json_io import load
+from section_store import DEFAULT_SECTION_DIR, SectionStore
+
+DEFAULT_SOURCES = [
+    "content_articles_full.json",
+    "content_treatments_full.json",
+    "content_cities_full.json",
+]
+
+
+def main():
+    print("=" * 70)
+    print("Shifa AlHind - Section Store Builder")
+    print("=" * 70)
+
+    args = sys.argv[1:]
+    root = DEFAULT_SECTION_DIR
+    if "--out" in args:
+        position = args.index("--out")
+        root = args[position + 1]
+        del args[position:position + 2]
+
+    sources = args or [f for f in DEFAULT_SOURCES if os.path.exists(f)]
+
+    print(f"\n⏳ Storing {len(sources)} content files in {root}/...")
+    store = SectionStore(root)
+    bodies = {}
+    body_bytes = 0
+    for filename in sources:
+        pages = load(filename)
+        count, added = store.add_pages(pages)
+        for page in pages:
+            bodies[page["url"]] = page.get("full_content") or ""
+            body_bytes += len(bodies[page["url"]].encode("utf-8"))
+        print(f"✅ Stored: {filename} ({count} pages, {added} new sections)")
+
+    print(f"\n⏳ Verifying reassembly...")
+    start = time.perf_counter()
+    reader = SectionStore(root)
+    mismatched = [url for url, body in bodies.items() if reader.page_content(url) != body]
+    elapsed = time.perf_counter() - start
+    if mismatched:
+        print(f"❌ {len(mismatched)} pages do not reassemble, e.g. {mismatched[0]}")
+        sys.exit(1)
+    print(f"✅ All {len(bodies)} pages reassemble exactly ({elapsed * 1000:.0f} ms including load)")
+
+    stats = reader.stats()
+    print(f"\n📊 Sections:")
+    print(f"   Unique sections: {stats['sections']:,} ({stats['section_refs']:,} references)")
+    print(f"   Body text: {body_bytes:,} bytes → store: {stats['bytes']:,} bytes")
+    if stats["bytes"]:
+        print(f"   Ratio: {body_bytes / stats['bytes']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Shifa AlHind - Content-Addressed Section Store
+Page bodies split into paragraph sections, each stored once under its hash;
+a page is just the ordered list of its section hashes
+"""
+
+import hashlib
+import os
+import re
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from json_io import dump, dumps, load, loads
+
+DEFAULT_SECTION_DIR = "content_sections"
+BLOBS_FILENAME = "blobs.ndjson"
+PAGES_FILENAME = "pages.json"
+
+# Cut after each blank line, so boilerplate paragraphs (CTA, contact block,
+# disclaimer, FAQ answers) hash the same on every page that shares them
+_SECTION_BREAK = re.compile(r"(?<=\n\n)")
+
+
+def split_sections(text: str) -> List[str]:
+    """Paragraph sections of a body; joining them gives the body back exactly"""
+    return [section for section in _SECTION_BREAK.split(text) if section]
+
+
+def section_hash(section: str) -> str:
+    return hashlib.blake2b(section.encode("utf-8"), digest_size=8).hexdigest()
+
+
+class SectionStore:
+    """Append-only blob log plus a url → section hashes map.
+
+    blobs.ndjson holds one [hash, text] line per unique section and only
+    ever grows; pages.json is rewritten atomically after the blobs it
+    references are on disk, so a crash never leaves a page pointing at a
+    missing section.
+    """
+
+    def __init__(self, root: str = DEFAULT_SECTION_DIR):
+        self.root = root
+        self.blobs_path = os.path.join(root, BLOBS_FILENAME)
+        self.pages_path = os.path.join(root, PAGES_FILENAME)
+        self._blobs = None
+        self._pages = None
+
+    @property
+    def blobs(self) -> Dict[str, str]:
+        if self._blobs is None:
+            self._blobs = {}
+            if os.path.exists(self.blobs_path):
+                with open(self.blobs_path, "rb") as f:
+                    for line in f:
+                        try:
+                            digest, text = loads(line)
+                        except ValueError:
+                            # Torn final line from an interrupted append; nothing references it
+                            break
+                        self._blobs[digest] = text
+        return self._blobs
+
+    @property
+    def pages(self) -> Dict[str, List[str]]:
+        if self._pages is None:
+            self._pages = load(self.pages_path)["pages"] if os.path.exists(self.pages_path) else {}
+        return self._pages
+
+    def add_pages(self, pages: Iterable[Dict], field: str = "full_content") -> Tuple[int, int]:
+        """Store each page's body, returns (pages stored, new sections written)"""
+        os.makedirs(self.root, exist_ok=True)
+        blobs = self.blobs
+        new_lines = []
+        count = 0
+
+        for page in pages:
+            hashes = []
+            for section in split_sections(page.get(field) or ""):
+                digest = section_hash(section)
+                known = blobs.get(digest)
+                if known is None:
+                    blobs[digest] = section
+                    new_lines.append(dumps([digest, section]))
+                elif known != section:
+                    raise ValueError(f"section hash collision on {digest}")
+                hashes.append(digest)
+            self.pages[page["url"]] = hashes
+            count += 1
+
+        if new_lines:
+            with open(self.blobs_path, "a", encoding="utf-8") as f:
+                f.write("\n".join(new_lines) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        dump({"version": 1, "pages": self.pages}, self.pages_path, pretty=False)
+        return count, len(new_lines)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self.pages
+
+    def page_content(self, url: str) -> str:
+        """Reassemble one page body from its sections"""
+        blobs = self.blobs
+        return "".join([blobs[digest] for digest in self.pages[url]])
+
+    def iter_pages(self) -> Iterator[Tuple[str, str]]:
+        """(url, body) for every stored page"""
+        blobs = self.blobs
+        for url, hashes in self.pages.items():
+            yield url, "".join([blobs[digest] for digest in hashes])
+
+    def stats(self) -> Dict[str, int]:
+        referenced = sum(len(hashes) for hashes in self.pages.values())
+        return {
+            "pages": len(self.pages),
+            "sections": len(self.blobs),
+            "section_refs": referenced,
+            "bytes": sum(os.path.getsize(p) for p in (self.blobs_path, self.pages_path) if os.path.exists(p)),
+        }
+
+
+def write_section_store(pages: Iterable[Dict], root: str = DEFAULT_SECTION_DIR) -> Dict[str, int]:
+    """Add pages to the store under `root`, returns store stats plus sections added"""
+    store = SectionStore(root)
+    _, added = store.add_pages(pages)
+    return {**store.stats(), "added": added}
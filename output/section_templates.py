@@ -0,0 +1,124 @@
+"""
+Shifa AlHind - Precompiled Section Templates
+Section text compiled once into static segments, slots and variant tables,
+so rendering a page is a few rng draws plus one string build per section
+"""
+
+import random
+from string import Formatter
+from typing import Callable, Dict, List, Tuple, Union
+
+_formatter = Formatter()
+
+
+def _compile(source: str, variant_names) -> Tuple[Callable, List[str]]:
+    """Turn template source into one f-string function, built once.
+
+    Static text becomes string constants and slots become `v[name]` (values)
+    or `d[i]` (the i-th variant draw) fields, so a render runs as a single
+    BUILD_STRING instead of re-parsing the source.
+    """
+    pieces = []
+    draws = []
+    for literal, field, spec, conversion in _formatter.parse(source):
+        if literal:
+            pieces.append(repr(literal))
+        if field is None:
+            continue
+        if not field.isidentifier() or conversion or "{" in (spec or "") or '"' in (spec or ""):
+            raise ValueError(f"unsupported template slot: {{{field}}}")
+        if field in variant_names:
+            if field in draws:
+                raise ValueError(f"variant slot used twice in template: {field}")
+            target = f"d[{len(draws)}]"
+            draws.append(field)
+        else:
+            target = f"v['{field}']"
+        pieces.append(f'f"{{{target}:{spec}}}"' if spec else f'f"{{{target}}}"')
+
+    body = " ".join(pieces) or "''"
+    return eval(f"lambda v, d: {body}", {}), draws
+
+
+class Template:
+    """Source text compiled once into static segments and slots.
+
+    `{name}` / `{name:spec}` slots are filled from the values passed to
+    render(). Slots named in `variants` instead draw one entry from that
+    table with rng.choice, in source order, so a seeded rng picks exactly
+    what the equivalent inline f-string would have. A variant entry that
+    is itself a Template is rendered with the same values; a plain str is
+    emitted verbatim.
+
+    render_variant() picks by index instead: the template's variant space
+    (variant_count() distinct renderings, nested tables included) is
+    numbered in mixed radix, one digit per table in draw order.
+    """
+
+    __slots__ = ("source", "variants", "_fill", "_tables", "_sizes", "_count")
+
+    def __init__(self, source: str, **variants):
+        self.source = source
+        self.variants: Dict[str, Tuple[Union[str, "Template"], ...]] = {
+            name: tuple(entries) for name, entries in variants.items()
+        }
+        self._fill, draws = _compile(source, self.variants)
+        missing = set(self.variants) - set(draws)
+        if missing:
+            raise ValueError(f"variant tables without a slot: {sorted(missing)}")
+
+        # Variant tables in the order their slots appear, which is the order they draw
+        self._tables = [self.variants[name] for name in draws]
+        # Renderings each entry contributes to its table, and the space of the whole template
+        self._sizes = [
+            [entry.variant_count() if isinstance(entry, Template) else 1 for entry in table]
+            for table in self._tables
+        ]
+        self._count = 1
+        for sizes in self._sizes:
+            self._count *= sum(sizes)
+
+    def render(self, values: Dict = None, rng=random) -> str:
+        drawn = []
+        for table in self._tables:
+            entry = rng.choice(table)
+            drawn.append(entry.render(values, rng) if isinstance(entry, Template) else entry)
+        return self._fill(values, drawn)
+
+    def variant_count(self) -> int:
+        """Number of distinct variant choices, nested tables included"""
+        return self._count
+
+    def variant_radices(self) -> List[int]:
+        """Size of each variant table in draw order (nested tables count within their entry)"""
+        return [sum(sizes) for sizes in self._sizes]
+
+    def render_variant(self, values: Dict = None, index: int = 0) -> str:
+        """Render the `index`-th point of the variant space (taken modulo its size)"""
+        digits = []
+        index %= self._count
+        for sizes in self._sizes:
+            index, digit = divmod(index, sum(sizes))
+            digits.append(digit)
+        return self.render_digits(values, digits)
+
+    def render_digits(self, values: Dict, digits: List[int]) -> str:
+        """Render with one chosen position per variant table"""
+        drawn = []
+        for table, sizes, digit in zip(self._tables, self._sizes, digits):
+            for entry, size in zip(table, sizes):
+                if digit < size:
+                    break
+                digit -= size
+            drawn.append(entry.render_variant(values, digit) if isinstance(entry, Template) else entry)
+        return self._fill(values, drawn)
+
+    def as_data(self):
+        """Plain-data form of the template and its variant tables, for cache keys"""
+        return [
+            self.source,
+            {
+                name: [entry.as_data() if isinstance(entry, Template) else entry for entry in entries]
+                for name, entries in self.variants.items()
+            },
+        ]
@@ -0,0 +1,85 @@
+"""
+Shifa AlHind - Append-Only Checkpoint Segments
+Small per-batch NDJSON segments that make long generator runs resumable
+"""
+
+import glob
+import os
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+from json_io import dump
+from manifest_io import iter_ndjson, write_ndjson
+
+SEGMENT_PATTERN = "segment_{:05d}.ndjson"
+
+
+def list_segments(directory: str) -> List[str]:
+    """Return segment files in write order"""
+    return sorted(glob.glob(os.path.join(directory, "segment_*.ndjson")))
+
+
+def iter_segment_records(directory: str) -> Iterator[Dict]:
+    """Yield every record from every segment, oldest first"""
+    for segment in list_segments(directory):
+        yield from iter_ndjson(segment)
+
+
+def completed_urls(directory: str) -> Set[str]:
+    """URLs already present in the segments (used by --resume)"""
+    return {record["url"] for record in iter_segment_records(directory)}
+
+
+def clear_segments(directory: str) -> None:
+    """Remove segments left over from a previous run"""
+    for segment in list_segments(directory):
+        os.remove(segment)
+
+
+class SegmentWriter:
+    """Buffers records and appends one small segment file per batch"""
+
+    def __init__(self, directory: str, batch_size: int = 100):
+        self.directory = directory
+        self.batch_size = batch_size
+        self.buffer = []
+        os.makedirs(directory, exist_ok=True)
+        self.next_index = len(list_segments(directory)) + 1
+
+    def add(self, record: Dict) -> Optional[str]:
+        """Buffer a record, returns the segment filename when a batch was flushed"""
+        self.buffer.append(record)
+        if len(self.buffer) >= self.batch_size:
+            return self.flush()
+        return None
+
+    def flush(self) -> Optional[str]:
+        """Write buffered records to a new segment (temp file + rename, so it is all-or-nothing)"""
+        if not self.buffer:
+            return None
+
+        segment = os.path.join(self.directory, SEGMENT_PATTERN.format(self.next_index))
+        write_ndjson(self.buffer, segment + ".tmp")
+        os.replace(segment + ".tmp", segment)
+
+        self.buffer = []
+        self.next_index += 1
+        return segment
+
+
+def compact_segments(directory: str, filename: str, order: Iterable[str] = None) -> List[Dict]:
+    """Merge all segments into one JSON array, in `order` (URLs) when given.
+
+    Later segments win when a URL appears twice. Returns the merged records.
+    """
+    records = {}
+    for record in iter_segment_records(directory):
+        records[record["url"]] = record
+
+    if order is not None:
+        merged = [records[url] for url in order if url in records]
+    else:
+        merged = list(records.values())
+
+    dump(merged, filename)
+
+    return merged
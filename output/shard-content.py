@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Shifa AlHind - Content Sharder
+Splits monolithic content files into per-URL shards, each with its body
+pre-rendered to HTML, plus a slim lookup index
+"""
+
+import os
+import sys
+
+from build_cache import BuildCache
+from content_shards import DEFAULT_SHARD_DIR, INDEX_FILENAME, load_index, write_content_shards
+from json_io import load
+
+DEFAULT_SOURCES = [
+    "content_articles_full.json",
+    "content_treatments_full.json",
+    "content_cities_full.json",
+]
+
+
+def main():
+    print("=" * 70)
+    print("Shifa AlHind - Content Sharder")
+    print("=" * 70)
+
+    args = sys.argv[1:]
+    root = DEFAULT_SHARD_DIR
+    if "--out" in args:
+        position = args.index("--out")
+        root = args[position + 1]
+        del args[position:position + 2]
+    workers = 1
+    if "--workers" in args:
+        position = args.index("--workers")
+        workers = int(args[position + 1])
+        del args[position:position + 2]
+    cache = None
+    if "--no-cache" in args:
+        args.remove("--no-cache")
+    else:
+        cache = BuildCache()
+
+    sources = args or [f for f in DEFAULT_SOURCES if os.path.exists(f)]
+
+    print(f"\n⏳ Sharding {len(sources)} content files into {root}/...")
+    for filename in sources:
+        pages = load(filename)
+        count = write_content_shards(pages, root, workers, cache)
+        print(f"✅ Sharded: {filename} ({count} pages + HTML)")
+    if cache is not None:
+        print(f"✅ HTML: {cache.hits} fragments reused from the build cache, {cache.misses} rendered")
+
+    print(f"✅ Saved: {os.path.join(root, INDEX_FILENAME)} ({len(load_index(root))} pages)")
+
+    print(f"\n📝 Next Steps:")
+    print(f"   Copy {root}/ to src/data/content_shards/ so content-service.ts reads one page per render")
+
+
+if __name__ == "__main__":
+    main()
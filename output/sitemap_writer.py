@@ -0,0 +1,145 @@
+"""
+Shifa AlHind - Streaming Sitemap Writer
+Writes sitemap XML incrementally, rolling over to new shards at protocol limits
+"""
+
+import gzip
+import os
+from typing import List
+from xml.sax.saxutils import escape, quoteattr
+
+from reproducible import build_time
+
+# sitemaps.org protocol limits (per file, uncompressed)
+MAX_URLS = 50000
+MAX_BYTES = 50 * 1024 * 1024
+
+XML_HEADER = '<?xml version="1.0" encoding="utf-8"?>\n'
+URLSET_OPEN = (
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" '
+    'xmlns:xhtml="http://www.w3.org/1999/xhtml">\n'
+)
+URLSET_CLOSE = "</urlset>\n"
+SITEMAPINDEX_OPEN = '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+SITEMAPINDEX_CLOSE = "</sitemapindex>\n"
+
+
+def render_url_entry(loc, priority, changefreq, lastmod, alternates):
+    """Render one <url> element; `alternates` is a list of (hreflang, href)"""
+    lines = [
+        "  <url>\n",
+        f"    <loc>{escape(loc)}</loc>\n",
+        f"    <priority>{priority}</priority>\n",
+        f"    <changefreq>{changefreq}</changefreq>\n",
+        f"    <lastmod>{lastmod}</lastmod>\n",
+    ]
+    for hreflang, href in alternates:
+        lines.append(f'    <xhtml:link rel="alternate" hreflang={quoteattr(hreflang)} href={quoteattr(href)}/>\n')
+    lines.append("  </url>\n")
+    return "".join(lines)
+
+
+class ShardedSitemapWriter:
+    """Streams <url> entries into `basename`.xml, then `basename`_2.xml, ...
+
+    A new shard is started before an entry would push the current one past
+    `max_urls` entries or `max_bytes` uncompressed bytes. With `compress`,
+    shards are written as .xml.gz.
+    """
+
+    def __init__(self, basename: str, max_urls: int = MAX_URLS, max_bytes: int = MAX_BYTES, compress: bool = False):
+        self.basename = basename
+        self.max_urls = max_urls
+        self.max_bytes = max_bytes
+        self.compress = compress
+        self.shards: List[str] = []
+        self.url_count = 0
+        self._file = None
+        self._urls = 0
+        self._bytes = 0
+
+    def _shard_name(self, number):
+        suffix = "" if number == 1 else f"_{number}"
+        extension = ".xml.gz" if self.compress else ".xml"
+        return f"{self.basename}{suffix}{extension}"
+
+    def _write(self, text):
+        data = text.encode("utf-8")
+        self._file.write(data)
+        self._bytes += len(data)
+
+    def _open_shard(self):
+        filename = self._shard_name(len(self.shards) + 1)
+        if self.compress:
+            # The gzip header's timestamp follows the build clock, so reproducible builds stay byte-identical
+            self._file = gzip.GzipFile(filename, "wb", compresslevel=9, mtime=build_time().timestamp())
+        else:
+            self._file = open(filename, "wb")
+        self.shards.append(filename)
+        self._urls = 0
+        self._bytes = 0
+        self._write(XML_HEADER + URLSET_OPEN)
+
+    def _close_shard(self):
+        if self._file:
+            self._write(URLSET_CLOSE)
+            self._file.close()
+            self._file = None
+
+    def add(self, loc, priority, changefreq, lastmod, alternates=()):
+        """Append one URL, rolling over to a new shard when a limit would be exceeded"""
+        entry = render_url_entry(loc, priority, changefreq, lastmod, alternates)
+        size = len(entry.encode("utf-8"))
+
+        if self._file and (
+            self._urls >= self.max_urls or self._bytes + size + len(URLSET_CLOSE) > self.max_bytes
+        ):
+            self._close_shard()
+        if not self._file:
+            self._open_shard()
+
+        self._write(entry)
+        self._urls += 1
+        self.url_count += 1
+
+    def close(self) -> List[str]:
+        """Finish the current shard (always at least one), returns every shard filename.
+
+        Numbered shards past the last one written are left over from a
+        larger earlier run and are deleted, so they are never published.
+        """
+        if not self.shards:
+            self._open_shard()
+        self._close_shard()
+        number = len(self.shards) + 1
+        while os.path.exists(self._shard_name(number)):
+            os.remove(self._shard_name(number))
+            number += 1
+        return self.shards
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def existing_shards(basename: str, compress: bool = False) -> List[str]:
+    """Shard files a finished writer for `basename` left on disk, in order"""
+    writer = ShardedSitemapWriter(basename, compress=compress)
+    shards = []
+    while os.path.exists(writer._shard_name(len(shards) + 1)):
+        shards.append(writer._shard_name(len(shards) + 1))
+    return shards
+
+
+def write_sitemap_index(filename, locations, lastmod):
+    """Write a <sitemapindex> listing every shard location"""
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write(XML_HEADER + SITEMAPINDEX_OPEN)
+        for loc in locations:
+            f.write("  <sitemap>\n")
+            f.write(f"    <loc>{escape(loc)}</loc>\n")
+            f.write(f"    <lastmod>{lastmod}</lastmod>\n")
+            f.write("  </sitemap>\n")
+        f.write(SITEMAPINDEX_CLOSE)
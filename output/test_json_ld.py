@@ -0,0 +1,17 @@
+"""
+Shifa AlHind - JSON-LD Builder Tests
+"""
+
+from catalog import GCC_STRUCTURE, TREATMENT_COSTS, TREATMENTS
+from json_io import loads
+from json_ld import treatment_json_ld
+
+
+def test_treatment_cost_is_a_monetary_amount_range():
+    country = GCC_STRUCTURE[0]
+    treatment = next(treatment for treatment in TREATMENTS if treatment["slug"] in TREATMENT_COSTS)
+    nodes = loads(treatment_json_ld(country, country["cities"][0], treatment))["@graph"]
+    cost = next(node for node in nodes if node["@type"] == "MedicalProcedure")["cost"]
+    assert set(cost) == {"@type", "currency", "minValue", "maxValue"}
+    assert cost["@type"] == "MonetaryAmount"
+    assert (cost["minValue"], cost["maxValue"]) == tuple(TREATMENT_COSTS[treatment["slug"]]["india"])
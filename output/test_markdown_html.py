@@ -0,0 +1,34 @@
+"""
+Shifa AlHind - Markdown Renderer Tests
+"""
+
+from markdown_html import render_inline
+
+NO_CLASSES = {}
+
+
+def test_emphasis_markers_inside_href_stay_literal():
+    html = render_inline("[guide](https://example.com/__x__/*y*/a_b_c)", NO_CLASSES)
+    assert 'href="https://example.com/__x__/*y*/a_b_c"' in html
+    assert "<strong>" not in html and "<em>" not in html
+
+
+def test_emphasis_applies_to_link_labels():
+    html = render_inline("[**bold** and *em*](/en/blog)", NO_CLASSES)
+    assert html == '<a href="/en/blog"><strong>bold</strong> and <em>em</em></a>'
+
+
+def test_emphasis_around_a_link():
+    html = render_inline("**see [costs](/en/costs)** now", NO_CLASSES)
+    assert html == '<strong>see <a href="/en/costs">costs</a></strong> now'
+
+
+def test_unsafe_href_keeps_only_the_label():
+    html = render_inline("[click *me*](javascript:alert(1))", NO_CLASSES)
+    assert "javascript" not in html and "<em>me</em>" in html
+
+
+def test_protocol_relative_href_keeps_only_the_label():
+    for target in ("//evil.example/x", "/\\evil.example/x"):
+        html = render_inline(f"[site]({target})", NO_CLASSES)
+        assert "href" not in html and "evil.example" not in html and "site" in html
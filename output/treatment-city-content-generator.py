@@ -4,144 +4,99 @@ Shifa AlHind - Treatment & City Page Content Generator
 Generates unique, human-like content for landing pages
 """
 
-import json
-import random
-from datetime import datetime
-
-# Load existing manifest
-with open("content_manifest_full.json", "r", encoding="utf-8") as f:
-    manifest = json.load(f)
-
-# Real data
-BANGALORE_HOSPITALS = [
-    {
-        "name": "Narayana Health City",
-        "specialties": ["Cardiac Surgery", "Oncology", "Orthopedics"],
-        "established": 2001,
-        "doctors": 1200,
-    },
-    {
-        "name": "Manipal Hospital",
-        "specialties": ["Fertility", "Cosmetic Surgery", "Bariatric Surgery"],
-        "established": 1991,
-        "doctors": 850,
-    },
-    {
-        "name": "Apollo Hospital",
-        "specialties": ["Heart Surgery", "Cancer Treatment", "Knee Replacement"],
-        "established": 1997,
-        "doctors": 950,
-    },
-    {
-        "name": "Fortis Hospital",
-        "specialties": ["Dental Implants", "IVF", "Hair Transplant"],
-        "established": 2006,
-        "doctors": 680,
-    },
-]
-
-TREATMENT_COSTS = {
-    "heart-surgery": {"gcc": (25000, 50000), "india": (5000, 12000), "savings": "70-80%"},
-    "knee-replacement": {"gcc": (15000, 30000), "india": (4000, 8000), "savings": "65-75%"},
-    "ivf": {"gcc": (8000, 15000), "india": (2500, 5000), "savings": "60-70%"},
-    "dental-implants": {"gcc": (2000, 5000), "india": (500, 1500), "savings": "65-75%"},
-    "hair-transplant": {"gcc": (5000, 15000), "india": (1500, 4000), "savings": "65-75%"},
-    "cosmetic-surgery": {"gcc": (8000, 20000), "india": (2000, 6000), "savings": "65-75%"},
-    "oncology-treatment": {"gcc": (30000, 100000), "india": (8000, 25000), "savings": "70-80%"},
-    "bariatric-surgery": {"gcc": (15000, 30000), "india": (4000, 8000), "savings": "65-75%"},
-}
-
-FLIGHT_TIMES = {
-    "riyadh": "4.5", "jeddah": "5", "dammam": "4",
-    "dubai": "3.5", "abu-dhabi": "3.5", "sharjah": "3.5",
-    "doha": "3.5", "muscat": "3", "kuwait-city": "4", "manama": "4"
-}
+import sys
+from functools import lru_cache
 
+from catalog import BANGALORE_HOSPITALS, FLIGHT_TIMES, TREATMENT_COSTS
+from content_shards import DEFAULT_SHARD_DIR, ShardEmitter
+from json_io import dump
+from manifest_io import load_manifest
+from markdown_html import html_variants
+from reproducible import build_time, page_rng
+from run_report import RunReport
+from section_store import DEFAULT_SECTION_DIR, write_section_store
+from section_templates import Template
 
-def generate_treatment_page_content(page):
-    """Generate unique content for treatment landing pages"""
+# Existing manifest (NDJSON or JSON), read on first use so build-pipeline.py
+# can import this module and hand it the manifest it already holds in memory
+manifest = None
 
-    # Extract metadata
-    url_parts = page['url'].split('/')
-    locale = page['locale']
-    treatment_slug = url_parts[-1]
-    city_slug = url_parts[-2]
 
-    city_name = city_slug.replace('-', ' ').title()
-    treatment_name = page['h1'].split(' in India')[0] if locale == 'en' else page['h1'].split(' في الهند')[0]
+def get_manifest():
+    global manifest
+    if manifest is None:
+        manifest = load_manifest()
+    return manifest
 
-    # Get cost data
-    costs = TREATMENT_COSTS.get(treatment_slug, {"gcc": (15000, 30000), "india": (4000, 8000), "savings": "60-70%"})
-    flight_time = FLIGHT_TIMES.get(city_slug, "3.5-4")
 
-    # Generate unique content
-    content = f"""# {treatment_name} in India for {city_name} Patients
+# Landing pages list only hospitals with a published profile (established, doctors)
+PROFILED_HOSPITALS = [h for h in BANGALORE_HOSPITALS if "established" in h]
 
-{random.choice([
-    f"Every week, dozens of patients from {city_name} discover they can get {treatment_name} in India for 60-70% less—without compromising quality.",
-    f"Planning {treatment_name} from {city_name}? You're not alone. Hundreds of GCC patients choose India each month for world-class care at affordable prices.",
-    f"What if I told you that {treatment_name} in India costs less than a third of what you'd pay in {city_name}—and the quality is often better?",
-])}
+
+TREATMENT_PAGE_TEMPLATE = Template(
+    """# {treatment_name} in India for {city_name} Patients
+
+{intro}
 
 ## Why {city_name} Patients Choose India
 
-{random.choice([
-    "The math is simple. The quality isn't compromised. The experience exceeds expectations.",
-    "Let me break down what makes India the #1 destination for medical tourism from the GCC.",
-    "Here's what matters when you're considering medical treatment abroad:",
-])}
+{why}
 
 ### Cost Comparison: {city_name} vs Bangalore
 
 | Item | {city_name}/GCC | Bangalore, India | You Save |
 |------|----------------|------------------|----------|
-| {treatment_name} | ${costs['gcc'][0]:,}-${costs['gcc'][1]:,} | ${costs['india'][0]:,}-${costs['india'][1]:,} | **{costs['savings']}** |
+| {treatment_name} | ${gcc_min:,}-${gcc_max:,} | ${india_min:,}-${india_max:,} | **{savings}** |
 | Hospital Stay (per day) | $800-1,200 | $150-300 | ~75% |
 | Follow-up Visits | $200-400 | $40-80 | ~80% |
-| **Total Average Savings** | - | - | **${(costs['gcc'][0] + costs['gcc'][1])//2 - (costs['india'][0] + costs['india'][1])//2:,}+** |
+| **Total Average Savings** | - | - | **${average_savings:,}+** |
 
 *Costs include procedure, hospital stay, and immediate post-op care. Add ~$1,500-2,500 for flights and accommodation.*
 
-{random.choice([
-    "That's not a small difference. For many families, these savings make treatment accessible when it wouldn't be otherwise.",
-    "And before you ask—no, lower cost doesn't mean lower quality. More on that in a moment.",
-    "The question isn't whether India is cheaper. The question is: Is the quality comparable? Short answer: Often it's better.",
-])}
+{savings_note}
 
 ### What About Quality?
 
-{random.choice([
-    "Here's what most people don't realize: Bangalore has more JCI-accredited hospitals than most Western cities.",
-    "Let me address the elephant in the room: Yes, the quality is excellent. Here's why:",
-    "Quality concerns are valid. Here's why you can trust Bangalore hospitals:",
-])}
+{quality}
 
 **Top Hospitals for {treatment_name}:**
 
-"""
-
-    # Add 3 relevant hospitals
-    relevant_hospitals = [h for h in BANGALORE_HOSPITALS if any(
-        spec.lower() in treatment_name.lower() or treatment_name.lower() in spec.lower()
-        for spec in h['specialties']
-    )]
-
-    if not relevant_hospitals:
-        relevant_hospitals = random.sample(BANGALORE_HOSPITALS, 3)
-    else:
-        relevant_hospitals = relevant_hospitals[:3]
-
-    for i, hospital in enumerate(relevant_hospitals, 1):
-        content += f"""
-**{i}. {hospital['name']}**
-- Established: {hospital['established']}
-- {hospital['doctors']}+ specialist doctors
+""",
+    intro=[
+        Template("Every week, dozens of patients from {city_name} discover they can get {treatment_name} in India for 60-70% less—without compromising quality."),
+        Template("Planning {treatment_name} from {city_name}? You're not alone. Hundreds of GCC patients choose India each month for world-class care at affordable prices."),
+        Template("What if I told you that {treatment_name} in India costs less than a third of what you'd pay in {city_name}—and the quality is often better?"),
+    ],
+    why=[
+        "The math is simple. The quality isn't compromised. The experience exceeds expectations.",
+        "Let me break down what makes India the #1 destination for medical tourism from the GCC.",
+        "Here's what matters when you're considering medical treatment abroad:",
+    ],
+    savings_note=[
+        "That's not a small difference. For many families, these savings make treatment accessible when it wouldn't be otherwise.",
+        "And before you ask—no, lower cost doesn't mean lower quality. More on that in a moment.",
+        "The question isn't whether India is cheaper. The question is: Is the quality comparable? Short answer: Often it's better.",
+    ],
+    quality=[
+        "Here's what most people don't realize: Bangalore has more JCI-accredited hospitals than most Western cities.",
+        "Let me address the elephant in the room: Yes, the quality is excellent. Here's why:",
+        "Quality concerns are valid. Here's why you can trust Bangalore hospitals:",
+    ],
+)
+
+TREATMENT_HOSPITAL_TEMPLATE = Template(
+    """
+**{position}. {name}**
+- Established: {established}
+- {doctors}+ specialist doctors
 - JCI Accredited
 - Arabic-speaking coordinators available
 - International patient department
 """
+)
 
-    content += f"""
+TREATMENT_JOURNEY_TEMPLATE = Template(
+    """
 
 ### Complete Journey from {city_name}
 
@@ -162,23 +117,29 @@ def generate_treatment_page_content(page):
 - 24/7 WhatsApp support
 - Local doctor coordination if needed
 
-{random.choice([
-    "The entire process is designed around international patients. You're not an afterthought—you're the focus.",
-    "We've coordinated hundreds of patient journeys from the GCC. The process is smooth because we've refined it over years.",
-    "Everything—from airport pickup to follow-up care—is handled by your dedicated Arabic-speaking coordinator.",
-])}
+{closer}
 
 ## What Patients from {city_name} Say
 
-"""
-    months_ago = random.randint(3, 15)
-    testimonial = random.choice([
-        f'"I saved over $20,000 and got better care than I would have locally. My coordinator spoke Arabic, the hospital was spotless, and the surgeon had 25 years of experience." — Patient from {city_name}, {months_ago} months ago',
-        f'"Initially skeptical, but the quality exceeded expectations. The hospital was more modern than facilities I have seen in the GCC." — {city_name} patient testimonial',
-        f'"The cost savings were significant, but what impressed me most was the attention to detail. Every staff member knew my case." — Patient from {city_name}',
-    ])
-    content += testimonial + "\n\n"
-    content += """
+""",
+    closer=[
+        "The entire process is designed around international patients. You're not an afterthought—you're the focus.",
+        "We've coordinated hundreds of patient journeys from the GCC. The process is smooth because we've refined it over years.",
+        "Everything—from airport pickup to follow-up care—is handled by your dedicated Arabic-speaking coordinator.",
+    ],
+)
+
+TREATMENT_TESTIMONIAL_TEMPLATE = Template(
+    "{testimonial}\n\n",
+    testimonial=[
+        Template('"I saved over $20,000 and got better care than I would have locally. My coordinator spoke Arabic, the hospital was spotless, and the surgeon had 25 years of experience." — Patient from {city_name}, {months_ago} months ago'),
+        Template('"Initially skeptical, but the quality exceeded expectations. The hospital was more modern than facilities I have seen in the GCC." — {city_name} patient testimonial'),
+        Template('"The cost savings were significant, but what impressed me most was the attention to detail. Every staff member knew my case." — Patient from {city_name}'),
+    ],
+)
+
+# Static tail, emitted as-is (its braces are literal text, not slots)
+TREATMENT_PAGE_TAIL = """
 
 ## Frequently Asked Questions
 
@@ -214,35 +175,14 @@ Share your medical reports via WhatsApp (+91-80-1234-5678) or email (care@shifaa
 *Last Updated: {datetime.now().strftime('%B %Y')}*
 """
 
-    return content
+CITY_PAGE_TEMPLATE = Template(
+    """# Medical Tourism from {city_name} to India — Your Complete Guide
 
-
-def generate_city_page_content(page):
-    """Generate unique content for city landing pages"""
-
-    # Extract metadata
-    url_parts = page['url'].split('/')
-    locale = page['locale']
-    city_slug = url_parts[-1]
-
-    city_name = city_slug.replace('-', ' ').title()
-    flight_time = FLIGHT_TIMES.get(city_slug, "3.5-4")
-
-    content = f"""# Medical Tourism from {city_name} to India — Your Complete Guide
-
-{random.choice([
-    f"Last year, over 2,000 patients from {city_name} traveled to India for medical treatment. This year, that number is expected to double.",
-    f"Planning medical treatment abroad from {city_name}? You've come to the right place.",
-    f"India has become the #1 medical tourism destination for {city_name} residents. Here's why—and what you need to know.",
-])}
+{intro}
 
 ## Why Patients from {city_name} Choose India
 
-{random.choice([
-    "The reasons are simple: 60-70% cost savings, JCI-accredited hospitals, and Arabic-speaking support throughout your journey.",
-    "Three things matter most: Quality, cost, and convenience. India delivers on all three.",
-    "Let's be direct: India offers world-class healthcare at prices that make sense for families from {city_name}.",
-])}
+{why}
 
 ### Popular Treatments for {city_name} Patients
 
@@ -258,11 +198,7 @@ def generate_city_page_content(page):
 
 ### Why Bangalore?
 
-{random.choice([
-    "Bangalore isn't just India's tech capital—it's also the medical tourism hub of Asia.",
-    "Here's what makes Bangalore special for medical tourists:",
-    "Bangalore has more JCI-accredited hospitals than most Western cities. That's not an accident.",
-])}
+{bangalore}
 
 - **10+ JCI-Accredited Hospitals** — Highest concentration in India
 - **15,000+ International Patients Monthly** — Established infrastructure
@@ -288,19 +224,11 @@ def generate_city_page_content(page):
 - Serviced apartments available for longer stays
 - Companion can stay same hotel at reduced rates
 
-{random.choice([
-    f"The {flight_time}-hour flight from {city_name} is shorter than many domestic trips. And the savings? Enough to make it worthwhile.",
-    f"Think of it this way: A short {flight_time}-hour flight could save your family $20,000-50,000.",
-    f"Distance isn't the barrier you might think. {city_name} to Bangalore is closer than {city_name} to many European cities—and the healthcare is world-class.",
-])}
+{distance}
 
 ## Cost Savings: Real Numbers
 
-{random.choice([
-    "Let's talk specifics. Here's what procedures actually cost:",
-    "These aren't estimates—these are typical costs we see from {city_name} patients:",
-    "Here are real numbers from patients who traveled from {city_name}:",
-])}
+{costs_intro}
 
 | Procedure | {city_name}/GCC | Bangalore | Savings | Break-Even |
 |-----------|----------------|-----------|---------|-----------|
@@ -313,11 +241,7 @@ def generate_city_page_content(page):
 
 ## What Sets Us Apart
 
-{random.choice([
-    "We've been coordinating medical tourism from the GCC since 2015. Here's what we've learned:",
-    "Having helped over 1,500 GCC patients, we know what matters:",
-    "After years of coordinating patient journeys from the Gulf, we've built a system that works:",
-])}
+{apart}
 
 **1. Dedicated Arabic Coordinator**
 Not a translator—a coordinator who speaks Arabic and handles everything from airport pickup to discharge.
@@ -336,15 +260,52 @@ Video consultations with your surgeon included. Coordination with local doctors
 
 ## Patient Stories from {city_name}
 
-"""
-    patient_name = random.choice(["Ahmed", "Khalid", "Omar"])
-    story = random.choice([
-        f'"I was skeptical about traveling to India for heart surgery. My coordinator made everything easy—handled paperwork, hotel, even pharmacy runs. The surgeon? Trained at Mayo Clinic. Saved $35,000 and got world-class care." — {patient_name}, {city_name} patient',
-        f'"The hospital was nicer than the one I visited in Dubai for consultation. Staff spoke Arabic, food was adjusted to my preferences, and the cost? 70% less than my Dubai quote." — Patient from {city_name}',
-        f'"My wife needed IVF. Three failed cycles locally cost us $30,000. We tried once in Bangalore—it worked. Cost $4,500 total including flights and hotel. We now recommend Shifa AlHind to everyone." — {city_name} couple',
-    ])
-    content += story + "\n\n"
-    content += """
+""",
+    intro=[
+        Template("Last year, over 2,000 patients from {city_name} traveled to India for medical treatment. This year, that number is expected to double."),
+        Template("Planning medical treatment abroad from {city_name}? You've come to the right place."),
+        Template("India has become the #1 medical tourism destination for {city_name} residents. Here's why—and what you need to know."),
+    ],
+    why=[
+        "The reasons are simple: 60-70% cost savings, JCI-accredited hospitals, and Arabic-speaking support throughout your journey.",
+        "Three things matter most: Quality, cost, and convenience. India delivers on all three.",
+        "Let's be direct: India offers world-class healthcare at prices that make sense for families from {city_name}.",
+    ],
+    bangalore=[
+        "Bangalore isn't just India's tech capital—it's also the medical tourism hub of Asia.",
+        "Here's what makes Bangalore special for medical tourists:",
+        "Bangalore has more JCI-accredited hospitals than most Western cities. That's not an accident.",
+    ],
+    distance=[
+        Template("The {flight_time}-hour flight from {city_name} is shorter than many domestic trips. And the savings? Enough to make it worthwhile."),
+        Template("Think of it this way: A short {flight_time}-hour flight could save your family $20,000-50,000."),
+        Template("Distance isn't the barrier you might think. {city_name} to Bangalore is closer than {city_name} to many European cities—and the healthcare is world-class."),
+    ],
+    costs_intro=[
+        "Let's talk specifics. Here's what procedures actually cost:",
+        "These aren't estimates—these are typical costs we see from {city_name} patients:",
+        "Here are real numbers from patients who traveled from {city_name}:",
+    ],
+    apart=[
+        "We've been coordinating medical tourism from the GCC since 2015. Here's what we've learned:",
+        "Having helped over 1,500 GCC patients, we know what matters:",
+        "After years of coordinating patient journeys from the Gulf, we've built a system that works:",
+    ],
+)
+
+CITY_PATIENT_NAMES = ["Ahmed", "Khalid", "Omar"]
+
+CITY_STORY_TEMPLATE = Template(
+    "{story}\n\n",
+    story=[
+        Template('"I was skeptical about traveling to India for heart surgery. My coordinator made everything easy—handled paperwork, hotel, even pharmacy runs. The surgeon? Trained at Mayo Clinic. Saved $35,000 and got world-class care." — {patient_name}, {city_name} patient'),
+        Template('"The hospital was nicer than the one I visited in Dubai for consultation. Staff spoke Arabic, food was adjusted to my preferences, and the cost? 70% less than my Dubai quote." — Patient from {city_name}'),
+        Template('"My wife needed IVF. Three failed cycles locally cost us $30,000. We tried once in Bangalore—it worked. Cost $4,500 total including flights and hotel. We now recommend Shifa AlHind to everyone." — {city_name} couple'),
+    ],
+)
+
+# Static tail, emitted as-is (its braces are literal text, not slots)
+CITY_PAGE_TAIL = """
 
 ## How to Get Started
 
@@ -425,57 +386,144 @@ India is one of world's top medical tourism destinations. {flight_time}-hour fli
 *Last Updated: {datetime.now().strftime('%B %Y')}*
 """
 
-    return content
 
+@lru_cache(maxsize=None)
+def profiled_hospitals_for(treatment_name):
+    """Profiled hospitals whose specialties match a treatment name (computed once per treatment)"""
+    return tuple(h for h in PROFILED_HOSPITALS if any(
+        spec.lower() in treatment_name.lower() or treatment_name.lower() in spec.lower()
+        for spec in h['specialties']
+    ))
+
+
+def generate_treatment_page_content(page):
+    """Generate unique content for treatment landing pages"""
+    rng = page_rng(page['url'])
+
+    # Extract metadata
+    url_parts = page['url'].split('/')
+    locale = page['locale']
+    treatment_slug = url_parts[-1]
+    city_slug = url_parts[-2]
+
+    city_name = city_slug.replace('-', ' ').title()
+    treatment_name = page['h1'].split(' in India')[0] if locale == 'en' else page['h1'].split(' في الهند')[0]
+
+    # Get cost data
+    costs = TREATMENT_COSTS.get(treatment_slug, {"gcc": (15000, 30000), "india": (4000, 8000), "savings": "60-70%"})
+    values = {
+        "city_name": city_name,
+        "treatment_name": treatment_name,
+        "flight_time": FLIGHT_TIMES.get(city_slug, "3.5-4"),
+        "gcc_min": costs['gcc'][0],
+        "gcc_max": costs['gcc'][1],
+        "india_min": costs['india'][0],
+        "india_max": costs['india'][1],
+        "savings": costs['savings'],
+        "average_savings": (costs['gcc'][0] + costs['gcc'][1])//2 - (costs['india'][0] + costs['india'][1])//2,
+    }
+
+    # Generate unique content
+    parts = [TREATMENT_PAGE_TEMPLATE.render(values, rng)]
 
-def main():
-    """Generate treatment and city page content"""
+    # Add 3 relevant hospitals
+    relevant_hospitals = profiled_hospitals_for(treatment_name)
+
+    if not relevant_hospitals:
+        relevant_hospitals = rng.sample(PROFILED_HOSPITALS, 3)
+    else:
+        relevant_hospitals = relevant_hospitals[:3]
+
+    for i, hospital in enumerate(relevant_hospitals, 1):
+        parts.append(TREATMENT_HOSPITAL_TEMPLATE.render({**hospital, "position": i}, rng))
+
+    parts.append(TREATMENT_JOURNEY_TEMPLATE.render(values, rng))
+    values["months_ago"] = rng.randint(3, 15)
+    parts.append(TREATMENT_TESTIMONIAL_TEMPLATE.render(values, rng))
+    parts.append(TREATMENT_PAGE_TAIL)
+
+    return "".join(parts)
+
+
+def generate_city_page_content(page):
+    """Generate unique content for city landing pages"""
+    rng = page_rng(page['url'])
+
+    # Extract metadata
+    url_parts = page['url'].split('/')
+    locale = page['locale']
+    city_slug = url_parts[-1]
+
+    values = {
+        "city_name": city_slug.replace('-', ' ').title(),
+        "flight_time": FLIGHT_TIMES.get(city_slug, "3.5-4"),
+    }
+
+    content = CITY_PAGE_TEMPLATE.render(values, rng)
+    values["patient_name"] = rng.choice(CITY_PATIENT_NAMES)
+    return content + CITY_STORY_TEMPLATE.render(values, rng) + CITY_PAGE_TAIL
+
+
+def main(shards=False, sections=False):
+    """Generate treatment and city page content, returns every generated page"""
     print("=" * 70)
     print("Shifa AlHind - Treatment & City Page Content Generator")
     print("=" * 70)
 
+    report = RunReport("landing_pages")
+    # Shards are written while the pages are generated, not after both files are saved
+    emitter = ShardEmitter(DEFAULT_SHARD_DIR) if shards else None
+
     # Generate treatment pages
-    treatment_pages = [p for p in manifest if p['page_type'] == 'treatment_landing']
+    treatment_pages = [p for p in get_manifest() if p['page_type'] == 'treatment_landing']
     print(f"\n⏳ Generating {len(treatment_pages)} treatment pages...")
 
     treatment_content = []
-    for i, page in enumerate(treatment_pages, 1):
-        content = generate_treatment_page_content(page)
-        treatment_content.append({
-            **page,
-            'full_content': content,
-            'word_count': len(content.split()),
-            'generated_at': datetime.now().isoformat(),
-        })
-        if i % 20 == 0:
-            print(f"   [{i}/{len(treatment_pages)}] Generated {i} treatment pages...")
-
-    # Save treatment pages
-    with open("content_treatments_full.json", "w", encoding="utf-8") as f:
-        json.dump(treatment_content, f, indent=2, ensure_ascii=False)
+    with report.stage("treatment_pages", total=len(treatment_pages)) as stage:
+        for i, page in enumerate(treatment_pages, 1):
+            content = generate_treatment_page_content(page)
+            treatment_content.append({
+                **page,
+                'full_content': content,
+                'word_count': len(content.split()),
+                'generated_at': build_time().isoformat(),
+            })
+            if emitter is not None:
+                emitter.add(treatment_content[-1], html_variants(treatment_content[-1]))
+            stage.advance()
+            if i % 20 == 0:
+                print(f"   [{i}/{len(treatment_pages)}] Generated {i} treatment pages... ({stage.progress()})")
+
+        # Save treatment pages
+        dump(treatment_content, "content_treatments_full.json")
+        stage.add_output("content_treatments_full.json")
 
     avg_treatment = sum(p['word_count'] for p in treatment_content) // len(treatment_content)
     print(f"✅ Treatment pages saved: content_treatments_full.json")
     print(f"   Average: {avg_treatment} words/page")
 
     # Generate city pages
-    city_pages = [p for p in manifest if p['page_type'] == 'city_landing']
+    city_pages = [p for p in get_manifest() if p['page_type'] == 'city_landing']
     print(f"\n⏳ Generating {len(city_pages)} city pages...")
 
     city_content = []
-    for i, page in enumerate(city_pages, 1):
-        content = generate_city_page_content(page)
-        city_content.append({
-            **page,
-            'full_content': content,
-            'word_count': len(content.split()),
-            'generated_at': datetime.now().isoformat(),
-        })
-        print(f"   [{i}/{len(city_pages)}] Generated: {page['url']}")
-
-    # Save city pages
-    with open("content_cities_full.json", "w", encoding="utf-8") as f:
-        json.dump(city_content, f, indent=2, ensure_ascii=False)
+    with report.stage("city_pages", total=len(city_pages)) as stage:
+        for i, page in enumerate(city_pages, 1):
+            content = generate_city_page_content(page)
+            city_content.append({
+                **page,
+                'full_content': content,
+                'word_count': len(content.split()),
+                'generated_at': build_time().isoformat(),
+            })
+            if emitter is not None:
+                emitter.add(city_content[-1], html_variants(city_content[-1]))
+            stage.advance()
+            print(f"   [{i}/{len(city_pages)}] Generated: {page['url']}")
+
+        # Save city pages
+        dump(city_content, "content_cities_full.json")
+        stage.add_output("content_cities_full.json")
 
     avg_city = sum(p['word_count'] for p in city_content) // len(city_content)
     print(f"✅ City pages saved: content_cities_full.json")
@@ -488,6 +536,25 @@ def main():
     print(f"   City pages: {len(city_content)} ({avg_city} words avg)")
     print(f"   Total words: {total_words:,}")
 
+    if emitter is not None:
+        with report.stage("write_shards", new_pages=False) as stage:
+            count = emitter.close()
+            stage.advance(count)
+            stage.add_output(DEFAULT_SHARD_DIR)
+        print(f"   Sharded: {count} pages → {DEFAULT_SHARD_DIR}/")
+
+    if sections:
+        with report.stage("write_sections", new_pages=False) as stage:
+            counts = write_section_store(treatment_content + city_content, DEFAULT_SECTION_DIR)
+            stage.advance(len(treatment_content) + len(city_content))
+            stage.add_output(DEFAULT_SECTION_DIR)
+        print(f"   Sections: {counts['added']} new, {counts['sections']} unique across "
+              f"{counts['pages']} pages → {DEFAULT_SECTION_DIR}/ ({counts['bytes']:,} bytes)")
+
+    print()
+    report.write()
+    return treatment_content + city_content
+
 
 if __name__ == "__main__":
-    main()
+    main(shards="--shards" in sys.argv, sections="--sections" in sys.argv)
@@ -0,0 +1,139 @@
+"""
+Shifa AlHind - Variant Allocator
+Gives every page in a group (e.g. the articles for one city/treatment/locale)
+its own tuple of section variants, computed by mixed-radix indexing instead
+of independent random draws, and reports how much of each space is used
+"""
+
+import hashlib
+from math import comb, gcd
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+
+def mixed_radix(index: int, radices: Sequence[int]) -> Tuple[int, ...]:
+    """Digits of `index` in the given radices, least significant first"""
+    digits = []
+    for radix in radices:
+        index, digit = divmod(index, radix)
+        digits.append(digit)
+    return tuple(digits)
+
+
+def mixed_radix_index(digits: Sequence[int], radices: Sequence[int]) -> int:
+    """Inverse of mixed_radix"""
+    index = 0
+    for digit, radix in zip(reversed(digits), reversed(radices)):
+        index = index * radix + digit
+    return index
+
+
+def unrank_combination(index: int, n: int, k: int) -> Tuple[int, ...]:
+    """The `index`-th k-subset of range(n) in lexicographic order"""
+    chosen = []
+    start = 0
+    for remaining in range(k, 0, -1):
+        for candidate in range(start, n):
+            block = comb(n - candidate - 1, remaining - 1)
+            if index < block:
+                chosen.append(candidate)
+                start = candidate + 1
+                break
+            index -= block
+    return tuple(chosen)
+
+
+def unrank_arrangement(index: int, n: int, k: int) -> Tuple[int, ...]:
+    """The `index`-th ordered k-selection from range(n) (there are perm(n, k))"""
+    pool = list(range(n))
+    chosen = []
+    for digit in mixed_radix(index, range(n, n - k, -1)):
+        chosen.append(pool.pop(digit))
+    return tuple(chosen)
+
+
+def _lcm(values: Iterable[int]) -> int:
+    result = 1
+    for value in values:
+        result = result * value // gcd(result, value)
+    return result
+
+
+class VariantSpace:
+    """Named sections, each a list of independent choices (its digit radices)"""
+
+    def __init__(self, sections: Dict[str, Sequence[int]]):
+        self.sections = {name: [max(1, radix) for radix in radices] for name, radices in sections.items()}
+        self.radices = [radix for radices in self.sections.values() for radix in radices]
+        self.size = 1
+        for radix in self.radices:
+            self.size *= radix
+        self.period = _lcm(self.radices)
+
+    def allocate(self, key: str, count: int, salt: str = "") -> List[Dict[str, int]]:
+        """Variant index per section for `count` sibling pages of the group `key`.
+
+        The group starts from a point of the space derived from its key (and
+        the build salt, when one is given).
+        Sibling k steps the j-th choice of each section forward by
+        k + j * (k // radix), so a choice only repeats once its options run
+        out, and when it does the other choices of the section wrap at
+        different offsets, keeping the section itself distinct. Groups larger
+        than lcm(radices) fall back to consecutive mixed-radix indexes
+        (distinct up to the size of the space). No draws, no retries.
+        """
+        digest = hashlib.blake2b(f"{salt}{key}".encode("utf-8"), digest_size=8).digest()
+        start = int.from_bytes(digest, "big") % self.size
+        base = mixed_radix(start, self.radices)
+        if count > self.period:
+            return [self._by_section(mixed_radix((start + k) % self.size, self.radices)) for k in range(count)]
+
+        positions = [j for radices in self.sections.values() for j in range(len(radices))]
+        return [
+            self._by_section([
+                (digit + k + j * (k // radix)) % radix
+                for digit, radix, j in zip(base, self.radices, positions)
+            ])
+            for k in range(count)
+        ]
+
+    def _by_section(self, digits: Sequence[int]) -> Dict[str, int]:
+        choice = {}
+        position = 0
+        for name, radices in self.sections.items():
+            choice[name] = mixed_radix_index(digits[position:position + len(radices)], radices)
+            position += len(radices)
+        return choice
+
+    def usage(self, allocated: List[Dict[str, int]]) -> Dict:
+        """How much of the space a group's allocation covers, overall and per section"""
+        distinct = len({tuple(choice.values()) for choice in allocated})
+        sections = {}
+        for name, radices in self.sections.items():
+            variants = 1
+            for radix in radices:
+                variants *= radix
+            sections[name] = {"variants": variants, "used": len({choice[name] for choice in allocated})}
+        return {
+            "pages": len(allocated),
+            "space": self.size,
+            "distinct_tuples": distinct,
+            "space_used": distinct / self.size,
+            "all_distinct": distinct == len(allocated),
+            "sections": sections,
+        }
+
+
+def usage_summary(groups: Dict[str, Dict]) -> Dict:
+    """Roll-up of per-group usage for the report header"""
+    return {
+        "groups": len(groups),
+        "pages": sum(group["pages"] for group in groups.values()),
+        "groups_all_distinct": sum(1 for group in groups.values() if group["all_distinct"]),
+        # A sibling repeat is a section shared by two siblings although it had room for both
+        "sibling_section_repeats": sum(
+            1
+            for group in groups.values()
+            for section in group["sections"].values()
+            if section["used"] < min(group["pages"], section["variants"])
+        ),
+    }
@@ -4,66 +4,22 @@ City Coverage Expansion Script for Shifa AlHind
 Generates content for 17 new GCC cities with all 14 existing treatments
 """
 
-import json
 import os
-from datetime import datetime
+import sys
 from typing import List, Dict
 
+# Shared catalog lives with the generators in output/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "output"))
+from catalog import ALL_TREATMENTS, NEW_CITIES, city_by_slug, treatment_by_slug  # noqa: E402
+from content_store import ContentStore  # noqa: E402
+from coverage_plan import CITY_COVERAGE, article_url, city_url, generate_from_plan, treatment_url  # noqa: E402
+from json_io import dumps  # noqa: E402
+from reproducible import utc_timestamp  # noqa: E402
+from run_report import RunReport  # noqa: E402
+
 # Base configuration
-BASE_URL = "https://shifaalhind.com"
 DATA_DIR = "src/data"
-
-# NEW cities to add (17 additional cities beyond the original 10)
-NEW_CITIES = [
-    # UAE - 4 new cities
-    {"slug": "ajman", "name": "Ajman", "nameAr": "عجمان", "country": "united-arab-emirates", "countryAr": "الإمارات", "population": "540K"},
-    {"slug": "ras-al-khaimah", "name": "Ras Al Khaimah", "nameAr": "رأس الخيمة", "country": "united-arab-emirates", "countryAr": "الإمارات", "population": "400K"},
-    {"slug": "fujairah", "name": "Fujairah", "nameAr": "الفجيرة", "country": "united-arab-emirates", "countryAr": "الإمارات", "population": "260K"},
-    {"slug": "al-ain", "name": "Al Ain", "nameAr": "العين", "country": "united-arab-emirates", "countryAr": "الإمارات", "population": "850K"},
-
-    # Saudi Arabia - 5 new cities
-    {"slug": "khobar", "name": "Khobar", "nameAr": "الخبر", "country": "saudi-arabia", "countryAr": "السعودية", "population": "730K"},
-    {"slug": "mecca", "name": "Mecca", "nameAr": "مكة", "country": "saudi-arabia", "countryAr": "السعودية", "population": "2.0M"},
-    {"slug": "medina", "name": "Medina", "nameAr": "المدينة", "country": "saudi-arabia", "countryAr": "السعودية", "population": "1.5M"},
-    {"slug": "taif", "name": "Taif", "nameAr": "الطائف", "country": "saudi-arabia", "countryAr": "السعودية", "population": "690K"},
-    {"slug": "tabuk", "name": "Tabuk", "nameAr": "تبوك", "country": "saudi-arabia", "countryAr": "السعودية", "population": "570K"},
-
-    # Qatar - 2 new cities
-    {"slug": "al-wakrah", "name": "Al Wakrah", "nameAr": "الوكرة", "country": "qatar", "countryAr": "قطر", "population": "300K"},
-    {"slug": "al-khor", "name": "Al Khor", "nameAr": "الخور", "country": "qatar", "countryAr": "قطر", "population": "200K"},
-
-    # Oman - 3 new cities
-    {"slug": "sohar", "name": "Sohar", "nameAr": "صحار", "country": "oman", "countryAr": "عمان", "population": "230K"},
-    {"slug": "salalah", "name": "Salalah", "nameAr": "صلالة", "country": "oman", "countryAr": "عمان", "population": "330K"},
-    {"slug": "nizwa", "name": "Nizwa", "nameAr": "نزوى", "country": "oman", "countryAr": "عمان", "population": "100K"},
-
-    # Kuwait - 3 new cities
-    {"slug": "hawalli", "name": "Hawalli", "nameAr": "حولي", "country": "kuwait", "countryAr": "الكويت", "population": "165K"},
-    {"slug": "salmiya", "name": "Salmiya", "nameAr": "السالمية", "country": "kuwait", "countryAr": "الكويت", "population": "150K"},
-    {"slug": "farwaniya", "name": "Farwaniya", "nameAr": "الفروانية", "country": "kuwait", "countryAr": "الكويت", "population": "900K"},
-
-    # Bahrain - 2 new cities (excluding Manama which already exists)
-    {"slug": "muharraq", "name": "Muharraq", "nameAr": "المحرق", "country": "bahrain", "countryAr": "البحرين", "population": "230K"},
-    {"slug": "riffa", "name": "Riffa", "nameAr": "الرفاع", "country": "bahrain", "countryAr": "البحرين", "population": "120K"},
-]
-
-# ALL 14 treatments (to be generated for each new city)
-ALL_TREATMENTS = [
-    {"slug": "heart-surgery", "name": "Heart Surgery", "nameAr": "جراحة القلب", "priceMin": 10000, "priceMax": 15000},
-    {"slug": "knee-replacement", "name": "Knee Replacement", "nameAr": "استبدال الركبة", "priceMin": 6000, "priceMax": 8000},
-    {"slug": "neurology", "name": "Neurology & Brain Care", "nameAr": "جراحة الأعصاب والمخ", "priceMin": 6000, "priceMax": 18000},
-    {"slug": "ophthalmology", "name": "Eye Care & Ophthalmology", "nameAr": "طب وجراحة العيون", "priceMin": 1500, "priceMax": 8000},
-    {"slug": "gastroenterology", "name": "Gastroenterology & Digestive Care", "nameAr": "أمراض الجهاز الهضمي", "priceMin": 2000, "priceMax": 12000},
-    {"slug": "organ-transplant", "name": "Organ Transplant", "nameAr": "زراعة الأعضاء", "priceMin": 25000, "priceMax": 80000},
-    {"slug": "ent-hearing", "name": "ENT & Hearing Solutions", "nameAr": "الأنف والأذن والحنجرة والسمع", "priceMin": 2500, "priceMax": 15000},
-    {"slug": "ayurveda-wellness", "name": "Ayurveda & Wellness", "nameAr": "الأيورفيدا والعافية", "priceMin": 1000, "priceMax": 5000},
-    {"slug": "ivf", "name": "IVF & Fertility", "nameAr": "أطفال الأنابيب والخصوبة", "priceMin": 3500, "priceMax": 7000},
-    {"slug": "cosmetic-surgery", "name": "Cosmetic & Plastic Surgery", "nameAr": "جراحة التجميل", "priceMin": 2000, "priceMax": 10000},
-    {"slug": "dental-implants", "name": "Dental Care & Implants", "nameAr": "رعاية الأسنان والزراعة", "priceMin": 800, "priceMax": 3000},
-    {"slug": "hair-transplant", "name": "Hair Transplant", "nameAr": "زراعة الشعر", "priceMin": 1500, "priceMax": 4000},
-    {"slug": "bariatric-surgery", "name": "Bariatric & Weight Loss", "nameAr": "جراحة السمنة", "priceMin": 5000, "priceMax": 12000},
-    {"slug": "oncology-treatment", "name": "Oncology & Cancer Treatment", "nameAr": "علاج الأورام والسرطان", "priceMin": 8000, "priceMax": 30000},
-]
+SHARD_DIR = os.path.join(DATA_DIR, "content_shards")
 
 # Blog article templates (5 per treatment-city combo)
 ARTICLE_TEMPLATES = [
@@ -73,15 +29,16 @@ ARTICLE_TEMPLATES = [
     {"slug": "success-stories", "title": "{city} Patient Success Stories: {treatment} in India"},
     {"slug": "travel-guide", "title": "Travel Guide: {treatment} Medical Tourism from {city} to India"},
 ]
+TEMPLATES_BY_SLUG = {template["slug"]: template for template in ARTICLE_TEMPLATES}
 
 
 def generate_city_page(city: Dict, locale: str) -> Dict:
     """Generate a city landing page"""
     is_arabic = locale == "ar"
-    city_name = city["nameAr"] if is_arabic else city["name"]
-    country_name = city["countryAr"] if is_arabic else city["country"].replace("-", " ").title()
+    city_name = city["name_ar"] if is_arabic else city["name"]
+    country_name = city["country_short_ar"] if is_arabic else city["country"].replace("-", " ").title()
 
-    url = f"{BASE_URL}/{locale}/medical-tourism/{city['country']}/{city['slug']}"
+    url = city_url(city, locale)
 
     title = f"السياحة العلاجية من {city_name} إلى الهند - شفاء الهند" if is_arabic else \
             f"Medical Tourism from {city_name} to India - Shifa AlHind"
@@ -155,7 +112,7 @@ Get a free consultation and personalized treatment plan within 24 hours.
         "h1": h1,
         "full_content": content,
         "word_count": len(content.split()),
-        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "generated_at": utc_timestamp(),
         "needs_native_review": is_arabic,
         "needs_medical_review": False,
         "status": "generated"
@@ -165,16 +122,16 @@ Get a free consultation and personalized treatment plan within 24 hours.
 def generate_treatment_page(treatment: Dict, city: Dict, locale: str) -> Dict:
     """Generate a treatment landing page"""
     is_arabic = locale == "ar"
-    treatment_name = treatment["nameAr"] if is_arabic else treatment["name"]
-    city_name = city["nameAr"] if is_arabic else city["name"]
+    treatment_name = treatment["name_ar"] if is_arabic else treatment["name"]
+    city_name = city["name_ar"] if is_arabic else city["name"]
 
-    url = f"{BASE_URL}/{locale}/medical-tourism/{city['country']}/{city['slug']}/{treatment['slug']}"
+    url = treatment_url(treatment, city, locale)
 
     title = f"أفضل {treatment_name} في الهند لمرضى {city_name} - شفاء الهند" if is_arabic else \
             f"Best {treatment_name} in India for {city_name} Patients - Shifa AlHind"
 
-    meta_desc = f"احصل على {treatment_name} في الهند بتكلفة ${treatment['priceMin']:,}-${treatment['priceMax']:,}. مستشفيات معتمدة من JCI، دعم عربي 24/7 لمرضى {city_name}." if is_arabic else \
-                f"Get {treatment_name} in India for ${treatment['priceMin']:,}-${treatment['priceMax']:,}. JCI-accredited hospitals, 24/7 Arabic support for {city_name} patients."
+    meta_desc = f"احصل على {treatment_name} في الهند بتكلفة ${treatment['price_min']:,}-${treatment['price_max']:,}. مستشفيات معتمدة من JCI، دعم عربي 24/7 لمرضى {city_name}." if is_arabic else \
+                f"Get {treatment_name} in India for ${treatment['price_min']:,}-${treatment['price_max']:,}. JCI-accredited hospitals, 24/7 Arabic support for {city_name} patients."
 
     h1 = f"حزم {treatment_name} الموثوقة لسكان {city_name}" if is_arabic else \
          f"Trusted {treatment_name} Packages for {city_name} Residents"
@@ -189,8 +146,8 @@ Get world-class {treatment_name} in India at a fraction of the cost in {city_nam
 
 | Location | Average Cost | Savings |
 |----------|-------------|---------|
-| {city_name} | ${treatment['priceMax'] * 3:,} - ${treatment['priceMax'] * 4:,} | - |
-| India (Bangalore) | ${treatment['priceMin']:,} - ${treatment['priceMax']:,} | 60-70% |
+| {city_name} | ${treatment['price_max'] * 3:,} - ${treatment['price_max'] * 4:,} | - |
+| India (Bangalore) | ${treatment['price_min']:,} - ${treatment['price_max']:,} | 60-70% |
 
 ## What's Included
 
@@ -216,8 +173,8 @@ Ready to start? Contact Shifa AlHind today for a free consultation.
         "cost": {
             "@type": "MonetaryAmount",
             "currency": "USD",
-            "minValue": treatment["priceMin"],
-            "maxValue": treatment["priceMax"]
+            "minValue": treatment["price_min"],
+            "maxValue": treatment["price_max"]
         }
     }
 
@@ -229,10 +186,10 @@ Ready to start? Contact Shifa AlHind today for a free consultation.
         "title": title,
         "meta_desc": meta_desc,
         "h1": h1,
-        "json_ld": json.dumps(json_ld),
+        "json_ld": dumps(json_ld),
         "full_content": content,
         "word_count": len(content.split()),
-        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "generated_at": utc_timestamp(),
         "needs_native_review": is_arabic,
         "needs_medical_review": True,
         "status": "generated"
@@ -242,14 +199,14 @@ Ready to start? Contact Shifa AlHind today for a free consultation.
 def generate_blog_article(treatment: Dict, city: Dict, template: Dict, locale: str) -> Dict:
     """Generate a blog article"""
     is_arabic = locale == "ar"
-    treatment_name = treatment["nameAr"] if is_arabic else treatment["name"]
-    city_name = city["nameAr"] if is_arabic else city["name"]
+    treatment_name = treatment["name_ar"] if is_arabic else treatment["name"]
+    city_name = city["name_ar"] if is_arabic else city["name"]
 
     title = template["title"].format(treatment=treatment_name, city=city_name)
     if is_arabic:
         title = title.replace("Complete Guide to", "دليل كامل لـ").replace("in India for", "في الهند لمرضى")
 
-    url = f"{BASE_URL}/{locale}/blog/{city['country']}/{city['slug']}/{treatment['slug']}/{template['slug']}"
+    url = article_url(treatment, city, template["slug"], locale)
 
     h1 = f"{template['title']}".format(treatment=treatment_name, city=city_name)
     meta_desc = f"Comprehensive guide to {treatment_name} in India for {city_name} patients. Learn about costs, hospitals, and success stories."
@@ -263,7 +220,7 @@ Welcome to this comprehensive guide about {treatment_name} in India for patients
 ## Key Information
 
 - Treatment: {treatment_name}
-- Cost Range: ${treatment['priceMin']:,} - ${treatment['priceMax']:,}
+- Cost Range: ${treatment['price_min']:,} - ${treatment['price_max']:,}
 - Savings: 60-70% compared to {city_name}
 
 ## Why Choose India?
@@ -285,13 +242,53 @@ Contact Shifa AlHind today for a free consultation.
         "h1": h1,
         "full_content": content,
         "word_count": len(content.split()),
-        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "generated_at": utc_timestamp(),
         "needs_native_review": is_arabic,
         "needs_medical_review": False,
         "status": "generated"
     }
 
 
+def generate_new_cities(cities: ContentStore, treatments: ContentStore, articles: ContentStore, report: RunReport):
+    """Generate every page of the NEW_CITIES expansion set"""
+    # Generate content for each new city
+    total = len(NEW_CITIES) * 2 * (1 + len(ALL_TREATMENTS) * (1 + len(ARTICLE_TEMPLATES)))
+    with report.stage("generate_pages", total=total) as stage:
+        for city in NEW_CITIES:
+            print(f"\n🔄 Generating content for: {city['name']} ({city['population']})")
+
+            # Generate city landing pages (EN + AR)
+            for locale in ["en", "ar"]:
+                cities.upsert(generate_city_page(city, locale))
+            stage.advance(2)
+
+            # Generate treatment pages for all 14 treatments (EN + AR)
+            for treatment in ALL_TREATMENTS:
+                for locale in ["en", "ar"]:
+                    treatments.upsert(generate_treatment_page(treatment, city, locale))
+
+                    # Generate 5 blog articles for this treatment-city combo
+                    for template in ARTICLE_TEMPLATES:
+                        articles.upsert(generate_blog_article(treatment, city, template, locale))
+
+                    stage.advance(1 + len(ARTICLE_TEMPLATES))
+
+            print(f"  ✓ Generated 2 city pages")
+            print(f"  ✓ Generated {len(ALL_TREATMENTS) * 2} treatment pages")
+            print(f"  ✓ Generated {len(ALL_TREATMENTS) * len(ARTICLE_TEMPLATES) * 2} blog articles ({stage.progress()})")
+
+
+# Page builders for the cells of a coverage plan, by cell kind
+PLAN_GENERATORS = {
+    "city": lambda cell: generate_city_page(city_by_slug(cell["city"]), cell["locale"]),
+    "treatment": lambda cell: generate_treatment_page(
+        treatment_by_slug(cell["treatment"]), city_by_slug(cell["city"]), cell["locale"]),
+    "article": lambda cell: generate_blog_article(
+        treatment_by_slug(cell["treatment"]), city_by_slug(cell["city"]),
+        TEMPLATES_BY_SLUG[cell["template"]], cell["locale"]),
+}
+
+
 def main():
     """Main generation function"""
     print("=" * 80)
@@ -304,83 +301,47 @@ def main():
     treatments_file = os.path.join(DATA_DIR, "content_treatments_full.json")
     articles_file = os.path.join(DATA_DIR, "content_articles_full.json")
 
-    try:
-        with open(cities_file, "r") as f:
-            existing_cities = json.load(f)
-    except FileNotFoundError:
-        existing_cities = []
-
-    with open(treatments_file, "r") as f:
-        existing_treatments = json.load(f)
-
-    with open(articles_file, "r") as f:
-        existing_articles = json.load(f)
-
-    print(f"\n✓ Loaded {len(existing_cities)} existing city pages")
-    print(f"✓ Loaded {len(existing_treatments)} existing treatment pages")
-    print(f"✓ Loaded {len(existing_articles)} existing articles")
-
-    new_cities = []
-    new_treatments = []
-    new_articles = []
-
-    # Generate content for each new city
-    for city in NEW_CITIES:
-        print(f"\n🔄 Generating content for: {city['name']} ({city['population']})")
-
-        # Generate city landing pages (EN + AR)
-        for locale in ["en", "ar"]:
-            city_page = generate_city_page(city, locale)
-            new_cities.append(city_page)
-
-        # Generate treatment pages for all 14 treatments (EN + AR)
-        for treatment in ALL_TREATMENTS:
-            for locale in ["en", "ar"]:
-                treatment_page = generate_treatment_page(treatment, city, locale)
-                new_treatments.append(treatment_page)
+    cities = ContentStore(cities_file, SHARD_DIR)
+    treatments = ContentStore(treatments_file, SHARD_DIR)
+    articles = ContentStore(articles_file, SHARD_DIR)
 
-                # Generate 5 blog articles for this treatment-city combo
-                for template in ARTICLE_TEMPLATES:
-                    article = generate_blog_article(treatment, city, template, locale)
-                    new_articles.append(article)
+    print(f"\n✓ Loaded {len(cities)} existing city pages")
+    print(f"✓ Loaded {len(treatments)} existing treatment pages")
+    print(f"✓ Loaded {len(articles)} existing articles")
 
-        print(f"  ✓ Generated 2 city pages")
-        print(f"  ✓ Generated {len(ALL_TREATMENTS) * 2} treatment pages")
-        print(f"  ✓ Generated {len(ALL_TREATMENTS) * len(ARTICLE_TEMPLATES) * 2} blog articles")
+    report = RunReport("city_coverage")
 
-    # Combine with existing content
-    all_cities = existing_cities + new_cities
-    all_treatments = existing_treatments + new_treatments
-    all_articles = existing_articles + new_articles
+    if "--plan" in sys.argv:
+        plan_file = sys.argv[sys.argv.index("--plan") + 1]
+        generate_from_plan(plan_file, CITY_COVERAGE, PLAN_GENERATORS,
+                           {"city": cities, "treatment": treatments, "article": articles}, report)
+    else:
+        generate_new_cities(cities, treatments, articles, report)
 
     print(f"\n📊 GENERATION SUMMARY:")
-    print(f"  • New city pages: {len(new_cities)}")
-    print(f"  • New treatment pages: {len(new_treatments)}")
-    print(f"  • New blog articles: {len(new_articles)}")
-    print(f"  • Total new pages: {len(new_cities) + len(new_treatments) + len(new_articles)}")
-    print(f"\n  • Total city pages: {len(all_cities)}")
-    print(f"  • Total treatment pages: {len(all_treatments)}")
-    print(f"  • Total articles: {len(all_articles)}")
-    print(f"  • Grand Total: {len(all_cities) + len(all_treatments) + len(all_articles)} pages")
-
-    # Save updated content
+    stores = (("City pages", cities), ("Treatment pages", treatments), ("Blog articles", articles))
+    for label, store in stores:
+        counts = store.counts
+        print(f"  • {label}: {counts['added']} new, {counts['updated']} updated, "
+              f"{counts['unchanged']} unchanged ({len(store)} total)")
+    print(f"  • Grand Total: {sum(len(store) for _, store in stores)} pages")
+
+    # Save updated content (files with no changes are left untouched)
     print(f"\n💾 Saving updated content files...")
 
-    with open(cities_file, "w") as f:
-        json.dump(all_cities, f, ensure_ascii=False, indent=2)
-
-    with open(treatments_file, "w") as f:
-        json.dump(all_treatments, f, ensure_ascii=False, indent=2)
-
-    with open(articles_file, "w") as f:
-        json.dump(all_articles, f, ensure_ascii=False, indent=2)
-
-    print(f"  ✓ Saved {cities_file}")
-    print(f"  ✓ Saved {treatments_file}")
-    print(f"  ✓ Saved {articles_file}")
+    with report.stage("save_content", new_pages=False) as stage:
+        for _, store in stores:
+            changed = len(store.changed)
+            if store.save():
+                stage.advance(changed)
+                stage.add_output(store.filename)
+                print(f"  ✓ Saved {store.filename} ({changed} pages changed)")
+            else:
+                print(f"  ✓ Unchanged {store.filename}")
 
     print("\n✅ CITY EXPANSION COMPLETE!")
     print(f"   Now covering all 27 major GCC cities!")
+    report.write()
     print("=" * 80)
 
 
@@ -4,122 +4,22 @@ Automatic Content Generation System for Shifa AlHind
 Generates missing treatment pages and blog articles for all GCC cities
 """
 
-import json
 import os
-from datetime import datetime
+import sys
 from typing import List, Dict
 
+# Shared catalog lives with the generators in output/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "output"))
+from catalog import CITIES, NEW_TREATMENTS, city_by_slug, treatment_by_slug  # noqa: E402
+from content_store import ContentStore  # noqa: E402
+from coverage_plan import MISSING_CONTENT, article_url, generate_from_plan, treatment_url  # noqa: E402
+from json_io import dumps  # noqa: E402
+from reproducible import utc_timestamp  # noqa: E402
+from run_report import RunReport  # noqa: E402
+
 # Base configuration
-BASE_URL = "https://shifaalhind.com"
 DATA_DIR = "src/data"
-
-# All 27 GCC cities with metadata - Complete SEO Coverage
-CITIES = [
-    # United Arab Emirates (7 cities)
-    {"slug": "dubai", "name": "Dubai", "nameAr": "دبي", "country": "united-arab-emirates", "countryAr": "الإمارات", "population": "3.6M"},
-    {"slug": "abu-dhabi", "name": "Abu Dhabi", "nameAr": "أبو ظبي", "country": "united-arab-emirates", "countryAr": "الإمارات", "population": "1.5M"},
-    {"slug": "sharjah", "name": "Sharjah", "nameAr": "الشارقة", "country": "united-arab-emirates", "countryAr": "الإمارات", "population": "1.7M"},
-    {"slug": "ajman", "name": "Ajman", "nameAr": "عجمان", "country": "united-arab-emirates", "countryAr": "الإمارات", "population": "540K"},
-    {"slug": "ras-al-khaimah", "name": "Ras Al Khaimah", "nameAr": "رأس الخيمة", "country": "united-arab-emirates", "countryAr": "الإمارات", "population": "400K"},
-    {"slug": "fujairah", "name": "Fujairah", "nameAr": "الفجيرة", "country": "united-arab-emirates", "countryAr": "الإمارات", "population": "260K"},
-    {"slug": "al-ain", "name": "Al Ain", "nameAr": "العين", "country": "united-arab-emirates", "countryAr": "الإمارات", "population": "850K"},
-
-    # Saudi Arabia (8 cities)
-    {"slug": "riyadh", "name": "Riyadh", "nameAr": "الرياض", "country": "saudi-arabia", "countryAr": "السعودية", "population": "7.6M"},
-    {"slug": "jeddah", "name": "Jeddah", "nameAr": "جدة", "country": "saudi-arabia", "countryAr": "السعودية", "population": "4.7M"},
-    {"slug": "dammam", "name": "Dammam", "nameAr": "الدمام", "country": "saudi-arabia", "countryAr": "السعودية", "population": "1.5M"},
-    {"slug": "khobar", "name": "Khobar", "nameAr": "الخبر", "country": "saudi-arabia", "countryAr": "السعودية", "population": "730K"},
-    {"slug": "mecca", "name": "Mecca", "nameAr": "مكة", "country": "saudi-arabia", "countryAr": "السعودية", "population": "2.0M"},
-    {"slug": "medina", "name": "Medina", "nameAr": "المدينة", "country": "saudi-arabia", "countryAr": "السعودية", "population": "1.5M"},
-    {"slug": "taif", "name": "Taif", "nameAr": "الطائف", "country": "saudi-arabia", "countryAr": "السعودية", "population": "690K"},
-    {"slug": "tabuk", "name": "Tabuk", "nameAr": "تبوك", "country": "saudi-arabia", "countryAr": "السعودية", "population": "570K"},
-
-    # Qatar (3 cities)
-    {"slug": "doha", "name": "Doha", "nameAr": "الدوحة", "country": "qatar", "countryAr": "قطر", "population": "2.4M"},
-    {"slug": "al-wakrah", "name": "Al Wakrah", "nameAr": "الوكرة", "country": "qatar", "countryAr": "قطر", "population": "300K"},
-    {"slug": "al-khor", "name": "Al Khor", "nameAr": "الخور", "country": "qatar", "countryAr": "قطر", "population": "200K"},
-
-    # Oman (4 cities)
-    {"slug": "muscat", "name": "Muscat", "nameAr": "مسقط", "country": "oman", "countryAr": "عمان", "population": "1.7M"},
-    {"slug": "sohar", "name": "Sohar", "nameAr": "صحار", "country": "oman", "countryAr": "عمان", "population": "230K"},
-    {"slug": "salalah", "name": "Salalah", "nameAr": "صلالة", "country": "oman", "countryAr": "عمان", "population": "330K"},
-    {"slug": "nizwa", "name": "Nizwa", "nameAr": "نزوى", "country": "oman", "countryAr": "عمان", "population": "100K"},
-
-    # Kuwait (4 cities)
-    {"slug": "kuwait-city", "name": "Kuwait City", "nameAr": "مدينة الكويت", "country": "kuwait", "countryAr": "الكويت", "population": "4.3M"},
-    {"slug": "hawalli", "name": "Hawalli", "nameAr": "حولي", "country": "kuwait", "countryAr": "الكويت", "population": "165K"},
-    {"slug": "salmiya", "name": "Salmiya", "nameAr": "السالمية", "country": "kuwait", "countryAr": "الكويت", "population": "150K"},
-    {"slug": "farwaniya", "name": "Farwaniya", "nameAr": "الفروانية", "country": "kuwait", "countryAr": "الكويت", "population": "900K"},
-
-    # Bahrain (3 cities)
-    {"slug": "manama", "name": "Manama", "nameAr": "المنامة", "country": "bahrain", "countryAr": "البحرين", "population": "640K"},
-    {"slug": "muharraq", "name": "Muharraq", "nameAr": "المحرق", "country": "bahrain", "countryAr": "البحرين", "population": "230K"},
-    {"slug": "riffa", "name": "Riffa", "nameAr": "الرفاع", "country": "bahrain", "countryAr": "البحرين", "population": "120K"},
-]
-
-# New treatments to add
-NEW_TREATMENTS = [
-    {
-        "slug": "neurology",
-        "name": "Neurology & Brain Care",
-        "nameAr": "جراحة الأعصاب والمخ",
-        "category": "neurology",
-        "description": "Advanced neurology and brain care treatments including brain surgery, spine surgery, stroke treatment, and neurological disorder management",
-        "descriptionAr": "علاجات متقدمة للأعصاب والمخ تشمل جراحة الدماغ وجراحة العمود الفقري وعلاج السكتة الدماغية وإدارة الاضطرابات العصبية",
-        "priceMin": 6000,
-        "priceMax": 18000,
-    },
-    {
-        "slug": "ophthalmology",
-        "name": "Eye Care & Ophthalmology",
-        "nameAr": "طب وجراحة العيون",
-        "category": "ophthalmology",
-        "description": "Comprehensive eye care including LASIK, cataract surgery, retinal treatments, glaucoma management, and corneal transplants",
-        "descriptionAr": "رعاية شاملة للعيون تشمل الليزك وجراحة الساد وعلاجات الشبكية وإدارة الجلوكوما وزرع القرنية",
-        "priceMin": 1500,
-        "priceMax": 8000,
-    },
-    {
-        "slug": "gastroenterology",
-        "name": "Gastroenterology & Digestive Care",
-        "nameAr": "أمراض الجهاز الهضمي",
-        "category": "gastroenterology",
-        "description": "Advanced treatments for digestive disorders including endoscopy, colonoscopy, liver disease treatment, IBD management, and GI surgery",
-        "descriptionAr": "علاجات متقدمة لاضطرابات الجهاز الهضمي تشمل التنظير والتنظير القولوني وعلاج أمراض الكبد وإدارة IBD وجراحة الجهاز الهضمي",
-        "priceMin": 2000,
-        "priceMax": 12000,
-    },
-    {
-        "slug": "organ-transplant",
-        "name": "Organ Transplant",
-        "nameAr": "زراعة الأعضاء",
-        "category": "transplant",
-        "description": "Life-saving organ transplant surgeries including kidney, liver, heart, and lung transplants with comprehensive pre and post-operative care",
-        "descriptionAr": "جراحات زرع الأعضاء المنقذة للحياة بما في ذلك زرع الكلى والكبد والقلب والرئة مع رعاية شاملة قبل وبعد العملية",
-        "priceMin": 25000,
-        "priceMax": 80000,
-    },
-    {
-        "slug": "ent-hearing",
-        "name": "ENT & Hearing Solutions",
-        "nameAr": "الأنف والأذن والحنجرة والسمع",
-        "category": "ent",
-        "description": "Comprehensive ENT care including hearing loss treatment, cochlear implants, sinus surgery, throat disorders, and voice restoration",
-        "descriptionAr": "رعاية شاملة للأنف والأذن والحنجرة تشمل علاج فقدان السمع وزراعة القوقعة وجراحة الجيوب الأنفية واضطرابات الحلق واستعادة الصوت",
-        "priceMin": 2500,
-        "priceMax": 15000,
-    },
-    {
-        "slug": "ayurveda-wellness",
-        "name": "Ayurveda & Wellness",
-        "nameAr": "الأيورفيدا والعافية",
-        "category": "ayurveda",
-        "description": "Traditional Ayurvedic treatments and wellness programs including Panchakarma, rejuvenation therapies, chronic disease management, and holistic healing",
-        "descriptionAr": "علاجات أيورفيدا التقليدية وبرامج العافية بما في ذلك بانشاكارما وعلاجات التجديد وإدارة الأمراض المزمنة والشفاء الشامل",
-        "priceMin": 1000,
-        "priceMax": 5000,
-    },
-]
+SHARD_DIR = os.path.join(DATA_DIR, "content_shards")
 
 # Blog article templates
 ARTICLE_TEMPLATES = [
@@ -169,17 +69,18 @@ ARTICLE_TEMPLATES = [
         "metaDescAr": "كل ما يحتاج مرضى {cityAr} معرفته عن السفر إلى الهند لـ {treatmentAr}. التأشيرة والرحلات والإقامة والترتيبات الطبية.",
     },
 ]
+TEMPLATES_BY_SLUG = {template["slug"]: template for template in ARTICLE_TEMPLATES}
 
 
 def generate_treatment_page(treatment: Dict, city: Dict, locale: str) -> Dict:
     """Generate a treatment landing page"""
     is_arabic = locale == "ar"
 
-    treatment_name = treatment["nameAr"] if is_arabic else treatment["name"]
-    city_name = city["nameAr"] if is_arabic else city["name"]
-    country = city["countryAr"] if is_arabic else city["country"]
+    treatment_name = treatment["name_ar"] if is_arabic else treatment["name"]
+    city_name = city["name_ar"] if is_arabic else city["name"]
+    country = city["country_short_ar"] if is_arabic else city["country"]
 
-    url = f"{BASE_URL}/{locale}/medical-tourism/{city['country']}/{city['slug']}/{treatment['slug']}"
+    url = treatment_url(treatment, city, locale)
 
     title = f"أفضل {treatment_name} في الهند لمرضى {city_name} - شفاء الهند" if is_arabic else \
             f"Best {treatment_name} in India for {city_name} Patients - Shifa AlHind"
@@ -218,8 +119,8 @@ We partner with India's premier hospitals that specialize in {treatment_name}:
 
 | Location | Average Cost | Savings |
 |----------|-------------|---------|
-| {city_name} | ${treatment['priceMax'] * 3:,} - ${treatment['priceMax'] * 4:,} | - |
-| India (Bangalore) | ${treatment['priceMin']:,} - ${treatment['priceMax']:,} | 60-70% |
+| {city_name} | ${treatment['price_max'] * 3:,} - ${treatment['price_max'] * 4:,} | - |
+| India (Bangalore) | ${treatment['price_min']:,} - ${treatment['price_max']:,} | 60-70% |
 
 ## What's Included in Our {treatment_name} Package?
 
@@ -291,7 +192,7 @@ Get a free consultation and personalized treatment plan within 24 hours.
         "@context": "https://schema.org",
         "@type": "MedicalProcedure",
         "name": treatment_name,
-        "description": treatment["descriptionAr"] if is_arabic else treatment["description"],
+        "description": treatment["description_ar"] if is_arabic else treatment["description"],
         "procedureType": treatment_name,
         "preparation": "Free consultation and medical evaluation with expert doctors",
         "followup": "Video consultations for 3 months post-treatment",
@@ -299,8 +200,8 @@ Get a free consultation and personalized treatment plan within 24 hours.
         "cost": {
             "@type": "MonetaryAmount",
             "currency": "USD",
-            "minPrice": treatment["priceMin"],
-            "maxPrice": treatment["priceMax"]
+            "minPrice": treatment["price_min"],
+            "maxPrice": treatment["price_max"]
         },
         "availableLocation": {
             "@type": "MedicalBusiness",
@@ -322,10 +223,10 @@ Get a free consultation and personalized treatment plan within 24 hours.
         "title": title,
         "meta_desc": meta_desc,
         "h1": h1,
-        "json_ld": json.dumps(json_ld),
+        "json_ld": dumps(json_ld),
         "full_content": content,
         "word_count": len(content.split()),
-        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "generated_at": utc_timestamp(),
         "needs_native_review": is_arabic,
         "needs_medical_review": True,
         "status": "generated"
@@ -336,32 +237,32 @@ def generate_blog_article(treatment: Dict, city: Dict, template: Dict, locale: s
     """Generate a blog article"""
     is_arabic = locale == "ar"
 
-    treatment_name = treatment["nameAr"] if is_arabic else treatment["name"]
-    city_name = city["nameAr"] if is_arabic else city["name"]
+    treatment_name = treatment["name_ar"] if is_arabic else treatment["name"]
+    city_name = city["name_ar"] if is_arabic else city["name"]
 
     # Replace placeholders in template
     title = (template["titleAr"] if is_arabic else template["title"]).format(
         treatment=treatment_name,
-        treatmentAr=treatment["nameAr"],
+        treatmentAr=treatment["name_ar"],
         city=city_name,
-        cityAr=city["nameAr"]
+        cityAr=city["name_ar"]
     )
 
     h1 = (template["h1Ar"] if is_arabic else template["h1"]).format(
         treatment=treatment_name,
-        treatmentAr=treatment["nameAr"],
+        treatmentAr=treatment["name_ar"],
         city=city_name,
-        cityAr=city["nameAr"]
+        cityAr=city["name_ar"]
     )
 
     meta_desc = (template["metaDescAr"] if is_arabic else template["metaDesc"]).format(
         treatment=treatment_name,
-        treatmentAr=treatment["nameAr"],
+        treatmentAr=treatment["name_ar"],
         city=city_name,
-        cityAr=city["nameAr"]
+        cityAr=city["name_ar"]
     )
 
-    url = f"{BASE_URL}/{locale}/blog/{city['country']}/{city['slug']}/{treatment['slug']}/{template['slug']}"
+    url = article_url(treatment, city, template["slug"], locale)
 
     # Generate article content based on template type
     content = f"""# {h1}
@@ -399,13 +300,46 @@ Contact us for a free consultation and personalized treatment plan.
         "h1": h1,
         "full_content": content,
         "word_count": len(content.split()),
-        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "generated_at": utc_timestamp(),
         "needs_native_review": is_arabic,
         "needs_medical_review": False,
         "status": "generated"
     }
 
 
+def generate_new_treatments(treatments: ContentStore, articles: ContentStore, report: RunReport):
+    """Generate every page of the NEW_TREATMENTS set for all cities"""
+    # Generate treatment pages and articles for each new treatment
+    total = len(NEW_TREATMENTS) * len(CITIES) * 2 * (1 + len(ARTICLE_TEMPLATES))
+    with report.stage("generate_pages", total=total) as stage:
+        for treatment in NEW_TREATMENTS:
+            print(f"\n🔄 Generating content for: {treatment['name']}")
+
+            for city in CITIES:
+                for locale in ["en", "ar"]:
+                    # Generate treatment landing page
+                    treatments.upsert(generate_treatment_page(treatment, city, locale))
+
+                    # Generate 5 blog articles for this city-treatment combo
+                    for template in ARTICLE_TEMPLATES:
+                        articles.upsert(generate_blog_article(treatment, city, template, locale))
+
+                    stage.advance(1 + len(ARTICLE_TEMPLATES))
+
+            print(f"  ✓ Generated {len(CITIES) * 2} treatment pages")
+            print(f"  ✓ Generated {len(CITIES) * len(ARTICLE_TEMPLATES) * 2} blog articles ({stage.progress()})")
+
+
+# Page builders for the cells of a coverage plan, by cell kind
+PLAN_GENERATORS = {
+    "treatment": lambda cell: generate_treatment_page(
+        treatment_by_slug(cell["treatment"]), city_by_slug(cell["city"]), cell["locale"]),
+    "article": lambda cell: generate_blog_article(
+        treatment_by_slug(cell["treatment"]), city_by_slug(cell["city"]),
+        TEMPLATES_BY_SLUG[cell["template"]], cell["locale"]),
+}
+
+
 def main():
     """Main content generation function"""
     print("=" * 80)
@@ -416,59 +350,42 @@ def main():
     treatments_file = os.path.join(DATA_DIR, "content_treatments_full.json")
     articles_file = os.path.join(DATA_DIR, "content_articles_full.json")
 
-    with open(treatments_file, "r") as f:
-        existing_treatments = json.load(f)
+    treatments = ContentStore(treatments_file, SHARD_DIR)
+    articles = ContentStore(articles_file, SHARD_DIR)
 
-    with open(articles_file, "r") as f:
-        existing_articles = json.load(f)
+    print(f"\n✓ Loaded {len(treatments)} existing treatment pages")
+    print(f"✓ Loaded {len(articles)} existing articles")
 
-    print(f"\n✓ Loaded {len(existing_treatments)} existing treatment pages")
-    print(f"✓ Loaded {len(existing_articles)} existing articles")
+    report = RunReport("missing_content")
 
-    new_treatments = []
-    new_articles = []
-
-    # Generate treatment pages and articles for each new treatment
-    for treatment in NEW_TREATMENTS:
-        print(f"\n🔄 Generating content for: {treatment['name']}")
-
-        for city in CITIES:
-            for locale in ["en", "ar"]:
-                # Generate treatment landing page
-                treatment_page = generate_treatment_page(treatment, city, locale)
-                new_treatments.append(treatment_page)
-
-                # Generate 5 blog articles for this city-treatment combo
-                for template in ARTICLE_TEMPLATES:
-                    article = generate_blog_article(treatment, city, template, locale)
-                    new_articles.append(article)
-
-        print(f"  ✓ Generated {len(CITIES) * 2} treatment pages")
-        print(f"  ✓ Generated {len(CITIES) * len(ARTICLE_TEMPLATES) * 2} blog articles")
-
-    # Combine with existing content
-    all_treatments = existing_treatments + new_treatments
-    all_articles = existing_articles + new_articles
+    if "--plan" in sys.argv:
+        plan_file = sys.argv[sys.argv.index("--plan") + 1]
+        generate_from_plan(plan_file, MISSING_CONTENT, PLAN_GENERATORS,
+                           {"treatment": treatments, "article": articles}, report)
+    else:
+        generate_new_treatments(treatments, articles, report)
 
     print(f"\n📊 GENERATION SUMMARY:")
-    print(f"  • New treatment pages: {len(new_treatments)}")
-    print(f"  • New blog articles: {len(new_articles)}")
-    print(f"  • Total treatment pages: {len(all_treatments)}")
-    print(f"  • Total articles: {len(all_articles)}")
+    for label, store in (("Treatment pages", treatments), ("Blog articles", articles)):
+        counts = store.counts
+        print(f"  • {label}: {counts['added']} new, {counts['updated']} updated, "
+              f"{counts['unchanged']} unchanged ({len(store)} total)")
 
-    # Save updated content
+    # Save updated content (files with no changes are left untouched)
     print(f"\n💾 Saving updated content files...")
 
-    with open(treatments_file, "w") as f:
-        json.dump(all_treatments, f, ensure_ascii=False, indent=2)
-
-    with open(articles_file, "w") as f:
-        json.dump(all_articles, f, ensure_ascii=False, indent=2)
-
-    print(f"  ✓ Saved {treatments_file}")
-    print(f"  ✓ Saved {articles_file}")
+    with report.stage("save_content", new_pages=False) as stage:
+        for store in (treatments, articles):
+            changed = len(store.changed)
+            if store.save():
+                stage.advance(changed)
+                stage.add_output(store.filename)
+                print(f"  ✓ Saved {store.filename} ({changed} pages changed)")
+            else:
+                print(f"  ✓ Unchanged {store.filename}")
 
     print("\n✅ CONTENT GENERATION COMPLETE!")
+    report.write()
     print("=" * 80)
 
 
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Coverage Gap Planner for Shifa AlHind
+Diffs every city × treatment × article template × locale page against the
+content already in src/data and writes the missing cells as a work list
+for expand-city-coverage.py and generate-missing-content.py
+"""
+
+import os
+import sys
+
+# Shared catalog lives with the generators in output/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "output"))
+from catalog import ALL_TREATMENTS, CITIES, LOCALES  # noqa: E402
+from coverage_plan import ARTICLE_SLUGS, content_urls, desired_matrix, plan_coverage  # noqa: E402
+from json_io import dump  # noqa: E402
+from run_report import RunReport  # noqa: E402
+
+DATA_DIR = "src/data"
+CONTENT_FILES = [
+    os.path.join(DATA_DIR, "content_cities_full.json"),
+    os.path.join(DATA_DIR, "content_treatments_full.json"),
+    os.path.join(DATA_DIR, "content_articles_full.json"),
+]
+PLAN_FILE = "coverage_plan.json"
+
+
+def print_coverage(title: str, rows: dict, limit: int = None):
+    print(f"\n📊 Coverage by {title}:")
+    ordered = sorted(rows.items(), key=lambda item: (item[1]["coverage"], item[0]))
+    for key, row in ordered[:limit]:
+        print(f"  • {key:<28} {row['existing']:>5}/{row['desired']:<5} {row['coverage']:>7.1%}  ({row['missing']} missing)")
+    if limit and len(ordered) > limit:
+        print(f"  … {len(ordered) - limit} more in the plan file")
+
+
+def main():
+    print("=" * 80)
+    print("SHIFA ALHIND - COVERAGE GAP PLANNER")
+    print("=" * 80)
+
+    args = sys.argv[1:]
+    filename = PLAN_FILE
+    if "--out" in args:
+        position = args.index("--out")
+        filename = args[position + 1]
+        del args[position:position + 2]
+    sources = args or CONTENT_FILES
+
+    report = RunReport("coverage_plan")
+    with report.stage("plan_coverage") as stage:
+        desired = desired_matrix(CITIES, ALL_TREATMENTS, ARTICLE_SLUGS, LOCALES)
+        existing = content_urls(sources)
+        plan = plan_coverage(desired, existing)
+        stage.advance(len(desired))
+
+        dump(plan, filename, pretty=True)
+        stage.add_output(filename)
+
+    summary = plan["summary"]
+    print(f"\n✓ Desired matrix: {len(CITIES)} cities × {len(ALL_TREATMENTS)} treatments × "
+          f"{len(ARTICLE_SLUGS)} templates × {len(LOCALES)} locales = {summary['desired']} pages")
+    print(f"✓ Existing: {summary['existing']} ({summary['coverage']:.1%}), "
+          f"missing: {summary['missing']}, outside the matrix: {summary['stale']}")
+
+    print_coverage("page kind", plan["coverage"]["kind"])
+    print_coverage("country", plan["coverage"]["country"])
+    print_coverage("treatment", plan["coverage"]["treatment"])
+    print_coverage("city (least covered)", plan["coverage"]["city"], limit=10)
+
+    print(f"\n📝 Work list:")
+    for generator, count in summary["work"].items():
+        if count:
+            print(f"  • python3 scripts/{generator}.py --plan {filename}   ({count} pages)")
+    if not summary["missing"]:
+        print("  ✓ Nothing to generate, coverage is complete")
+
+    print(f"\n💾 Saved: {filename}")
+    report.write()
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 import { Metadata } from 'next';
 import { notFound } from 'next/navigation';
 import Link from 'next/link';
-import { getArticle, getRelatedArticles } from '@/lib/content-service';
+import { getArticle, getRelatedArticles, getJsonLd, getContentHtml } from '@/lib/content-service';
 import ReactMarkdown from 'react-markdown';
 
 interface PageProps {
@@ -67,7 +67,9 @@ export default async function ArticlePage({ params }: PageProps) {
   const relatedArticles = getRelatedArticles(article.url, 3);
 
   // Parse JSON-LD if available
-  const jsonLd = article.json_ld ? JSON.parse(article.json_ld) : null;
+  const jsonLd = getJsonLd(article);
+  // Pre-rendered at generation time when the page is sharded; parsed here otherwise
+  const contentHtml = getContentHtml(article);
 
   // Format treatment and city names from slugs for display
   const treatmentName = treatment
@@ -167,60 +169,64 @@ export default async function ArticlePage({ params }: PageProps) {
 
         {/* Article Content */}
         <div className="prose prose-lg max-w-none">
-          <ReactMarkdown
-            components={{
-              h1: ({ children }) => (
-                <h1 className="text-3xl font-bold mt-8 mb-4 text-gray-900">{children}</h1>
-              ),
-              h2: ({ children }) => (
-                <h2 className="text-2xl font-bold mt-6 mb-3 text-gray-900">{children}</h2>
-              ),
-              h3: ({ children }) => (
-                <h3 className="text-xl font-semibold mt-4 mb-2 text-gray-900">{children}</h3>
-              ),
-              p: ({ children }) => <p className="mb-4 text-gray-700 leading-relaxed">{children}</p>,
-              ul: ({ children }) => (
-                <ul className="list-disc list-inside mb-4 space-y-2">{children}</ul>
-              ),
-              ol: ({ children }) => (
-                <ol className="list-decimal list-inside mb-4 space-y-2">{children}</ol>
-              ),
-              table: ({ children }) => (
-                <div className="overflow-x-auto my-6">
-                  <table className="min-w-full divide-y divide-gray-200">{children}</table>
-                </div>
-              ),
-              thead: ({ children }) => <thead className="bg-gray-50">{children}</thead>,
-              tbody: ({ children }) => (
-                <tbody className="bg-white divide-y divide-gray-200">{children}</tbody>
-              ),
-              th: ({ children }) => (
-                <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">
-                  {children}
-                </th>
-              ),
-              td: ({ children }) => (
-                <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-900">{children}</td>
-              ),
-              blockquote: ({ children }) => (
-                <blockquote className="border-l-4 border-primary-500 pl-4 italic my-4 text-gray-600">
-                  {children}
-                </blockquote>
-              ),
-              a: ({ href, children }) => (
-                <a
-                  href={href}
-                  className="text-primary-600 hover:text-primary-700 underline"
-                  target={href?.startsWith('http') ? '_blank' : undefined}
-                  rel={href?.startsWith('http') ? 'noopener noreferrer' : undefined}
-                >
-                  {children}
-                </a>
-              ),
-            }}
-          >
-            {article.full_content}
-          </ReactMarkdown>
+          {contentHtml ? (
+            <div dangerouslySetInnerHTML={{ __html: contentHtml }} />
+          ) : (
+            <ReactMarkdown
+              components={{
+                h1: ({ children }) => (
+                  <h1 className="text-3xl font-bold mt-8 mb-4 text-gray-900">{children}</h1>
+                ),
+                h2: ({ children }) => (
+                  <h2 className="text-2xl font-bold mt-6 mb-3 text-gray-900">{children}</h2>
+                ),
+                h3: ({ children }) => (
+                  <h3 className="text-xl font-semibold mt-4 mb-2 text-gray-900">{children}</h3>
+                ),
+                p: ({ children }) => <p className="mb-4 text-gray-700 leading-relaxed">{children}</p>,
+                ul: ({ children }) => (
+                  <ul className="list-disc list-inside mb-4 space-y-2">{children}</ul>
+                ),
+                ol: ({ children }) => (
+                  <ol className="list-decimal list-inside mb-4 space-y-2">{children}</ol>
+                ),
+                table: ({ children }) => (
+                  <div className="overflow-x-auto my-6">
+                    <table className="min-w-full divide-y divide-gray-200">{children}</table>
+                  </div>
+                ),
+                thead: ({ children }) => <thead className="bg-gray-50">{children}</thead>,
+                tbody: ({ children }) => (
+                  <tbody className="bg-white divide-y divide-gray-200">{children}</tbody>
+                ),
+                th: ({ children }) => (
+                  <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">
+                    {children}
+                  </th>
+                ),
+                td: ({ children }) => (
+                  <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-900">{children}</td>
+                ),
+                blockquote: ({ children }) => (
+                  <blockquote className="border-l-4 border-primary-500 pl-4 italic my-4 text-gray-600">
+                    {children}
+                  </blockquote>
+                ),
+                a: ({ href, children }) => (
+                  <a
+                    href={href}
+                    className="text-primary-600 hover:text-primary-700 underline"
+                    target={href?.startsWith('http') ? '_blank' : undefined}
+                    rel={href?.startsWith('http') ? 'noopener noreferrer' : undefined}
+                  >
+                    {children}
+                  </a>
+                ),
+              }}
+            >
+              {article.full_content}
+            </ReactMarkdown>
+          )}
         </div>
 
         {/* CTA Section */}
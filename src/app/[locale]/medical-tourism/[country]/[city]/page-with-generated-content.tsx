@@ -10,7 +10,7 @@
 
 import { Metadata } from 'next';
 import { notFound } from 'next/navigation';
-import { getCity, getAllCities, getTreatmentsByCity } from '@/lib/content-service';
+import { getCity, getAllCities, getTreatmentsByCity, getJsonLd, getContentHtml } from '@/lib/content-service';
 import ReactMarkdown from 'react-markdown';
 import Link from 'next/link';
 
@@ -80,7 +80,9 @@ export default async function CityPageWithContent({ params }: PageProps) {
   const treatments = getTreatmentsByCity(city, locale).slice(0, 8);
 
   // Parse JSON-LD if available
-  const jsonLd = cityPage.json_ld ? JSON.parse(cityPage.json_ld) : null;
+  const jsonLd = getJsonLd(cityPage);
+  // Pre-rendered at generation time when the page is sharded; parsed here otherwise
+  const contentHtml = getContentHtml(cityPage);
 
   return (
     <>
@@ -125,64 +127,68 @@ export default async function CityPageWithContent({ params }: PageProps) {
 
           {/* Generated Content */}
           <div className="prose prose-lg max-w-none mb-12">
-            <ReactMarkdown
-              components={{
-                h1: ({ children }) => (
-                  <h1 className="text-3xl font-bold mt-8 mb-4 text-gray-900">{children}</h1>
-                ),
-                h2: ({ children }) => (
-                  <h2 className="text-2xl font-bold mt-6 mb-3 text-gray-900">{children}</h2>
-                ),
-                h3: ({ children }) => (
-                  <h3 className="text-xl font-semibold mt-4 mb-2 text-gray-900">{children}</h3>
-                ),
-                p: ({ children }) => (
-                  <p className="mb-4 text-gray-700 leading-relaxed">{children}</p>
-                ),
-                ul: ({ children }) => (
-                  <ul className="list-disc list-inside mb-4 space-y-2 text-gray-700">{children}</ul>
-                ),
-                ol: ({ children }) => (
-                  <ol className="list-decimal list-inside mb-4 space-y-2 text-gray-700">
-                    {children}
-                  </ol>
-                ),
-                table: ({ children }) => (
-                  <div className="overflow-x-auto my-6">
-                    <table className="min-w-full divide-y divide-gray-200 border">{children}</table>
-                  </div>
-                ),
-                thead: ({ children }) => (
-                  <thead className="bg-primary-600 text-white">{children}</thead>
-                ),
-                tbody: ({ children }) => (
-                  <tbody className="bg-white divide-y divide-gray-200">{children}</tbody>
-                ),
-                th: ({ children }) => (
-                  <th className="px-6 py-3 text-left text-sm font-semibold">{children}</th>
-                ),
-                td: ({ children }) => (
-                  <td className="px-6 py-4 text-sm text-gray-900">{children}</td>
-                ),
-                blockquote: ({ children }) => (
-                  <blockquote className="border-l-4 border-primary-500 pl-4 italic my-4 text-gray-600 bg-gray-50 py-2">
-                    {children}
-                  </blockquote>
-                ),
-                a: ({ href, children }) => (
-                  <a
-                    href={href}
-                    className="text-primary-600 hover:text-primary-700 underline"
-                    target={href?.startsWith('http') ? '_blank' : undefined}
-                    rel={href?.startsWith('http') ? 'noopener noreferrer' : undefined}
-                  >
-                    {children}
-                  </a>
-                ),
-              }}
-            >
-              {cityPage.full_content}
-            </ReactMarkdown>
+            {contentHtml ? (
+              <div dangerouslySetInnerHTML={{ __html: contentHtml }} />
+            ) : (
+              <ReactMarkdown
+                components={{
+                  h1: ({ children }) => (
+                    <h1 className="text-3xl font-bold mt-8 mb-4 text-gray-900">{children}</h1>
+                  ),
+                  h2: ({ children }) => (
+                    <h2 className="text-2xl font-bold mt-6 mb-3 text-gray-900">{children}</h2>
+                  ),
+                  h3: ({ children }) => (
+                    <h3 className="text-xl font-semibold mt-4 mb-2 text-gray-900">{children}</h3>
+                  ),
+                  p: ({ children }) => (
+                    <p className="mb-4 text-gray-700 leading-relaxed">{children}</p>
+                  ),
+                  ul: ({ children }) => (
+                    <ul className="list-disc list-inside mb-4 space-y-2 text-gray-700">{children}</ul>
+                  ),
+                  ol: ({ children }) => (
+                    <ol className="list-decimal list-inside mb-4 space-y-2 text-gray-700">
+                      {children}
+                    </ol>
+                  ),
+                  table: ({ children }) => (
+                    <div className="overflow-x-auto my-6">
+                      <table className="min-w-full divide-y divide-gray-200 border">{children}</table>
+                    </div>
+                  ),
+                  thead: ({ children }) => (
+                    <thead className="bg-primary-600 text-white">{children}</thead>
+                  ),
+                  tbody: ({ children }) => (
+                    <tbody className="bg-white divide-y divide-gray-200">{children}</tbody>
+                  ),
+                  th: ({ children }) => (
+                    <th className="px-6 py-3 text-left text-sm font-semibold">{children}</th>
+                  ),
+                  td: ({ children }) => (
+                    <td className="px-6 py-4 text-sm text-gray-900">{children}</td>
+                  ),
+                  blockquote: ({ children }) => (
+                    <blockquote className="border-l-4 border-primary-500 pl-4 italic my-4 text-gray-600 bg-gray-50 py-2">
+                      {children}
+                    </blockquote>
+                  ),
+                  a: ({ href, children }) => (
+                    <a
+                      href={href}
+                      className="text-primary-600 hover:text-primary-700 underline"
+                      target={href?.startsWith('http') ? '_blank' : undefined}
+                      rel={href?.startsWith('http') ? 'noopener noreferrer' : undefined}
+                    >
+                      {children}
+                    </a>
+                  ),
+                }}
+              >
+                {cityPage.full_content}
+              </ReactMarkdown>
+            )}
           </div>
 
           {/* Available Treatments */}
@@ -3,7 +3,7 @@
  * Provides access to generated medical tourism content
  */
 
-import { readFileSync } from 'fs';
+import { existsSync, readFileSync } from 'fs';
 import { join } from 'path';
 
 // Lazy load JSON data to avoid bundling large files
@@ -35,6 +35,59 @@ function loadCities(): ContentPage[] {
   return citiesData!;
 }
 
+// Per-URL shards written by output/shard-content.py (optional)
+const SHARD_DIR = join(process.cwd(), 'src/data/content_shards');
+
+interface ShardIndexEntry {
+  path: string;
+  title: string;
+  locale: string;
+  page_type: string;
+  word_count?: number;
+  // Pre-rendered siblings of the shard, e.g. ['.html']
+  variants?: string[];
+}
+
+let shardIndex: Record<string, ShardIndexEntry> | null | undefined;
+
+function loadShardIndex(): Record<string, ShardIndexEntry> | null {
+  if (shardIndex === undefined) {
+    const indexPath = join(SHARD_DIR, 'index.json');
+    shardIndex = existsSync(indexPath) ? JSON.parse(readFileSync(indexPath, 'utf-8')).pages : null;
+  }
+  return shardIndex!;
+}
+
+/**
+ * Read a single page from its shard, or null when it isn't sharded or the
+ * shard file is missing (the caller then falls back to the monolithic file)
+ */
+function readShard(url: string): ContentPage | null {
+  const entry = loadShardIndex()?.[url];
+  if (!entry) return null;
+  try {
+    return JSON.parse(readFileSync(join(SHARD_DIR, entry.path), 'utf-8'));
+  } catch (error) {
+    if ((error as NodeJS.ErrnoException).code === 'ENOENT') return null;
+    throw error;
+  }
+}
+
+/**
+ * Sanitized HTML pre-rendered from a page's Markdown body at generation
+ * time (output/markdown_html.py), or null when the shard has none
+ */
+export function getContentHtml(page: ContentPage): string | null {
+  const entry = loadShardIndex()?.[page.url];
+  if (!entry?.variants?.includes('.html')) return null;
+  try {
+    return readFileSync(join(SHARD_DIR, entry.path.replace(/\.json$/, '.html')), 'utf-8');
+  } catch {
+    // A missing or unreadable fragment falls back to rendering the Markdown
+    return null;
+  }
+}
+
 export interface ContentPage {
   url: string;
   locale: string;
@@ -43,7 +96,8 @@ export interface ContentPage {
   title: string;
   meta_desc: string;
   h1: string;
-  json_ld?: string;
+  // Escaped JSON string, or an object when generated with SHIFA_JSON_LD_NESTED=1
+  json_ld?: string | Record<string, unknown>;
   full_content?: string;
   word_count?: number;
   generated_at?: string;
@@ -70,7 +124,7 @@ export function getArticle(params: {
   slug: string;
 }): ContentPage | null {
   const url = `https://shifaalhind.com/${params.locale}/blog/${params.country}/${params.city}/${params.treatment}/${params.slug}`;
-  return loadArticles().find((a) => a.url === url) || null;
+  return readShard(url) || loadArticles().find((a) => a.url === url) || null;
 }
 
 /**
@@ -107,7 +161,7 @@ export function getTreatment(params: {
   treatment: string;
 }): ContentPage | null {
   const url = `https://shifaalhind.com/${params.locale}/medical-tourism/${params.country}/${params.city}/${params.treatment}`;
-  return loadTreatments().find((t) => t.url === url) || null;
+  return readShard(url) || loadTreatments().find((t) => t.url === url) || null;
 }
 
 /**
@@ -133,7 +187,7 @@ export function getCity(params: {
   city: string;
 }): ContentPage | null {
   const url = `https://shifaalhind.com/${params.locale}/medical-tourism/${params.country}/${params.city}`;
-  return loadCities().find((c) => c.url === url) || null;
+  return readShard(url) || loadCities().find((c) => c.url === url) || null;
 }
 
 /**
@@ -165,6 +219,14 @@ export function getRelatedArticles(currentUrl: string, limit: number = 3): Conte
   return related.slice(0, limit);
 }
 
+/**
+ * JSON-LD for a page, whether it was stored nested or as an escaped string
+ */
+export function getJsonLd(page: ContentPage): Record<string, unknown> | null {
+  if (!page.json_ld) return null;
+  return typeof page.json_ld === 'string' ? JSON.parse(page.json_ld) : page.json_ld;
+}
+
 /**
  * Parse markdown-like content to HTML
  */